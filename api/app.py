@@ -4,6 +4,7 @@ from dependency_injector.wiring import Provide, inject
 
 from api.router import health
 from container.app_container import AppContainer
+from store.image_cache import DecodedImageCache
 
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 from fastapi import Depends, FastAPI
@@ -14,6 +15,7 @@ from api.router import api
 @inject
 def create_app(
     storage_config: dict = Provide[AppContainer.storage_config],
+    image_cache: DecodedImageCache = Provide[AppContainer.image_cache],
 ) -> FastAPI:
     """Create and configure FastAPI application"""
 
@@ -38,6 +40,9 @@ def create_app(
 
     initializeStorage(storage_config)
 
+    # Unlink the shared memory segments of this worker when it stops
+    app.add_event_handler("shutdown", image_cache.close)
+
     return app
 
 
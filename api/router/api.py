@@ -1,23 +1,32 @@
 import os
+import asyncio
+import time
 import cv2
 import numpy as np
 from fastapi import APIRouter, UploadFile, File, Form, BackgroundTasks, Depends
 from fastapi.responses import JSONResponse, FileResponse
+from fastapi.concurrency import run_in_threadpool
 import uuid
 import shutil
+from typing import Optional
 from datetime import datetime
 from dependency_injector.wiring import inject, Provide
 from controller.api_pipeline_controller import APIPipelineController
-from data_model.request import ProcessResponse, TranslationRequest, TextBlockData
+from data_model.request import (
+    ProcessResponse,
+    TranslationRequest,
+    TextBlockData,
+    BatchResponse,
+)
 from container.app_container import AppContainer
+from store.base import JobStore
+from store.image_cache import DecodedImageCache
+from modules.utils.archives import is_archive_file
 
 
 router = APIRouter(prefix="/api/v1", tags=["translation"])
 
 
-image_store = {}
-
-
 @router.get("/")
 async def root():
     return {"message": "Comic Translate API is running"}
@@ -30,6 +39,7 @@ async def upload_image(
     source_language: str = Form(default="English"),
     target_language: str = Form(default="Vietnamese"),
     storage_config: dict = Depends(Provide[AppContainer.storage_config]),
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
 ):
     # Generate unique ID for this image
     image_id = str(uuid.uuid4())
@@ -41,12 +51,13 @@ async def upload_image(
         shutil.copyfileobj(file.file, f)
 
     # Store image info
-    image_store[image_id] = {
-        "path": file_path,
-        "source_language": source_language,
-        "target_language": target_language,
-        "status": "uploaded",
-    }
+    job_store.create(
+        image_id,
+        status="uploaded",
+        path=file_path,
+        source_language=source_language,
+        target_language=target_language,
+    )
 
     return ProcessResponse(image_id=image_id, blocks=[], status="uploaded")
 
@@ -56,16 +67,17 @@ async def upload_image(
 async def detect_blocks(
     image_id: str,
     pipeline: APIPipelineController = Depends(Provide[AppContainer.api_pipeline]),
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+    image_cache: DecodedImageCache = Depends(Provide[AppContainer.image_cache]),
 ):
-    if image_id not in image_store:
+    job = job_store.get(image_id)
+    if job is None:
         return JSONResponse(status_code=404, content={"error": "Image not found"})
 
     # Load image
-    image_path = image_store[image_id]["path"]
-    image = cv2.imread(image_path)
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    image = image_cache.get(image_id, job["path"])
     # Detect blocks
-    blk_list = pipeline.detect_blocks(image)
+    blk_list = await pipeline.detect_blocks_async(image)
 
     # Convert blocks to response format
     blocks = []
@@ -81,9 +93,8 @@ async def detect_blocks(
             )
         )
 
-    # Update image store
-    image_store[image_id]["blocks"] = blk_list
-    image_store[image_id]["status"] = "blocks_detected"
+    # Update job store
+    job_store.update(image_id, blocks=blk_list, status="blocks_detected")
 
     return ProcessResponse(image_id=image_id, blocks=blocks, status="blocks_detected")
 
@@ -93,24 +104,25 @@ async def detect_blocks(
 async def ocr_image(
     image_id: str,
     pipeline: APIPipelineController = Depends(Provide[AppContainer.api_pipeline]),
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+    image_cache: DecodedImageCache = Depends(Provide[AppContainer.image_cache]),
 ):
-    if image_id not in image_store:
+    job = job_store.get(image_id)
+    if job is None:
         return JSONResponse(status_code=404, content={"error": "Image not found"})
 
-    if "blocks" not in image_store[image_id]:
+    if "blocks" not in job:
         return JSONResponse(
             status_code=400, content={"error": "Blocks not detected yet"}
         )
 
     # Load image and blocks
-    image_path = image_store[image_id]["path"]
-    image = cv2.imread(image_path)
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    blk_list = image_store[image_id]["blocks"]
-    source_lang = image_store[image_id]["source_language"]
+    image = image_cache.get(image_id, job["path"])
+    blk_list = job["blocks"]
+    source_lang = job["source_language"]
 
     # Process OCR
-    blk_list = pipeline.process_ocr(image, blk_list, source_lang)
+    blk_list = await pipeline.process_ocr_async(image, blk_list, source_lang)
 
     # Convert blocks to response format
     blocks = []
@@ -126,9 +138,8 @@ async def ocr_image(
             )
         )
 
-    # Update image store
-    image_store[image_id]["blocks"] = blk_list
-    image_store[image_id]["status"] = "ocr_completed"
+    # Update job store
+    job_store.update(image_id, blocks=blk_list, status="ocr_completed")
 
     return ProcessResponse(image_id=image_id, blocks=blocks, status="ocr_completed")
 
@@ -139,25 +150,26 @@ async def translate_image(
     image_id: str,
     request: TranslationRequest,
     pipeline: APIPipelineController = Depends(Provide[AppContainer.api_pipeline]),
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+    image_cache: DecodedImageCache = Depends(Provide[AppContainer.image_cache]),
 ):
-    if image_id not in image_store:
+    job = job_store.get(image_id)
+    if job is None:
         return JSONResponse(status_code=404, content={"error": "Image not found"})
 
-    if "blocks" not in image_store[image_id]:
+    if "blocks" not in job:
         return JSONResponse(
             status_code=400, content={"error": "Blocks not detected yet"}
         )
 
     # Load image and blocks
-    image_path = image_store[image_id]["path"]
-    image = cv2.imread(image_path)
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    blk_list = image_store[image_id]["blocks"]
-    source_lang = image_store[image_id]["source_language"]
-    target_lang = image_store[image_id]["target_language"]
+    image = image_cache.get(image_id, job["path"])
+    blk_list = job["blocks"]
+    source_lang = job["source_language"]
+    target_lang = job["target_language"]
 
     # Translate
-    blk_list = pipeline.translate_blocks(
+    blk_list = await pipeline.translate_blocks_async(
         blk_list, image, source_lang, target_lang, request.extra_context or ""
     )
 
@@ -176,9 +188,8 @@ async def translate_image(
             )
         )
 
-    # Update image store
-    image_store[image_id]["blocks"] = blk_list
-    image_store[image_id]["status"] = "translated"
+    # Update job store
+    job_store.update(image_id, blocks=blk_list, status="translated")
 
     return ProcessResponse(image_id=image_id, blocks=blocks, status="translated")
 
@@ -191,23 +202,26 @@ async def inpaint_image(
     request: TranslationRequest,
     pipeline: APIPipelineController = Depends(Provide[AppContainer.api_pipeline]),
     storage_config: dict = Depends(Provide[AppContainer.storage_config]),
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+    image_cache: DecodedImageCache = Depends(Provide[AppContainer.image_cache]),
 ):
-    if image_id not in image_store:
+    job = job_store.get(image_id)
+    if job is None:
         return JSONResponse(status_code=404, content={"error": "Image not found"})
 
-    if "blocks" not in image_store[image_id]:
+    if "blocks" not in job:
         return JSONResponse(
             status_code=400, content={"error": "Blocks not detected yet"}
         )
 
     # Load image and blocks
-    image_path = image_store[image_id]["path"]
-    image = cv2.imread(image_path)
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    blk_list = image_store[image_id]["blocks"]
+    image = image_cache.get(image_id, job["path"])
+    blk_list = job["blocks"]
 
     # Inpaint
-    inpainted_image = pipeline.inpaint_image(image, blk_list, request.use_gpu)
+    inpainted_image = await pipeline.inpaint_image_async(
+        image, blk_list, request.use_gpu
+    )
 
     # Save inpainted image
     result_path = os.path.join(
@@ -215,9 +229,8 @@ async def inpaint_image(
     )
     cv2.imwrite(result_path, inpainted_image)
 
-    # Update image store
-    image_store[image_id]["inpainted_path"] = result_path
-    image_store[image_id]["status"] = "inpainted"
+    # Update job store
+    job_store.update(image_id, inpainted_path=result_path, status="inpainted")
 
     return ProcessResponse(
         image_id=image_id,
@@ -233,24 +246,26 @@ async def render_translated_image(
     image_id: str,
     pipeline: APIPipelineController = Depends(Provide[AppContainer.api_pipeline]),
     storage_config: dict = Depends(Provide[AppContainer.storage_config]),
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
 ):
-    if image_id not in image_store:
+    job = job_store.get(image_id)
+    if job is None:
         return JSONResponse(status_code=404, content={"error": "Image not found"})
 
-    if "inpainted_path" not in image_store[image_id]:
+    if "inpainted_path" not in job:
         return JSONResponse(
             status_code=400, content={"error": "Image not inpainted yet"}
         )
 
     # Load inpainted image
-    inpainted_path = image_store[image_id]["inpainted_path"]
+    inpainted_path = job["inpainted_path"]
     inpainted_image = cv2.imread(inpainted_path)
     inpainted_image = cv2.cvtColor(inpainted_image, cv2.COLOR_BGR2RGB)
     # Get blocks
-    blk_list = image_store[image_id]["blocks"]
+    blk_list = job["blocks"]
 
     # Render text on image
-    final_image = pipeline.render_text(inpainted_image, blk_list)
+    final_image = await pipeline.render_text_async(inpainted_image, blk_list)
 
     # Save rendered image
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -259,9 +274,8 @@ async def render_translated_image(
     )
     cv2.imwrite(result_path, final_image)
 
-    # Update image store
-    image_store[image_id]["rendered_path"] = result_path
-    image_store[image_id]["status"] = "rendered"
+    # Update job store
+    job_store.update(image_id, rendered_path=result_path, status="rendered")
 
     return ProcessResponse(
         image_id=image_id,
@@ -272,16 +286,25 @@ async def render_translated_image(
 
 
 @router.get("/result/{image_id}")
-async def get_result_image(image_id: str):
-    if image_id not in image_store:
+@inject
+async def get_result_image(
+    image_id: str,
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+):
+    job = job_store.get(image_id)
+    if job is None:
         return JSONResponse(status_code=404, content={"error": "Image not found"})
 
-    status = image_store[image_id]["status"]
+    status = job["status"]
 
-    if status == "inpainted" and "inpainted_path" in image_store[image_id]:
-        return FileResponse(image_store[image_id]["inpainted_path"])
-    elif status == "rendered" and "rendered_path" in image_store[image_id]:
-        return FileResponse(image_store[image_id]["rendered_path"])
+    if status == "completed" and "archive_path" in job:
+        return FileResponse(
+            job["archive_path"], filename=os.path.basename(job["archive_path"])
+        )
+    elif status == "inpainted" and "inpainted_path" in job:
+        return FileResponse(job["inpainted_path"])
+    elif status == "rendered" and "rendered_path" in job:
+        return FileResponse(job["rendered_path"])
     else:
         return JSONResponse(
             status_code=400,
@@ -289,6 +312,206 @@ async def get_result_image(image_id: str):
         )
 
 
+@router.post("/batch", response_model=BatchResponse)
+@inject
+async def translate_archive(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    source_language: str = Form(default="English"),
+    target_language: str = Form(default="Vietnamese"),
+    extra_context: str = Form(default=""),
+    use_gpu: bool = Form(default=False),
+    pipeline: APIPipelineController = Depends(Provide[AppContainer.api_pipeline]),
+    storage_config: dict = Depends(Provide[AppContainer.storage_config]),
+    pipeline_config: dict = Depends(Provide[AppContainer.pipeline_config]),
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+):
+    """Translate a whole chapter (CBZ/CBR/PDF/EPUB...) into a CBZ archive"""
+    if not is_archive_file(file.filename or ""):
+        return JSONResponse(
+            status_code=400, content={"error": "Unsupported archive format"}
+        )
+
+    batch_id = str(uuid.uuid4())
+
+    # Save uploaded archive
+    ext = os.path.splitext(file.filename)[1]
+    archive_path = os.path.join(storage_config["upload_dir"], f"{batch_id}{ext}")
+    with open(archive_path, "wb") as f:
+        shutil.copyfileobj(file.file, f)
+
+    output_path = os.path.join(
+        storage_config["results_dir"], f"{batch_id}_translated.cbz"
+    )
+    job_store.create(
+        batch_id,
+        status="processing",
+        kind="batch",
+        path=archive_path,
+        source_language=source_language,
+        target_language=target_language,
+        total_pages=0,
+        completed_pages=0,
+        failed_pages=0,
+        pages=[],
+    )
+
+    batch_config = (pipeline_config or {}).get("batch", {})
+    background_tasks.add_task(
+        process_archive,
+        batch_id,
+        archive_path,
+        output_path,
+        source_language,
+        target_language,
+        extra_context,
+        use_gpu,
+        batch_config.get("max_concurrent_pages", 4),
+        (pipeline_config or {}).get("scheduler"),
+        pipeline,
+        job_store,
+        batch_config.get("progress_interval", 1.0),
+    )
+
+    return BatchResponse(batch_id=batch_id, status="processing")
+
+
+@router.get("/batch/{batch_id}", response_model=BatchResponse)
+@inject
+async def get_batch_progress(
+    batch_id: str,
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+):
+    job = job_store.get(batch_id)
+    if job is None or job.get("kind") != "batch":
+        return JSONResponse(status_code=404, content={"error": "Batch not found"})
+
+    return BatchResponse(
+        batch_id=batch_id,
+        status=job["status"],
+        total_pages=job.get("total_pages", 0),
+        completed_pages=job.get("completed_pages", 0),
+        failed_pages=job.get("failed_pages", 0),
+        pages=job.get("pages", []),
+        result_path=job.get("archive_path", ""),
+    )
+
+
+class BatchProgressWriter:
+    """
+    Writes the progress reports of a batch job to the job store, off the
+    event loop.
+
+    Reports are coalesced: at most one write is in flight, it stores the
+    latest report, and writes are at least `min_interval` seconds apart.
+    A chapter then costs a bounded number of writes instead of one write
+    of the whole page list per page.
+    """
+
+    def __init__(self, job_store: JobStore, batch_id: str, min_interval: float = 1.0):
+        self.job_store = job_store
+        self.batch_id = batch_id
+        self.min_interval = min_interval
+        self._pending: Optional[dict] = None
+        self._task: Optional[asyncio.Task] = None
+        self._last_write = 0.0
+
+    def report(self, progress: dict) -> None:
+        """Queue a progress report; called on the event loop."""
+        self._pending = progress
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._drain())
+
+    async def close(self) -> None:
+        """Wait until the last queued report is written."""
+        if self._task is not None:
+            await self._task
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            delay = self._last_write + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            progress, self._pending = self._pending, None
+            try:
+                await run_in_threadpool(self.job_store.update, self.batch_id, **progress)
+            except Exception as e:
+                print(f"Error saving progress of batch {self.batch_id}: {e}")
+            self._last_write = time.monotonic()
+
+
+async def process_archive(
+    batch_id: str,
+    archive_path: str,
+    output_path: str,
+    source_lang: str,
+    target_lang: str,
+    extra_context: str,
+    use_gpu: bool,
+    max_concurrent_pages: int,
+    scheduler_config: Optional[dict],
+    pipeline: APIPipelineController,
+    job_store: JobStore,
+    progress_interval: float = 1.0,
+):
+    """Implementation of the archive batch job"""
+    writer = BatchProgressWriter(job_store, batch_id, progress_interval)
+    try:
+        progress = await pipeline.process_archive_async(
+            archive_path,
+            output_path,
+            source_lang,
+            target_lang,
+            extra_context,
+            use_gpu,
+            max_concurrent_pages,
+            on_progress=writer.report,
+            scheduler_config=scheduler_config,
+        )
+        await writer.close()
+        await run_in_threadpool(
+            job_store.update,
+            batch_id,
+            archive_path=output_path,
+            status="completed",
+            **progress,
+        )
+
+    except Exception as e:
+        await writer.close()
+        await run_in_threadpool(job_store.update, batch_id, status="error", error=str(e))
+        print(f"Error processing archive {batch_id}: {e}")
+
+
+@router.get("/jobs")
+@inject
+async def list_jobs(
+    status: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+):
+    jobs = job_store.list_jobs(status=status, limit=limit, offset=offset)
+    return {"jobs": jobs}
+
+
+@router.get("/stats")
+@inject
+async def get_stats(
+    pipeline: APIPipelineController = Depends(Provide[AppContainer.api_pipeline]),
+    image_cache: DecodedImageCache = Depends(Provide[AppContainer.image_cache]),
+):
+    """Cache and executor statistics of the running worker"""
+    return {
+        "image_cache": image_cache.stats(),
+        "executor": pipeline.executor.stats(),
+        "schedulers": pipeline.scheduler_stats(),
+        "detection": pipeline.detection_processor.stats(),
+        "ocr": pipeline.ocr_processor.stats(),
+        "translation": pipeline.translator.stats(),
+    }
+
+
 @router.post("/translate-all/{image_id}", response_model=ProcessResponse)
 @inject
 async def translate_all_steps(
@@ -296,21 +519,31 @@ async def translate_all_steps(
     request: TranslationRequest,
     background_tasks: BackgroundTasks,
     pipeline: APIPipelineController = Depends(Provide[AppContainer.api_pipeline]),
+    storage_config: dict = Depends(Provide[AppContainer.storage_config]),
+    job_store: JobStore = Depends(Provide[AppContainer.job_store]),
+    image_cache: DecodedImageCache = Depends(Provide[AppContainer.image_cache]),
 ):
     """Process all steps at once: detect blocks, OCR, translate, inpaint, and render"""
-    if image_id not in image_store:
+    job = job_store.get(image_id)
+    if job is None:
         return JSONResponse(status_code=404, content={"error": "Image not found"})
 
     # Load image
-    image_path = image_store[image_id]["path"]
-    image = cv2.imread(image_path)
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    source_lang = image_store[image_id]["source_language"]
-    target_lang = image_store[image_id]["target_language"]
+    image = image_cache.get(image_id, job["path"])
+    source_lang = job["source_language"]
+    target_lang = job["target_language"]
 
     # Process full pipeline
     background_tasks.add_task(
-        process_all_steps, image_id, request, image, source_lang, target_lang, pipeline
+        process_all_steps,
+        image_id,
+        request,
+        image,
+        source_lang,
+        target_lang,
+        pipeline,
+        storage_config,
+        job_store,
     )
 
     return ProcessResponse(image_id=image_id, blocks=[], status="processing_started")
@@ -323,12 +556,13 @@ async def process_all_steps(
     source_lang: str,
     target_lang: str,
     pipeline: APIPipelineController,
-    storage_config: dict = Depends(Provide[AppContainer.storage_config]),
+    storage_config: dict,
+    job_store: JobStore,
 ):
     """Implementation of the full pipeline"""
     try:
         # Process full pipeline
-        result = pipeline.process_full_pipeline(
+        result = await pipeline.process_full_pipeline_async(
             image,
             source_lang,
             target_lang,
@@ -343,12 +577,14 @@ async def process_all_steps(
         )
         cv2.imwrite(result_path, result["final_image"])
 
-        # Update image store
-        image_store[image_id]["final_path"] = result_path
-        image_store[image_id]["status"] = "completed"
-        image_store[image_id]["blocks"] = result["text_blocks"]
+        # Update job store
+        job_store.update(
+            image_id,
+            final_path=result_path,
+            status="completed",
+            blocks=result["text_blocks"],
+        )
 
     except Exception as e:
-        image_store[image_id]["status"] = "error"
-        image_store[image_id]["error"] = str(e)
+        job_store.update(image_id, status="error", error=str(e))
         print(f"Error processing image {image_id}: {e}")
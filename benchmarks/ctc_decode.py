@@ -0,0 +1,110 @@
+"""
+Benchmark the brainOCR CTC decoders on synthetic recognizer outputs.
+
+Builds recognizer-like probabilities (mostly blanks, runs of repeated
+characters, a few plausible alternatives per step) at the sequence length and
+vocabulary size of the Korean brainOCR model. Then decodes them with the
+original per-sample decoders (`recognizer_predict`'s NumPy round trip plus
+`decode_greedy`, and `ctcBeamSearch`) and with the batched ones of
+`brainOCR/ctc.py`. Texts must be identical.
+
+Usage:
+    python -m benchmarks.ctc_decode [--batch 32] [--steps 200] [--classes 1500] [--beam-width 5] [--runs 3]
+"""
+import argparse
+import time
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+
+from modules.ocr.pororo.pororo.models.brainOCR.utils import CTCLabelConverter, ctcBeamSearch
+
+
+def synthetic_logits(batch: int, steps: int, classes: int, seed: int = 0) -> torch.Tensor:
+    """(N, T, C) logits of text lines: characters held for a few steps, separated by blanks."""
+    rng = np.random.default_rng(seed)
+    logits = rng.normal(0, 1.0, size=(batch, steps, classes)).astype(np.float32)
+    for n in range(batch):
+        t = 0
+        while t < steps:
+            char = rng.integers(1, classes) if rng.random() < 0.6 else 0
+            hold = rng.integers(1, 4)
+            logits[n, t:t + hold, char] += rng.uniform(8, 16)
+            # A look-alike character competing with the best one
+            logits[n, t:t + hold, rng.integers(1, classes)] += rng.uniform(4, 10)
+            t += hold
+    return torch.from_numpy(logits)
+
+
+def greedy_reference(converter: CTCLabelConverter, preds: torch.Tensor) -> list:
+    """Greedy decoding as `recognizer_predict` originally did it."""
+    preds_prob = F.softmax(preds, dim=2)
+    preds_prob = preds_prob.cpu().detach().numpy()
+    pred_norm = preds_prob.sum(axis=2)
+    preds_prob = preds_prob / np.expand_dims(pred_norm, axis=-1)
+    preds_prob = torch.from_numpy(preds_prob).float().to(preds.device)
+
+    preds_lengths = torch.IntTensor([preds.size(1)] * preds.size(0))
+    _, preds_indices = preds_prob.max(2)
+    preds_str = converter.decode_greedy(preds_indices.view(-1), preds_lengths)
+    preds_max_prob, _ = preds_prob.max(dim=2)
+    return [[pred, p.cumprod(dim=0)[-1].item()] for pred, p in zip(preds_str, preds_max_prob)]
+
+
+def greedy_batched(converter: CTCLabelConverter, preds: torch.Tensor) -> list:
+    preds_prob = F.softmax(preds, dim=2)
+    preds_prob = preds_prob / preds_prob.sum(dim=2, keepdim=True)
+    texts, confidences = converter.decode_greedy_batch(preds_prob)
+    return [[text, confidence] for text, confidence in zip(texts, confidences)]
+
+
+def best_time(fn, runs: int):
+    result, best = None, float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--classes", type=int, default=1500)
+    parser.add_argument("--beam-width", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu")
+    args = parser.parse_args()
+
+    vocab = ["[blank]"] + [chr(0xAC00 + i) for i in range(args.classes - 1)]
+    converter = CTCLabelConverter(vocab)
+    preds = synthetic_logits(args.batch, args.steps, args.classes).to(args.device)
+    print(f"{args.batch} lines, {args.steps} steps, {args.classes} classes, {args.device}")
+
+    with torch.no_grad():
+        reference, reference_ms = best_time(lambda: greedy_reference(converter, preds), args.runs)
+        result, batched_ms = best_time(lambda: greedy_batched(converter, preds), args.runs)
+    print(f"{'greedy, per sample':24s} {reference_ms:9.2f} ms")
+    print(f"{'greedy, batched':24s} {batched_ms:9.2f} ms")
+    assert [text for text, _ in reference] == [text for text, _ in result], \
+        "greedy texts differ from the reference"
+    assert np.allclose([c for _, c in reference], [c for _, c in result], rtol=1e-4, atol=1e-12), \
+        "greedy confidences differ from the reference"
+
+    mat = F.softmax(preds, dim=2).cpu().numpy()
+    reference, reference_ms = best_time(
+        lambda: [ctcBeamSearch(m, vocab, 0, None, beam_width=args.beam_width) for m in mat], 1
+    )
+    result, batched_ms = best_time(
+        lambda: converter.decode_beamsearch(mat, None, 0.01, args.beam_width), args.runs
+    )
+    print(f"{'beam search, per sample':24s} {reference_ms:9.2f} ms")
+    print(f"{'beam search, batched':24s} {batched_ms:9.2f} ms")
+    assert reference == result, "beam search texts differ from the reference"
+    print("results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compare the PyTorch and ONNX Runtime RT-DETR-v2 detection engines.
+
+Runs every image through the PyTorch engine and the ONNX (fp32 and int8)
+engines, reports per-engine latency and checks accuracy parity: every
+PyTorch box must be matched by a box of the same kind (bubble/text) with
+IoU >= --iou, and vice versa. Exits with status 1 when the match rate of an
+engine falls below --min-match.
+
+Usage:
+    python -m benchmarks.detection_onnx page1.jpg page2.png [--runs 3] [--no-int8]
+"""
+import argparse
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from modules.detection.rtdetr_v2 import RTDetrV2Detection
+from modules.detection.rtdetr_v2_onnx import RTDetrV2ONNXDetection
+from modules.detection.utils.geometry import as_boxes, pairwise_iou
+
+
+def match_rate(reference: np.ndarray, candidate: np.ndarray, iou: float) -> tuple[int, int]:
+    """Number of boxes of each set with a counterpart in the other, and the total."""
+    reference, candidate = as_boxes(reference), as_boxes(candidate)
+    total = len(reference) + len(candidate)
+    if len(reference) == 0 or len(candidate) == 0:
+        return 0, total
+    matches = pairwise_iou(reference, candidate) >= iou
+    return int(matches.any(axis=1).sum() + matches.any(axis=0).sum()), total
+
+
+def time_engine(engine, images: list[np.ndarray], runs: int) -> tuple[list, float]:
+    """Raw (bubble_boxes, text_boxes) per image and the best mean latency in ms."""
+    results = [engine._detect_single_image(image) for image in images]  # warm-up
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for image in images:
+            engine._detect_single_image(image)
+        best = min(best, (time.perf_counter() - start) / len(images))
+    return results, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("images", nargs="+")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--confidence", type=float, default=0.3)
+    parser.add_argument("--iou", type=float, default=0.9)
+    parser.add_argument("--min-match", type=float, default=0.95)
+    parser.add_argument("--no-int8", action="store_true")
+    args = parser.parse_args()
+
+    images = [cv2.imread(path) for path in args.images]
+
+    engines = {"pytorch": RTDetrV2Detection()}
+    engines["onnx"] = RTDetrV2ONNXDetection()
+    if not args.no_int8:
+        engines["onnx-int8"] = RTDetrV2ONNXDetection()
+
+    for name, engine in engines.items():
+        options = {"quantize": True} if name == "onnx-int8" else {}
+        engine.initialize(device="cpu", confidence_threshold=args.confidence, **options)
+
+    results = {}
+    print(f"{len(images)} images, best of {args.runs} runs")
+    for name, engine in engines.items():
+        results[name], latency = time_engine(engine, images, args.runs)
+        print(f"{name:10s} {latency:9.1f} ms/image")
+
+    failed = False
+    for name in engines:
+        if name == "pytorch":
+            continue
+        matched = total = 0
+        for reference, candidate in zip(results["pytorch"], results[name]):
+            for kind in range(2):  # bubble boxes, text boxes
+                m, t = match_rate(reference[kind], candidate[kind], args.iou)
+                matched, total = matched + m, total + t
+        rate = matched / total if total else 1.0
+        print(f"{name:10s} parity {rate:.3f} ({matched}/{total} boxes matched at IoU >= {args.iou})")
+        failed |= rate < args.min_match
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
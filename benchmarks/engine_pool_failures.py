@@ -0,0 +1,80 @@
+"""
+Regression check of EnginePool bookkeeping when an engine fails to load.
+
+One thread's factory raises while other threads wait on the same key (and on
+a second key). The waiters must then load into a live pool entry, and once
+every lease is returned the pool must account for exactly the engines it
+holds: no orphaned entry, no bytes left behind, no instance in use.
+
+Usage:
+    python -m benchmarks.engine_pool_failures [--rounds 50] [--waiters 4]
+"""
+import argparse
+import threading
+import time
+
+from modules.utils.engine_pool import MIN_ENGINE_BYTES, EnginePool
+
+
+class _Engine:
+    pass
+
+
+def run_round(waiters: int, replicas: int) -> dict:
+    pool = EnginePool("check", max_bytes=64 * MIN_ENGINE_BYTES, replicas=replicas, checkout_timeout=10)
+    loading = threading.Event()
+    errors = []
+
+    def failing_factory():
+        loading.set()
+        time.sleep(0.02)  # let the waiters block on the key
+        raise RuntimeError("model failed to load")
+
+    def first():
+        try:
+            with pool.lease("key", failing_factory):
+                pass
+        except RuntimeError:
+            pass
+
+    def waiter(key):
+        loading.wait()
+        try:
+            with pool.lease(key, _Engine):
+                time.sleep(0.001)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=first)]
+    threads += [threading.Thread(target=waiter, args=("key" if i % 2 == 0 else "other",))
+                for i in range(waiters)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, errors
+    stats = pool.stats()
+    assert stats["in_use"] == 0, stats
+    assert stats["instances"] == len(pool.instances()), stats
+    assert stats["bytes"] == sum(info["bytes"] for info in stats["keys"].values()), stats
+    assert all(info["instances"] > 0 for info in stats["keys"].values()), stats
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--waiters", type=int, default=4)
+    args = parser.parse_args()
+
+    for replicas in (1, 2):
+        for _ in range(args.rounds):
+            stats = run_round(args.waiters, replicas)
+        print(f"replicas={replicas}: {args.rounds} rounds, last {stats['instances']} instances, "
+              f"{stats['bytes']} bytes")
+    print("bookkeeping consistent")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark OCR line to text block matching on synthetic dense pages.
+
+Builds pages the way DocTR and PaddleOCR see them: many bubbles, each holding
+a few lines of word boxes, plus stray words outside any bubble. Then runs
+both the line-to-block assignment and the line grouping of
+`sort_textblock_rectangles` with the grid/bisect implementations and with
+the all-pairs references (dense membership matrices, scan-every-line
+grouping). Results must be identical.
+
+Usage:
+    python -m benchmarks.ocr_line_matching [--blocks 200] [--words 8] [--runs 3]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from modules.detection.utils.geometry import (
+    grid_containment,
+    pairwise_fits,
+    pairwise_mostly_contained,
+)
+from modules.utils.textblock import sort_textblock_rectangles
+
+
+def sort_textblock_rectangles_naive(coords_text_list, direction="ver_rtl", threshold=10):
+    """Line grouping as originally written, comparing each box with every placed box."""
+
+    def in_same_line(bbox_a, bbox_b):
+        center_a = ((bbox_a[0] + bbox_a[2]) / 2, (bbox_a[1] + bbox_a[3]) / 2)
+        center_b = ((bbox_b[0] + bbox_b[2]) / 2, (bbox_b[1] + bbox_b[3]) / 2)
+        if "hor" in direction:
+            return abs(center_a[1] - center_b[1]) <= threshold
+        elif "ver" in direction:
+            return abs(center_a[0] - center_b[0]) <= threshold
+
+    lines = []
+    remaining_boxes = coords_text_list[:]
+    while remaining_boxes:
+        box = remaining_boxes.pop(0)
+        closest_line = None
+        closest_distance = float("inf")
+        for line in lines:
+            for line_box in line:
+                if in_same_line(box[0], line_box[0]):
+                    distance = abs(box[0][0] - line_box[0][0]) + abs(box[0][1] - line_box[0][1])
+                    if distance < closest_distance:
+                        closest_line = line
+                        closest_distance = distance
+        if closest_line is not None:
+            closest_line.append(box)
+        else:
+            lines.append([box])
+
+    return _order_lines(lines, direction)
+
+
+def _order_lines(lines, direction):
+    """Order the boxes of every line, then the lines, by reading direction."""
+    for i, line in enumerate(lines):
+        if direction == "hor_ltr":
+            lines[i] = sorted(line, key=lambda box: box[0][0])
+        elif direction == "hor_rtl":
+            lines[i] = sorted(line, key=lambda box: -box[0][0])
+        elif direction in ["ver_ltr", "ver_rtl"]:
+            lines[i] = sorted(line, key=lambda box: box[0][1])
+    if "hor" in direction:
+        lines.sort(key=lambda line: min(box[0][1] for box in line))
+    elif direction == "ver_ltr":
+        lines.sort(key=lambda line: min(box[0][0] for box in line))
+    elif direction == "ver_rtl":
+        lines.sort(key=lambda line: min(box[0][0] for box in line), reverse=True)
+    return [box for line in lines for box in line]
+
+
+def synthetic_page(blocks: int, words: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Bubble boxes and word boxes of a dense page."""
+    rng = np.random.default_rng(seed)
+    columns = int(np.ceil(np.sqrt(blocks)))
+    bubbles, word_boxes = [], []
+    for index in range(blocks):
+        x0, y0 = (index % columns) * 260, (index // columns) * 220
+        bubble = (x0, y0, x0 + rng.integers(180, 250), y0 + rng.integers(140, 210))
+        bubbles.append(bubble)
+        for line in range(rng.integers(2, 5)):
+            x = bubble[0] + 10
+            y = bubble[1] + 10 + line * 30 + rng.integers(-4, 5)
+            for _ in range(words):
+                w = rng.integers(12, 40)
+                if x + w > bubble[2] + 10:  # some words stick out of the bubble
+                    break
+                word_boxes.append((x, y, x + w, y + rng.integers(16, 24)))
+                x += w + rng.integers(3, 10)
+    # Stray words in the gutters, matching no bubble
+    for _ in range(blocks):
+        x, y = rng.integers(0, columns * 260), rng.integers(0, columns * 220)
+        word_boxes.append((x, y, x + 20, y + 18))
+    word_boxes = np.array(word_boxes)
+    return np.array(bubbles), word_boxes[rng.permutation(len(word_boxes))]
+
+
+def best_time(fn, runs: int):
+    result, best = None, float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocks", type=int, default=200)
+    parser.add_argument("--words", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    bubbles, words = synthetic_page(args.blocks, args.words)
+    print(f"{len(bubbles)} blocks, {len(words)} word boxes")
+
+    dense, dense_ms = best_time(
+        lambda: pairwise_fits(bubbles, words) | pairwise_mostly_contained(bubbles, words, 0.5),
+        args.runs,
+    )
+    grid, grid_ms = best_time(lambda: grid_containment(bubbles, words, 0.5), args.runs)
+    print(f"{'dense membership':24s} {dense_ms:9.2f} ms")
+    print(f"{'grid membership':24s} {grid_ms:9.2f} ms")
+    assert np.array_equal(dense, grid), "grid membership differs from the reference"
+
+    # Group the lines of every block, in every reading direction
+    entries = [
+        [(tuple(int(v) for v in words[i]), f"w{i}") for i in np.flatnonzero(members)]
+        for members in dense
+    ]
+    for direction in ("hor_ltr", "hor_rtl", "ver_ltr", "ver_rtl"):
+        reference, naive_ms = best_time(
+            lambda: [sort_textblock_rectangles_naive(e, direction) for e in entries], args.runs
+        )
+        result, sorted_ms = best_time(
+            lambda: [sort_textblock_rectangles(e, direction) for e in entries], args.runs
+        )
+        print(f"{'naive grouping ' + direction:24s} {naive_ms:9.2f} ms")
+        print(f"{'sorted grouping ' + direction:24s} {sorted_ms:9.2f} ms")
+        assert reference == result, f"line grouping differs from the reference ({direction})"
+
+    # One page-sized block, where grouping cost grows with the square of the words
+    page = [(tuple(int(v) for v in box), f"w{i}") for i, box in enumerate(words)]
+    reference, naive_ms = best_time(lambda: sort_textblock_rectangles_naive(page, "hor_ltr"), 1)
+    result, sorted_ms = best_time(lambda: sort_textblock_rectangles(page, "hor_ltr"), 1)
+    print(f"{'naive grouping, 1 block':24s} {naive_ms:9.2f} ms")
+    print(f"{'sorted grouping, 1 block':24s} {sorted_ms:9.2f} ms")
+    assert reference == result, "line grouping differs from the reference (single block)"
+    print("results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,17 @@ import json
 
 # Import các modules
 from controller.api_pipeline_controller import APIPipelineController
+from controller.stage_executor import StageExecutor
 from modules.detection.processor import TextBlockDetectorProcessor
 from modules.ocr.processor import OCRProcessor
 from modules.rendering.render_api import TextRenderer
 from modules.translation.processor import Translator
 from modules.inpainting.processor import InPaintingProcessor
 from modules.utils.pipeline_utils import inpaint_map
+from store.factory import JobStoreFactory
+from store.image_cache import DecodedImageCache
+from store.detection_cache import DetectionCache
+from store.ocr_cache import OCRCache
 
 
 class AppContainer(containers.DeclarativeContainer):
@@ -38,17 +43,48 @@ class AppContainer(containers.DeclarativeContainer):
     inpainting_config = providers.Resource(config.inpainting)
     rendering_config = providers.Resource(config.rendering)
     storage_config = providers.Resource(config.storage)
+    pipeline_config = providers.Resource(config.pipeline)
+
+    # Job state storage
+    job_store = providers.Singleton(
+        JobStoreFactory.create_store,
+        config=storage_config,
+    )
+
+    # Decoded uploads shared by the step-by-step endpoints
+    image_cache = providers.Singleton(
+        DecodedImageCache,
+        max_bytes=config.storage.image_cache.max_bytes,
+        shared_memory=config.storage.image_cache.shared_memory,
+    )
+
+    # Detection boxes keyed by page content and detector config
+    detection_cache = providers.Singleton(
+        DetectionCache,
+        path=config.storage.detection_cache.path,
+        max_bytes=config.storage.detection_cache.max_bytes,
+    )
+
+    # Recognized text keyed by block crop, engine and source language
+    ocr_cache = providers.Singleton(
+        OCRCache,
+        path=config.storage.ocr_cache.path,
+        max_bytes=config.storage.ocr_cache.max_bytes,
+        touch_interval=config.storage.ocr_cache.touch_interval,
+    )
 
     # Modules
 
     detection_processor = providers.Singleton(
         TextBlockDetectorProcessor,
         config=detection_config,
+        cache=detection_cache,
     )
 
     ocr_processor = providers.Singleton(
         OCRProcessor,
         config=ocr_config,
+        cache=ocr_cache,
     )
 
     translator = providers.Singleton(
@@ -66,6 +102,12 @@ class AppContainer(containers.DeclarativeContainer):
         config=rendering_config,
     )
 
+    # Worker lanes for CPU-bound and network-bound pipeline stages
+    stage_executor = providers.Singleton(
+        StageExecutor,
+        config=config.pipeline.executor,
+    )
+
     # API pipeline (headless version)
     api_pipeline = providers.Singleton(
         APIPipelineController,
@@ -75,6 +117,7 @@ class AppContainer(containers.DeclarativeContainer):
         inpainter=inpainter,
         text_renderer=text_renderer,
         config=config,
+        executor=stage_executor,
     )
 
 
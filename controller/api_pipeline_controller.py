@@ -1,6 +1,11 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import zipfile
 import cv2
 import numpy as np
-from typing import List, Optional
+from typing import Callable, List, Optional
 from dependency_injector.wiring import inject, Provide
 
 from modules.inpainting.processor import InPaintingProcessor
@@ -11,6 +16,9 @@ from modules.translation.processor import Translator
 from modules.utils.textblock import TextBlock, sort_blk_list
 from modules.utils.pipeline_utils import generate_mask, inpaint_map
 from modules.utils.translator_utils import set_upper_case
+from modules.utils.archives import extract_archive
+from controller.stage_executor import StageExecutor, CPU_LANE, NETWORK_LANE
+from controller.page_scheduler import PageScheduler
 
 
 class APIPipelineController:
@@ -25,6 +33,7 @@ class APIPipelineController:
         inpainter: InPaintingProcessor,
         text_renderer: TextRenderer,
         config=any,
+        executor: Optional[StageExecutor] = None,
     ):
         self.detection_processor = detection_processor
         self.ocr_processor = ocr_processor
@@ -32,6 +41,8 @@ class APIPipelineController:
         self.inpainter = inpainter
         self.text_renderer = text_renderer
         self.config = config
+        self.executor = executor or StageExecutor()
+        self.schedulers: dict[str, PageScheduler] = {}
 
         # Initalize
         self.detection_processor.initialize()
@@ -103,23 +114,32 @@ class APIPipelineController:
         extra_context: str = "",
         use_gpu: bool = False,
     ) -> dict:
-        """Process toàn bộ pipeline: detect -> OCR -> translate -> inpaint -> render"""
+        """
+        Process toàn bộ pipeline as a dependency graph:
+
+            detect -> {OCR -> translate, mask -> inpaint} -> render
+
+        Inpainting only needs the detected boxes, so it runs on the CPU lane
+        while OCR and translation run in the calling thread. Must not be
+        called from a CPU lane worker (use `process_full_pipeline_async`).
+        """
 
         # Step 1: Detect blocks
         blk_list = self.detect_blocks(image)
 
-        # Step 2: OCR
-        blk_list = self.process_ocr(image, blk_list, source_lang)
+        # Step 2: Inpaint branch, independent of the recognized text
+        inpaint_future = self.executor.submit(
+            CPU_LANE, self.inpaint_image, image, blk_list, use_gpu
+        )
 
-        # Step 3: Translate
+        # Step 3: Text branch, OCR then translate
+        blk_list = self.process_ocr(image, blk_list, source_lang)
         blk_list = self.translate_blocks(
             blk_list, image, source_lang, target_lang, extra_context
         )
 
-        # Step 4: Inpaint
-        inpainted_image = self.inpaint_image(image, blk_list, use_gpu)
-
-        # Step 5: Render text
+        # Step 4: Join and render text
+        inpainted_image = inpaint_future.result()
         final_image = self.render_text(inpainted_image, blk_list)
 
         return {
@@ -129,6 +149,191 @@ class APIPipelineController:
             "text_blocks": blk_list,
         }
 
+    # Async variants: run each stage on the executor lane matching its workload
+    # so that the event loop is never blocked by a forward pass or an API call
+
+    def _ocr_lane(self) -> str:
+        return NETWORK_LANE if self.ocr_processor.uses_network() else CPU_LANE
+
+    async def detect_blocks_async(self, image: np.ndarray) -> List[TextBlock]:
+        return await self.executor.run(CPU_LANE, self.detect_blocks, image)
+
+    async def process_ocr_async(
+        self, image: np.ndarray, blk_list: List[TextBlock], source_lang: str
+    ) -> List[TextBlock]:
+        return await self.executor.run(
+            self._ocr_lane(), self.process_ocr, image, blk_list, source_lang
+        )
+
+    async def translate_blocks_async(
+        self,
+        blk_list: List[TextBlock],
+        image: np.ndarray,
+        source_lang: str,
+        target_lang: str,
+        extra_context: str = "",
+    ) -> List[TextBlock]:
+        return await self.executor.run(
+            NETWORK_LANE,
+            self.translate_blocks,
+            blk_list,
+            image,
+            source_lang,
+            target_lang,
+            extra_context,
+        )
+
+    async def inpaint_image_async(
+        self, image: np.ndarray, blk_list: List[TextBlock], use_gpu: bool = False
+    ) -> np.ndarray:
+        return await self.executor.run(
+            CPU_LANE, self.inpaint_image, image, blk_list, use_gpu
+        )
+
+    async def render_text_async(
+        self, image: np.ndarray, blk_list: List[TextBlock]
+    ) -> np.ndarray:
+        return await self.executor.run(CPU_LANE, self.render_text, image, blk_list)
+
+    async def process_full_pipeline_async(
+        self,
+        image: np.ndarray,
+        source_lang: str,
+        target_lang: str,
+        extra_context: str = "",
+        use_gpu: bool = False,
+    ) -> dict:
+        """Async version of `process_full_pipeline`, each stage runs on its lane"""
+
+        blk_list = await self.detect_blocks_async(image)
+
+        # The two branches only share the detected boxes: OCR/translation
+        # write `text`/`translation` while the mask writes `inpaint_bboxes`
+        async def text_branch() -> List[TextBlock]:
+            blocks = await self.process_ocr_async(image, blk_list, source_lang)
+            return await self.translate_blocks_async(
+                blocks, image, source_lang, target_lang, extra_context
+            )
+
+        blk_list, inpainted_image = await asyncio.gather(
+            text_branch(), self.inpaint_image_async(image, blk_list, use_gpu)
+        )
+        final_image = await self.render_text_async(inpainted_image, blk_list)
+
+        return {
+            "original_image": image,
+            "inpainted_image": inpainted_image,
+            "final_image": final_image,
+            "text_blocks": blk_list,
+        }
+
+    async def process_archive_async(
+        self,
+        archive_path: str,
+        output_path: str,
+        source_lang: str,
+        target_lang: str,
+        extra_context: str = "",
+        use_gpu: bool = False,
+        max_concurrent_pages: int = 4,
+        on_progress: Optional[Callable[[dict], None]] = None,
+        scheduler_config: Optional[dict] = None,
+    ) -> dict:
+        """
+        Translate every page of an archive (CBZ/CBR/PDF/EPUB...) into a CBZ.
+
+        Pages flow through a `PageScheduler`, so the stages of different
+        pages overlap, with up to `max_concurrent_pages` pages in flight.
+        Each page is appended to the output archive as soon as it is
+        rendered, and `on_progress` is called with the progress summary
+        after extraction and after every page. Pages that fail are copied
+        untranslated so the chapter stays complete.
+        """
+        work_dir = tempfile.mkdtemp(
+            dir=os.path.dirname(os.path.abspath(output_path))
+        )
+        try:
+            image_paths = await self.executor.run(
+                CPU_LANE, extract_archive, archive_path, work_dir
+            )
+            pages = [
+                {"name": os.path.relpath(path, work_dir), "status": "pending"}
+                for path in image_paths
+            ]
+
+            def progress() -> dict:
+                return {
+                    "total_pages": len(pages),
+                    "completed_pages": sum(p["status"] == "completed" for p in pages),
+                    "failed_pages": sum(p["status"] == "failed" for p in pages),
+                    "pages": [dict(p) for p in pages],
+                }
+
+            def report() -> None:
+                if on_progress is not None:
+                    on_progress(progress())
+
+            report()
+
+            semaphore = asyncio.Semaphore(max_concurrent_pages)
+            write_lock = asyncio.Lock()
+            scheduler = PageScheduler(self, scheduler_config)
+            self.schedulers[os.path.basename(archive_path)] = scheduler
+
+            async def process_page(
+                archive: zipfile.ZipFile, page: dict, image_path: str
+            ) -> None:
+                async with semaphore:
+                    page["status"] = "processing"
+                    try:
+                        image = await self.executor.run(
+                            CPU_LANE, _read_rgb_image, image_path
+                        )
+                        future = await scheduler.submit(
+                            page["name"],
+                            image,
+                            source_lang,
+                            target_lang,
+                            extra_context,
+                            use_gpu,
+                        )
+                        result = await future
+                        data = await self.executor.run(
+                            CPU_LANE, _encode_image, result["final_image"], image_path
+                        )
+                        page["status"] = "completed"
+                    except Exception as e:
+                        print(f"Error processing page {page['name']}: {e}")
+                        data = await self.executor.run(
+                            CPU_LANE, _read_bytes, image_path
+                        )
+                        page["status"] = "failed"
+                        page["error"] = str(e)
+
+                async with write_lock:
+                    await self.executor.run(
+                        CPU_LANE, archive.writestr, page["name"], data
+                    )
+                report()
+
+            async with scheduler:
+                with zipfile.ZipFile(output_path, "w") as archive:
+                    await asyncio.gather(
+                        *(
+                            process_page(archive, page, path)
+                            for page, path in zip(pages, image_paths)
+                        )
+                    )
+
+            return progress()
+        finally:
+            self.schedulers.pop(os.path.basename(archive_path), None)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def scheduler_stats(self) -> dict:
+        """Per-stage statistics of the page schedulers currently running."""
+        return {name: scheduler.stats() for name, scheduler in self.schedulers.items()}
+
     def process_step_by_step(
         self,
         image: np.ndarray,
@@ -173,3 +378,24 @@ class APIPipelineController:
 
         else:
             raise ValueError(f"Unknown step: {step}")
+
+
+def _read_rgb_image(path: str) -> np.ndarray:
+    image = cv2.imread(path)
+    if image is None:
+        raise ValueError(f"Could not read image: {path}")
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _encode_image(image: np.ndarray, path: str) -> bytes:
+    """Encode a result page in the format of the original page."""
+    ext = os.path.splitext(path)[1].lower() or ".png"
+    ok, buffer = cv2.imencode(ext, image)
+    if not ok:
+        raise ValueError(f"Could not encode page as {ext}")
+    return buffer.tobytes()
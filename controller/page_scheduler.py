@@ -0,0 +1,215 @@
+import asyncio
+import time
+from typing import Optional
+
+import numpy as np
+
+# Default number of workers per stage
+DEFAULT_WORKERS = {
+    "detect": 1,
+    "ocr": 2,
+    "translate": 4,
+    "inpaint": 1,
+    "render": 1,
+}
+
+
+class _Page:
+    """A page travelling through the stage queues."""
+
+    def __init__(self, key, image, source_lang, target_lang, extra_context, use_gpu):
+        self.key = key
+        self.image = image
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.extra_context = extra_context
+        self.use_gpu = use_gpu
+        self.blk_list = None
+        self.inpainted_image = None
+        # Branches (text, inpaint) that must finish before rendering
+        self.pending_branches = 2
+        self.future = asyncio.get_running_loop().create_future()
+
+
+class _Stage:
+    """A bounded queue drained by a fixed number of workers."""
+
+    def __init__(self, name: str, handler, workers: int, queue_size: int):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.tasks: list[asyncio.Task] = []
+        self.busy = 0
+        self.busy_time = 0.0
+        self.processed = 0
+        self.failed = 0
+
+    def stats(self, elapsed: float) -> dict:
+        capacity = elapsed * self.workers
+        return {
+            "workers": self.workers,
+            "busy": self.busy,
+            "queue_depth": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "processed": self.processed,
+            "failed": self.failed,
+            "utilisation": min(1.0, self.busy_time / capacity) if capacity else 0.0,
+        }
+
+
+class PageScheduler:
+    """
+    Stage-pipelined scheduler for multi-page jobs.
+
+    Every stage of the page graph
+
+        detect -> {ocr -> translate, inpaint} -> render
+
+    is a pool of workers fed by a bounded queue, so different pages occupy
+    different stages at the same time: while one page waits on the LLM in
+    `translate`, the next one can be inpainted on the CPU. Full queues push
+    back on `submit`, which bounds the number of decoded pages in memory.
+
+    Each stage delegates to the `*_async` methods of `APIPipelineController`,
+    so the executor lane limits still apply underneath.
+    """
+
+    def __init__(self, pipeline, config: dict = {}):
+        config = config or {}
+        self.pipeline = pipeline
+        workers = dict(DEFAULT_WORKERS, **config.get("workers", {}))
+        queue_size = config.get("queue_size", 2)
+
+        self.stages = {
+            "detect": _Stage("detect", self._detect, workers["detect"], queue_size),
+            "ocr": _Stage("ocr", self._ocr, workers["ocr"], queue_size),
+            "translate": _Stage(
+                "translate", self._translate, workers["translate"], queue_size
+            ),
+            "inpaint": _Stage("inpaint", self._inpaint, workers["inpaint"], queue_size),
+            "render": _Stage("render", self._render, workers["render"], queue_size),
+        }
+        self._started_at: Optional[float] = None
+        self._in_flight: set = set()
+
+    async def start(self) -> None:
+        """Spawn the stage workers on the running event loop."""
+        if self._started_at is not None:
+            return
+        self._started_at = time.monotonic()
+        for stage in self.stages.values():
+            stage.tasks = [
+                asyncio.create_task(self._worker(stage)) for _ in range(stage.workers)
+            ]
+
+    async def close(self) -> None:
+        """Stop every worker. Pages still in flight are cancelled."""
+        for stage in self.stages.values():
+            for task in stage.tasks:
+                task.cancel()
+            await asyncio.gather(*stage.tasks, return_exceptions=True)
+            stage.tasks = []
+        for future in self._in_flight:
+            future.cancel()
+        self._in_flight.clear()
+
+    async def __aenter__(self) -> "PageScheduler":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def submit(
+        self,
+        key,
+        image: np.ndarray,
+        source_lang: str,
+        target_lang: str,
+        extra_context: str = "",
+        use_gpu: bool = False,
+    ) -> asyncio.Future:
+        """
+        Queue a page for processing, waiting while the detect queue is full.
+
+        Returns:
+            Future resolving to the same dict as `process_full_pipeline`
+        """
+        page = _Page(key, image, source_lang, target_lang, extra_context, use_gpu)
+        self._in_flight.add(page.future)
+        page.future.add_done_callback(self._in_flight.discard)
+        await self.stages["detect"].queue.put(page)
+        return page.future
+
+    def stats(self) -> dict:
+        """Per-stage queue depth, worker occupancy and utilisation."""
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        return {name: stage.stats(elapsed) for name, stage in self.stages.items()}
+
+    async def _worker(self, stage: _Stage) -> None:
+        while True:
+            page = await stage.queue.get()
+            stage.busy += 1
+            started = time.monotonic()
+            try:
+                if not page.future.done():
+                    await stage.handler(page)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stage.failed += 1
+                if not page.future.done():
+                    page.future.set_exception(e)
+            finally:
+                stage.busy -= 1
+                stage.busy_time += time.monotonic() - started
+                stage.processed += 1
+                stage.queue.task_done()
+
+    # Stage handlers
+
+    async def _detect(self, page: _Page) -> None:
+        page.blk_list = await self.pipeline.detect_blocks_async(page.image)
+        await self.stages["ocr"].queue.put(page)
+        await self.stages["inpaint"].queue.put(page)
+
+    async def _ocr(self, page: _Page) -> None:
+        page.blk_list = await self.pipeline.process_ocr_async(
+            page.image, page.blk_list, page.source_lang
+        )
+        await self.stages["translate"].queue.put(page)
+
+    async def _translate(self, page: _Page) -> None:
+        page.blk_list = await self.pipeline.translate_blocks_async(
+            page.blk_list,
+            page.image,
+            page.source_lang,
+            page.target_lang,
+            page.extra_context,
+        )
+        await self._branch_done(page)
+
+    async def _inpaint(self, page: _Page) -> None:
+        page.inpainted_image = await self.pipeline.inpaint_image_async(
+            page.image, page.blk_list, page.use_gpu
+        )
+        await self._branch_done(page)
+
+    async def _branch_done(self, page: _Page) -> None:
+        page.pending_branches -= 1
+        if page.pending_branches == 0:
+            await self.stages["render"].queue.put(page)
+
+    async def _render(self, page: _Page) -> None:
+        final_image = await self.pipeline.render_text_async(
+            page.inpainted_image, page.blk_list
+        )
+        page.future.set_result(
+            {
+                "original_image": page.image,
+                "inpainted_image": page.inpainted_image,
+                "final_image": final_image,
+                "text_blocks": page.blk_list,
+            }
+        )
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+# Lane names
+CPU_LANE = "cpu"
+NETWORK_LANE = "network"
+
+
+class _Lane:
+    """A bounded worker pool plus the counters reported by `stats()`."""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"stage-{name}"
+        )
+        self.lock = threading.Lock()
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        with self.lock:
+            self.submitted += 1
+        return self.pool.submit(self._run, fn, *args, **kwargs)
+
+    def _run(self, fn: Callable, *args, **kwargs):
+        with self.lock:
+            self.running += 1
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            with self.lock:
+                self.failed += 1
+            raise
+        finally:
+            with self.lock:
+                self.running -= 1
+                self.completed += 1
+        return result
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self.running,
+                "queued": self.submitted - self.completed - self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+
+class StageExecutor:
+    """
+    Runs pipeline stages off the event loop.
+
+    Stages are dispatched to one of two lanes:
+    - `cpu`: model inference (detection, local OCR, inpainting, rendering)
+    - `network`: remote API calls (translation, cloud/LLM OCR)
+
+    Each lane is a thread pool with its own concurrency limit, so a slow LaMa
+    forward pass only occupies one CPU slot while translation requests keep
+    flowing through the network lane, and the event loop stays free for
+    other requests such as `/health`.
+    """
+
+    def __init__(self, config: dict = {}):
+        config = config or {}
+        self.lanes = {
+            CPU_LANE: _Lane(CPU_LANE, config.get("cpu_workers", 2)),
+            NETWORK_LANE: _Lane(NETWORK_LANE, config.get("network_workers", 8)),
+        }
+
+    def submit(self, lane: str, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Submit a stage to a lane from synchronous code.
+
+        Args:
+            lane: Lane name (`cpu` or `network`)
+            fn: Stage function
+            *args, **kwargs: Arguments for the stage function
+
+        Returns:
+            concurrent.futures.Future with the stage result
+        """
+        return self._lane(lane).submit(fn, *args, **kwargs)
+
+    async def run(self, lane: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a stage on a lane and await its result without blocking the loop.
+
+        Args:
+            lane: Lane name (`cpu` or `network`)
+            fn: Stage function
+            *args, **kwargs: Arguments for the stage function
+
+        Returns:
+            The stage result
+        """
+        future = self._lane(lane).submit(fn, *args, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        """Return the per-lane concurrency counters."""
+        return {name: lane.stats() for name, lane in self.lanes.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        for lane in self.lanes.values():
+            lane.pool.shutdown(wait=wait)
+
+    def _lane(self, lane: str) -> _Lane:
+        if lane not in self.lanes:
+            raise ValueError(f"Unknown executor lane: {lane}")
+        return self.lanes[lane]
@@ -24,3 +24,19 @@ class ProcessResponse(BaseModel):
     blocks: List[TextBlockData]
     status: str
     result_path: str = ""
+
+
+class BatchPageStatus(BaseModel):
+    name: str
+    status: str
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    batch_id: str
+    status: str
+    total_pages: int = 0
+    completed_pages: int = 0
+    failed_pages: int = 0
+    pages: List[BatchPageStatus] = []
+    result_path: str = ""
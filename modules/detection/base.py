@@ -3,8 +3,8 @@ import numpy as np
 from typing import Optional
 
 from ..utils.textblock import TextBlock
-from .utils.general import does_rectangle_fit, do_rectangles_overlap, \
-      filter_and_fix_bboxes, merge_overlapping_boxes
+from .utils.general import filter_and_fix_bboxes, merge_overlapping_boxes
+from .utils.geometry import assign_text_to_bubbles
 
 
 class DetectionEngine(ABC):
@@ -36,6 +36,39 @@ class DetectionEngine(ABC):
         """
         pass
         
+    def detect_boxes(self, image: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Detect raw boxes in an image, before they are turned into text blocks.
+        
+        Only needed by engines that return a `cache_signature`.
+        
+        Args:
+            image: Input image as numpy array
+            
+        Returns:
+            Tuple of (bubble_boxes, text_boxes) as numpy arrays
+        """
+        raise NotImplementedError
+        
+    def cache_signature(self) -> Optional[dict]:
+        """
+        Description of everything besides the image that affects the boxes
+        returned by `detect_boxes` (model, thresholds, slicing...).
+        
+        Returns:
+            JSON-serializable dictionary, or None if results must not be cached
+        """
+        return None
+        
+    def stats(self) -> dict:
+        """
+        Runtime statistics of the engine (batching, caching...).
+        
+        Returns:
+            Dictionary of statistics, empty if the engine keeps none
+        """
+        return {}
+        
     def create_text_blocks(self, image: np.ndarray, 
                           text_boxes: np.ndarray,
                           bubble_boxes: Optional[np.ndarray] = None) -> list[TextBlock]:
@@ -44,60 +77,30 @@ class DetectionEngine(ABC):
         bubble_boxes = filter_and_fix_bboxes(bubble_boxes, image.shape)
         text_boxes = merge_overlapping_boxes(text_boxes)
 
-        text_blocks = []
-        text_matched = [False] * len(text_boxes)  # Track matched text boxes
-        
         # Set bubble_boxes to empty array if None
         if bubble_boxes is None:
             bubble_boxes = np.array([])
         
-        # Process text boxes
-        if len(text_boxes) > 0:
-            for txt_idx, txt_box in enumerate(text_boxes):
-                
-                # If no bubble boxes, all text is free text
-                if len(bubble_boxes) == 0:
-                    text_blocks.append(
-                        TextBlock(
-                            text_bbox=txt_box,
-                            text_class='text_free',
-                        )
+        # Index of the first bubble that contains or overlaps each text box
+        bubble_indices = assign_text_to_bubbles(text_boxes, bubble_boxes)
+        
+        text_blocks = []
+        for txt_box, bble_idx in zip(text_boxes, bubble_indices):
+            if bble_idx >= 0:
+                # Text is inside or overlaps a bubble
+                text_blocks.append(
+                    TextBlock(
+                        text_bbox=txt_box,
+                        bubble_bbox=bubble_boxes[bble_idx],
+                        text_class='text_bubble',
                     )
-                    continue
-                
-                for bble_box in bubble_boxes:
-                    if bble_box is None:
-                        continue
-                    if does_rectangle_fit(bble_box, txt_box):
-                        # Text is inside a bubble
-                        text_blocks.append(
-                            TextBlock(
-                                text_bbox=txt_box,
-                                bubble_bbox=bble_box,
-                                text_class='text_bubble',
-                            )
-                        )
-                        text_matched[txt_idx] = True  
-                        break
-                    elif do_rectangles_overlap(bble_box, txt_box):
-                        # Text overlaps with a bubble
-                        text_blocks.append(
-                            TextBlock(
-                                text_bbox=txt_box,
-                                bubble_bbox=bble_box,
-                                text_class='text_bubble',
-                            )
-                        )
-                        text_matched[txt_idx] = True  
-                        break
-                
-                if not text_matched[txt_idx]:
-                    text_blocks.append(
-                        TextBlock(
-                            text_bbox=txt_box,
-                            text_class='text_free',
-                        )
+                )
+            else:
+                text_blocks.append(
+                    TextBlock(
+                        text_bbox=txt_box,
+                        text_class='text_free',
                     )
+                )
         
         return text_blocks
-    
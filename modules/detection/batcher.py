@@ -0,0 +1,115 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+class _Request:
+    __slots__ = ("item", "future", "enqueued_at")
+
+    def __init__(self, item: Any):
+        self.item = item
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent detection calls into batched forwards.
+
+    Callers from any thread submit single images. A background thread takes
+    the first waiting request, keeps collecting for up to `max_wait_ms` or
+    until `max_batch_size` images are queued, runs `batch_func` once on the
+    whole batch and hands every caller its own result.
+
+    `max_wait_ms` is the latency paid by a lone request in exchange for
+    larger batches under load; 0 still coalesces requests that are already
+    queued but never waits for more.
+    """
+
+    def __init__(
+        self,
+        batch_func: Callable[[list], list],
+        max_batch_size: int = 4,
+        max_wait_ms: float = 5.0,
+    ):
+        self.batch_func = batch_func
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+        self.batches = 0
+        self.items = 0
+        self.total_wait = 0.0
+
+    def submit(self, item: Any) -> Future:
+        """Queue one item, returning a Future with its result."""
+        request = _Request(item)
+        self._ensure_thread()
+        self._queue.put(request)
+        return request.future
+
+    def run_many(self, items: list) -> list:
+        """
+        Run several items through the batcher and wait for all results.
+
+        Items may end up in different batches, possibly mixed with items of
+        other callers. Drop-in replacement for `batch_func`.
+        """
+        futures = [self.submit(item) for item in items]
+        return [future.result() for future in futures]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+                "batches": self.batches,
+                "items": self.items,
+                "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+                "mean_wait_ms": self.total_wait / self.items * 1000 if self.items else 0.0,
+                "queued": self._queue.qsize(),
+            }
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="detection-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self) -> list[_Request]:
+        batch = [self._queue.get()]
+        deadline = batch[0].enqueued_at + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            started = time.monotonic()
+            try:
+                results = self.batch_func([request.item for request in batch])
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+            else:
+                for request, result in zip(batch, results):
+                    request.future.set_result(result)
+
+            with self._lock:
+                self.batches += 1
+                self.items += len(batch)
+                self.total_wait += sum(started - request.enqueued_at for request in batch)
@@ -29,6 +29,8 @@ class DetectionEngineFactory:
         # Map model names to factory methods
         engine_factories = {
             'RT-DETR-v2': cls._create_rtdetr_v2,
+            'RT-DETR-v2-ONNX': cls._create_rtdetr_v2_onnx,
+            'RT-DETR-v2-ONNX-INT8': lambda config: cls._create_rtdetr_v2_onnx(config, quantize=True),
         }
         
         # Get the appropriate factory method, defaulting to RT-DETR-V2
@@ -40,11 +42,34 @@ class DetectionEngineFactory:
         return engine
     
     @staticmethod
-    def _create_rtdetr_v2(config:dict):
+    def _rtdetr_v2_options(config:dict) -> dict:
+        """Options of `RTDetrV2Detection.initialize` shared by every RT-DETR-V2 backend."""
+        return {
+            'device': config.get('device', 'cpu'),
+            'confidence_threshold': config.get('confidence_threshold', 0.3),
+            'max_batch_size': config.get('max_batch_size', 4),
+            'batching': config.get('batching', False),
+            'batch_wait_ms': config.get('batch_wait_ms', 5.0),
+            'native_preprocess': config.get('native_preprocess', True),
+            'max_input_long_edge': config.get('max_input_long_edge', 0),
+            'refine_edges': config.get('refine_edges', False),
+            'tile_size': config.get('tile_size', 0),
+        }
+    
+    @classmethod
+    def _create_rtdetr_v2(cls, config:dict):
         """Create and initialize RT-DETR-V2 detection engine."""
         engine = RTDetrV2Detection()
-        device = config.get('device', 'cpu')
-        confidence_threshold = config.get('confidence_threshold', 0.3)
-        engine.initialize(device=device,confidence_threshold=confidence_threshold)
+        engine.initialize(**cls._rtdetr_v2_options(config))
+        return engine
+    
+    @classmethod
+    def _create_rtdetr_v2_onnx(cls, config:dict, quantize: bool = False):
+        """Create and initialize RT-DETR-V2 detection engine on ONNX Runtime."""
+        # Imported here so the default engine does not require onnxruntime
+        from .rtdetr_v2_onnx import RTDetrV2ONNXDetection
+
+        engine = RTDetrV2ONNXDetection()
+        engine.initialize(quantize=quantize, num_threads=config.get('num_threads', 0),
+                          **cls._rtdetr_v2_options(config))
         return engine
-    
\ No newline at end of file
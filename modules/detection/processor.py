@@ -1,5 +1,8 @@
+from typing import Optional
+
 import numpy as np
 
+from store.detection_cache import DetectionCache
 from ..utils.textblock import TextBlock
 from .factory import DetectionEngineFactory
 
@@ -9,8 +12,9 @@ class TextBlockDetectorProcessor:
     model for finding text blocks in images.
     """
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, cache: Optional[DetectionCache] = None):
         self.config = config
+        self.cache = cache
         self.engine = None
         self.model = "RT-DETR-V2"  # Default model
 
@@ -29,4 +33,21 @@ class TextBlockDetectorProcessor:
         if self.engine is None:
             raise ValueError("Detection engine not initialized")
 
-        return self.engine.detect(img)
+        signature = self.engine.cache_signature() if self.cache is not None else None
+        if signature is None:
+            return self.engine.detect(img)
+
+        # Repeated pages reuse the boxes found for the same pixels and config
+        key = self.cache.make_key(img, signature)
+        boxes = self.cache.get(key)
+        if boxes is None:
+            boxes = self.engine.detect_boxes(img)
+            self.cache.put(key, *boxes)
+        bubble_boxes, text_boxes = boxes
+        return self.engine.create_text_blocks(img, text_boxes, bubble_boxes)
+
+    def stats(self) -> dict:
+        stats = self.engine.stats() if self.engine is not None else {}
+        if self.cache is not None:
+            stats = dict(stats, cache=self.cache.stats())
+        return stats
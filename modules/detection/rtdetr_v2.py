@@ -1,4 +1,5 @@
 import os
+import threading
 import cv2
 import torch
 import numpy as np
@@ -8,6 +9,8 @@ from transformers import RTDetrV2ForObjectDetection, RTDetrImageProcessor
 from .base import DetectionEngine
 from ..utils.textblock import TextBlock
 from .utils.slicer import ImageSlicer
+from .utils.general import rescale_boxes, refine_boxes_to_content
+from .batcher import MicroBatcher
 
 
 current_file_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,6 +24,12 @@ class RTDetrV2Detection(DetectionEngine):
         self.processor = None
         self.device = 'cpu'
         self.confidence_threshold = 0.3
+        self.max_batch_size = 4
+        self.batcher = None
+        self.native_preprocess = True
+        self.max_input_long_edge = 0
+        self.refine_edges = False
+        self._buffers = threading.local()
         self.repo_name = 'ogkalu/comic-text-and-bubble-detector'  
         self.model_dir = os.path.join(project_root, 'models/detection')
         
@@ -33,16 +42,35 @@ class RTDetrV2Detection(DetectionEngine):
         )
         
     def initialize(self, device: str = 'cpu', 
-                  confidence_threshold: float = 0.3, **kwargs) -> None:
+                  confidence_threshold: float = 0.3,
+                  max_batch_size: int = 4, batching: bool = False,
+                  batch_wait_ms: float = 5.0, native_preprocess: bool = True,
+                  max_input_long_edge: int = 0, refine_edges: bool = False,
+                  tile_size: int = 0, **kwargs) -> None:
         self.device = device
         self.confidence_threshold = confidence_threshold
+        self.max_batch_size = max_batch_size
+        self.native_preprocess = native_preprocess
+        self.max_input_long_edge = max_input_long_edge
+        self.refine_edges = refine_edges
+        self.image_slicer.tile_size = tile_size
         
-        # Load model and processor
-        if self.model is None:
-            self.processor = RTDetrImageProcessor.from_pretrained(
-                self.repo_name,
-                size={"width": 640, "height": 640},
+        # Coalesce forwards of concurrent requests (pages and webtoon slices)
+        if batching:
+            self.batcher = MicroBatcher(
+                self._detect_batch,
+                max_batch_size=max_batch_size,
+                max_wait_ms=batch_wait_ms
             )
+        else:
+            self.batcher = None
+        
+        self._load_model()
+    
+    def _load_model(self) -> None:
+        """Load the model and processor once; subclasses load other runtimes."""
+        if self.model is None:
+            self.processor = self._load_processor()
             
             self.model = RTDetrV2ForObjectDetection.from_pretrained(
                 self.repo_name, 
@@ -52,14 +80,72 @@ class RTDetrV2Detection(DetectionEngine):
             if self.device == 'cuda' and torch.cuda.is_available():
                 self.model = self.model.to('cuda')
     
-    def detect(self, image: np.ndarray) -> list[TextBlock]:
-        # The slicer does not slice images below the width to height threshold
-        bubble_boxes, text_boxes = self.image_slicer.process_slices_for_detection(
-            image,
-            self._detect_single_image
+    def _load_processor(self) -> RTDetrImageProcessor:
+        return RTDetrImageProcessor.from_pretrained(
+            self.repo_name,
+            size={"width": 640, "height": 640},
         )
+    
+    def detect(self, image: np.ndarray) -> list[TextBlock]:
+        bubble_boxes, text_boxes = self.detect_boxes(image)
         return self.create_text_blocks(image, text_boxes, bubble_boxes)
     
+    def detect_boxes(self, image: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Run the model on a downscaled copy of very high resolution scans
+        scale = self._detection_scale(image)
+        if scale < 1:
+            detection_image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        else:
+            detection_image = image
+        
+        # The slicer only cuts tall, wide or (with tile_size) very large images
+        detect_batch = self.batcher.run_many if self.batcher else self._detect_batch
+        bubble_boxes, text_boxes = self.image_slicer.process_slices_for_batch_detection(
+            detection_image,
+            detect_batch,
+            max_batch_size=self.max_batch_size
+        )
+        
+        if scale < 1:
+            bubble_boxes = rescale_boxes(bubble_boxes, scale, image.shape)
+            text_boxes = rescale_boxes(text_boxes, scale, image.shape)
+            if self.refine_edges:
+                # Only the text box crops are read at full resolution
+                margin = int(np.ceil(1 / scale)) + 2
+                text_boxes = refine_boxes_to_content(text_boxes, image, margin)
+        
+        return bubble_boxes, text_boxes
+    
+    def cache_signature(self) -> dict:
+        return {
+            "engine": type(self).__name__,
+            "repo_name": self.repo_name,
+            "confidence_threshold": self.confidence_threshold,
+            "native_preprocess": self.native_preprocess,
+            "max_input_long_edge": self.max_input_long_edge,
+            "refine_edges": self.refine_edges,
+            "slicer": vars(self.image_slicer),
+        }
+    
+    def _detection_scale(self, image: np.ndarray) -> float:
+        """
+        Factor to resize the image by so that no frame fed to the model
+        (the whole page, or each slice or tile) has a long edge above
+        `max_input_long_edge`. Returns 1.0 when the mode is off.
+        """
+        if not self.max_input_long_edge:
+            return 1.0
+        
+        rows, columns = self.image_slicer.get_tile_grid(image)
+        long_edge = max(
+            max(end - start for start, end in rows),
+            max(end - start for start, end in columns),
+        )
+        return min(1.0, self.max_input_long_edge / long_edge)
+    
+    def stats(self) -> dict:
+        return {"batcher": self.batcher.stats()} if self.batcher else {}
+    
     def _detect_single_image(self, image: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """
         Performs detection on a single image and returns raw bounding boxes.
@@ -70,11 +156,23 @@ class RTDetrV2Detection(DetectionEngine):
         Returns:
             Tuple of (bubble_boxes, text_boxes) as numpy arrays
         """
-        # Convert OpenCV image (BGR) to PIL image (RGB)
-        pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        return self._detect_batch([image])[0]
+    
+    def _detect_batch(self, images: list[np.ndarray]) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        Performs detection on several images with a single forward pass.
         
-        # Prepare image for model
-        inputs = self.processor(images=pil_image, return_tensors="pt")
+        Every image is resized to the model input size by `_preprocess`, so
+        images of different sizes (e.g. the last webtoon slice) can share a batch.
+        
+        Args:
+            images: Input images in BGR format (OpenCV)
+            
+        Returns:
+            List of (bubble_boxes, text_boxes) tuples, one per image
+        """
+        pixel_values = torch.from_numpy(self._preprocess(images))
+        inputs = {"pixel_values": pixel_values}
         
         # Move inputs to device
         if self.device == "cuda" and torch.cuda.is_available():
@@ -85,17 +183,72 @@ class RTDetrV2Detection(DetectionEngine):
             outputs = self.model(**inputs)
 
         # Post-process results
-        target_sizes = torch.tensor([pil_image.size[::-1]])
+        target_sizes = torch.tensor([image.shape[:2] for image in images])
         if self.device == "cuda" and torch.cuda.is_available():
             target_sizes = target_sizes.to("cuda")
             
-        results = self.processor.post_process_object_detection(
+        batch_results = self.processor.post_process_object_detection(
             outputs, 
             target_sizes=target_sizes, 
             threshold=self.confidence_threshold
-        )[0]
+        )
 
-        # Create bounding boxes for each class
+        return [self._split_boxes(results) for results in batch_results]
+    
+    def _preprocess(self, images: list[np.ndarray]) -> np.ndarray:
+        """
+        Resize, rescale and normalize images into the model input batch.
+        
+        The native path resizes every BGR array with OpenCV and writes it,
+        channel-flipped to RGB, straight into a preallocated float32 buffer
+        reused across calls (one per thread), instead of going through PIL
+        and the processor. The returned array is only valid until the next
+        call from the same thread.
+        
+        Args:
+            images: Input images in BGR format (OpenCV)
+            
+        Returns:
+            Pixel values of shape (N, 3, height, width)
+        """
+        if not self.native_preprocess:
+            pil_images = [Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB)) for image in images]
+            return self.processor(images=pil_images, return_tensors="np")["pixel_values"]
+        
+        height, width = self.processor.size["height"], self.processor.size["width"]
+        pixel_values, resized = self._input_buffers(len(images), height, width)
+        scale = self.processor.rescale_factor if self.processor.do_rescale else 1.0
+        
+        for image, out in zip(images, pixel_values):
+            # Area interpolation when shrinking, close to PIL's antialiased resize
+            shrinking = image.shape[0] > height or image.shape[1] > width
+            interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR
+            cv2.resize(image, (width, height), dst=resized, interpolation=interpolation)
+            # HWC BGR -> CHW RGB, rescaled on the way into the batch buffer
+            np.multiply(resized.transpose(2, 0, 1)[::-1], scale, out=out, casting='unsafe')
+        
+        if self.processor.do_normalize:
+            mean = np.asarray(self.processor.image_mean, dtype=np.float32)[:, None, None]
+            std = np.asarray(self.processor.image_std, dtype=np.float32)[:, None, None]
+            pixel_values -= mean
+            pixel_values /= std
+        
+        return pixel_values
+    
+    def _input_buffers(self, batch_size: int, height: int, width: int) -> tuple[np.ndarray, np.ndarray]:
+        """Thread-local (pixel_values, resized image) buffers, grown on demand."""
+        pixel_values = getattr(self._buffers, 'pixel_values', None)
+        if (pixel_values is None or pixel_values.shape[0] < batch_size
+                or pixel_values.shape[2:] != (height, width)):
+            capacity = max(batch_size, self.max_batch_size)
+            pixel_values = np.empty((capacity, 3, height, width), dtype=np.float32)
+            self._buffers.pixel_values = pixel_values
+            self._buffers.resized = np.empty((height, width, 3), dtype=np.uint8)
+        return pixel_values[:batch_size], self._buffers.resized
+    
+    @staticmethod
+    def _split_boxes(results: dict) -> tuple[np.ndarray, np.ndarray]:
+        """Split the post-processed detections of one image into bubble and text boxes."""
         bubble_boxes = []
         text_boxes = []
         
@@ -114,4 +267,3 @@ class RTDetrV2Detection(DetectionEngine):
         text_boxes = np.array(text_boxes) if text_boxes else np.array([])
         
         return bubble_boxes, text_boxes
-    
@@ -0,0 +1,189 @@
+import os
+import tempfile
+from contextlib import contextmanager
+import numpy as np
+import onnxruntime as ort
+
+from .rtdetr_v2 import RTDetrV2Detection
+
+
+@contextmanager
+def _atomic_output(path: str):
+    """
+    Yield a temporary path next to `path`, moved into place only once the
+    block completes, so an interrupted or concurrent export never leaves a
+    truncated model at `path`.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.onnx.tmp')
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class RTDetrV2ONNXDetection(RTDetrV2Detection):
+    """
+    RT-DETR-V2 detection engine running on ONNX Runtime.
+
+    The Hugging Face model is exported to ONNX on first use (optionally with
+    int8 dynamic quantization) and cached under `models/detection`, so CPU-only
+    hosts skip the PyTorch forward at inference time. Slicing, batching and
+    box post-processing are shared with `RTDetrV2Detection`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.session = None
+        self.quantize = False
+        self.num_threads = 0
+        self.model_path = None
+
+    def initialize(self, quantize: bool = False, num_threads: int = 0, **kwargs) -> None:
+        """
+        Args:
+            quantize: Run the int8 dynamically quantized model
+            num_threads: ONNX Runtime intra-op threads (0 = runtime default)
+            **kwargs: Options of `RTDetrV2Detection.initialize`
+        """
+        self.quantize = quantize
+        self.num_threads = num_threads
+        super().initialize(**kwargs)
+
+    def _load_model(self) -> None:
+        if self.session is None:
+            self.processor = self._load_processor()
+            self.model_path = self.export(quantize=self.quantize)
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            if self.num_threads:
+                options.intra_op_num_threads = self.num_threads
+
+            providers = ['CPUExecutionProvider']
+            if self.device == 'cuda' and 'CUDAExecutionProvider' in ort.get_available_providers():
+                providers.insert(0, 'CUDAExecutionProvider')
+
+            self.session = ort.InferenceSession(self.model_path, options, providers=providers)
+
+    def cache_signature(self) -> dict:
+        return dict(super().cache_signature(), quantize=self.quantize)
+
+    def export(self, quantize: bool = False, opset: int = 17) -> str:
+        """
+        Export the Hugging Face detector to ONNX if the artefact does not exist yet.
+
+        Args:
+            quantize: Also produce (and return) an int8 dynamically quantized model
+            opset: ONNX opset version
+
+        Returns:
+            Path of the ONNX model to load
+        """
+        fp32_path = os.path.join(self.model_dir, 'rtdetr-v2.onnx')
+        int8_path = os.path.join(self.model_dir, 'rtdetr-v2-int8.onnx')
+
+        if not os.path.exists(fp32_path):
+            import torch
+            from transformers import RTDetrV2ForObjectDetection
+
+            os.makedirs(self.model_dir, exist_ok=True)
+            model = RTDetrV2ForObjectDetection.from_pretrained(self.repo_name).eval()
+
+            class _Wrapper(torch.nn.Module):
+                # Only keep the outputs used by post-processing
+                def __init__(self, model):
+                    super().__init__()
+                    self.model = model
+
+                def forward(self, pixel_values):
+                    outputs = self.model(pixel_values=pixel_values)
+                    return outputs.logits, outputs.pred_boxes
+
+            dummy = torch.randn(1, 3, 640, 640)
+            with _atomic_output(fp32_path) as tmp_path:
+                torch.onnx.export(
+                    _Wrapper(model),
+                    (dummy,),
+                    tmp_path,
+                    input_names=['pixel_values'],
+                    output_names=['logits', 'pred_boxes'],
+                    dynamic_axes={
+                        'pixel_values': {0: 'batch'},
+                        'logits': {0: 'batch'},
+                        'pred_boxes': {0: 'batch'},
+                    },
+                    opset_version=opset,
+                    # TorchScript exporter: the dynamo one needs onnxscript
+                    dynamo=False,
+                )
+
+        if not quantize:
+            return fp32_path
+
+        if not os.path.exists(int8_path):
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            with _atomic_output(int8_path) as tmp_path:
+                quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+
+        return int8_path
+
+    def _detect_batch(self, images: list[np.ndarray]) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        Performs detection on several images with a single ONNX Runtime run.
+
+        Args:
+            images: Input images in BGR format (OpenCV)
+
+        Returns:
+            List of (bubble_boxes, text_boxes) tuples, one per image
+        """
+        pixel_values = self._preprocess(images)
+
+        logits, pred_boxes = self.session.run(
+            ['logits', 'pred_boxes'],
+            {'pixel_values': pixel_values.astype(np.float32, copy=False)}
+        )
+
+        target_sizes = [image.shape[:2] for image in images]
+        batch_results = self.post_process(logits, pred_boxes, target_sizes, self.confidence_threshold)
+        return [self._split_boxes(results) for results in batch_results]
+
+    @staticmethod
+    def post_process(logits: np.ndarray, pred_boxes: np.ndarray,
+                     target_sizes: list[tuple[int, int]], threshold: float) -> list[dict]:
+        """
+        NumPy port of `RTDetrImageProcessor.post_process_object_detection`
+        (focal-loss scoring, top-k over queries × classes).
+
+        Args:
+            logits: (B, Q, C) class logits
+            pred_boxes: (B, Q, 4) normalized (cx, cy, w, h) boxes
+            target_sizes: (height, width) of every original image
+            threshold: Minimum score to keep a detection
+
+        Returns:
+            List of dicts with 'scores', 'labels' and 'boxes' arrays, one per image
+        """
+        cx, cy, w, h = np.moveaxis(pred_boxes, -1, 0)
+        boxes = np.stack([cx - 0.5 * w, cy - 0.5 * h, cx + 0.5 * w, cy + 0.5 * h], axis=-1)
+
+        num_queries, num_classes = logits.shape[1:]
+        scores = 1 / (1 + np.exp(-logits.reshape(len(logits), -1)))
+
+        results = []
+        for image_scores, image_boxes, (height, width) in zip(scores, boxes, target_sizes):
+            index = np.argsort(-image_scores, kind='stable')[:num_queries]
+            top_scores = image_scores[index]
+            labels = index % num_classes
+            top_boxes = image_boxes[index // num_classes] * np.array([width, height, width, height])
+
+            keep = top_scores > threshold
+            results.append({
+                'scores': top_scores[keep],
+                'labels': labels[keep],
+                'boxes': top_boxes[keep],
+            })
+        return results
@@ -5,6 +5,13 @@ import numpy as np
 import cv2
 import largestinteriorrectangle as lir
 from modules.utils.textblock import adjust_text_line_coordinates
+from .geometry import (
+    as_boxes,
+    pairwise_iou,
+    pairwise_fits,
+    pairwise_mostly_contained,
+    mutually_contained,
+)
 
 
 def calculate_iou(rect1, rect2) -> float:
@@ -18,21 +25,7 @@ def calculate_iou(rect1, rect2) -> float:
     Returns:
         IoU value as a float
     """
-    x1 = max(rect1[0], rect2[0])
-    y1 = max(rect1[1], rect2[1])
-    x2 = min(rect1[2], rect2[2])
-    y2 = min(rect1[3], rect2[3])
-    
-    intersection_area = max(0, x2 - x1) * max(0, y2 - y1)
-    
-    rect1_area = (rect1[2] - rect1[0]) * (rect1[3] - rect1[1])
-    rect2_area = (rect2[2] - rect2[0]) * (rect2[3] - rect2[1])
-    
-    union_area = rect1_area + rect2_area - intersection_area
-    
-    iou = intersection_area / union_area if union_area != 0 else 0
-    
-    return iou
+    return float(pairwise_iou([rect1], [rect2])[0, 0])
 
 
 def do_rectangles_overlap(rect1, rect2, iou_threshold: float = 0.2) -> bool:
@@ -62,18 +55,7 @@ def does_rectangle_fit(bigger_rect, smaller_rect) -> bool:
     Returns:
         True if smaller_rect fits inside bigger_rect
     """
-    x1, y1, x2, y2 = bigger_rect
-    px1, py1, px2, py2 = smaller_rect
-    
-    # Ensure the coordinates are properly ordered
-    left1, top1, right1, bottom1 = min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
-    left2, top2, right2, bottom2 = min(px1, px2), min(py1, py2), max(px1, px2), max(py1, py2)
-    
-    # Check if the second rectangle fits within the first
-    fits_horizontally = left1 <= left2 and right1 >= right2
-    fits_vertically = top1 <= top2 and bottom1 >= bottom2
-    
-    return fits_horizontally and fits_vertically
+    return bool(pairwise_fits([bigger_rect], [smaller_rect])[0, 0])
 
 
 def filter_and_fix_bboxes(bboxes, image_shape=None, width_tolerance=5, height_tolerance=5):
@@ -193,6 +175,77 @@ def detect_content_in_bbox(image):
     
     return content_bboxes
 
+def rescale_boxes(bboxes, scale: float, image_shape=None) -> np.ndarray:
+    """
+    Map boxes detected on a downscaled image back to original coordinates.
+    
+    Boxes are rounded outwards so the rescaled box never cuts into the
+    detected region, then clamped to the original image.
+    
+    Args:
+        bboxes: array-like of boxes [[x1, y1, x2, y2], …] on the downscaled image
+        scale: factor the original image was resized by (< 1 for downscaling)
+        image_shape: optional tuple (img_h, img_w) of the original image
+    
+    Returns:
+        np.ndarray of int boxes in original image coordinates
+    """
+    boxes = np.asarray(bboxes, dtype=np.float64)
+    if boxes.size == 0:
+        return np.asarray(bboxes)
+    
+    boxes = boxes.reshape(-1, 4) / scale
+    boxes[:, :2] = np.floor(boxes[:, :2])
+    boxes[:, 2:] = np.ceil(boxes[:, 2:])
+    if image_shape is not None:
+        img_h, img_w = image_shape[:2]
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, img_w)
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, img_h)
+    return boxes.astype(int)
+
+def refine_boxes_to_content(bboxes, image, margin: int, iou_threshold: float = 0.5) -> np.ndarray:
+    """
+    Snap upscaled text boxes to the text content of the full-resolution image.
+    
+    Each box is grown by `margin` pixels, the content inside the grown crop is
+    found with `detect_content_in_bbox`, and the box is replaced by the tight
+    bounds of that content. Boxes whose refined version drifts too far from
+    the original (IoU below `iou_threshold`) are left unchanged.
+    
+    Args:
+        bboxes: array-like of boxes [[x1, y1, x2, y2], …] in image coordinates
+        image: Full resolution image
+        margin: Pixels added around every box before looking for content,
+                at least the rounding error of the upscaling
+        iou_threshold: Minimum IoU between original and refined box
+    
+    Returns:
+        np.ndarray of refined boxes
+    """
+    boxes = np.asarray(bboxes)
+    if boxes.size == 0:
+        return boxes
+    
+    img_h, img_w = image.shape[:2]
+    refined = boxes.reshape(-1, 4).astype(int)
+    for i, (x1, y1, x2, y2) in enumerate(refined.copy()):
+        cx1, cy1 = max(0, x1 - margin), max(0, y1 - margin)
+        cx2, cy2 = min(img_w, x2 + margin), min(img_h, y2 + margin)
+        content = detect_content_in_bbox(image[cy1:cy2, cx1:cx2])
+        if not content:
+            continue
+        
+        content = np.array(content)
+        candidate = [
+            cx1 + content[:, 0].min(),
+            cy1 + content[:, 1].min(),
+            cx1 + content[:, 2].max(),
+            cy1 + content[:, 3].max(),
+        ]
+        if calculate_iou([x1, y1, x2, y2], candidate) >= iou_threshold:
+            refined[i] = candidate
+    return refined
+
 def get_inpaint_bboxes(text_bbox, image):
     """
     Get inpaint bounding boxes for a text region.
@@ -230,22 +283,7 @@ def is_mostly_contained(outer_box, inner_box, threshold):
     :param threshold: The proportion of inner_box that must be inside outer_box
     :return: Boolean indicating if inner_box is mostly contained in outer_box
     """
-    ix1, iy1, ix2, iy2 = inner_box
-    ox1, oy1, ox2, oy2 = outer_box
-    
-    # Calculate the area of the inner and outer boxes
-    inner_area = (ix2 - ix1) * (iy2 - iy1)
-    outer_area = (ox2 - ox1) * (oy2 - oy1)
-    
-    # Return False if the outer box is smaller than the inner box
-    if outer_area < inner_area or inner_area == 0:
-        return False
-    
-    # Calculate the area of intersection
-    intersection_area = max(0, min(ix2, ox2) - max(ix1, ox1)) * max(0, min(iy2, oy2) - max(iy1, oy1))
-    
-    # Check if the proportion of intersection to inner area is greater than the threshold
-    return intersection_area / inner_area >= threshold
+    return bool(pairwise_mostly_contained([outer_box], [inner_box], threshold)[0, 0])
 
 def adjust_contrast_brightness(img: np.ndarray, contrast: float = 1.0, brightness: int = 0):
     """
@@ -383,37 +421,46 @@ def merge_overlapping_boxes(bboxes: np.ndarray,
     Merge boxes that are mostly contained within each other, and
     prune out duplicates/overlaps immediately as you go.
     """
+    bboxes = as_boxes(bboxes)
     accepted = []
 
     for i, box in enumerate(bboxes):
-        # 1) Merge this box against all others based on containment:
+        # 1) Merge this box against all others based on containment.
+        # `merged` grows as boxes are absorbed, so instead of testing the
+        # boxes one by one we test all remaining boxes against the current
+        # `merged` and absorb the hits in order. The hits stay valid until
+        # absorbing a box actually changes `merged`, then we rescan from
+        # the next index.
         merged = box.copy()
-        for j, other in enumerate(bboxes):
-            if i == j:
-                continue
-            if (is_mostly_contained(merged, other, containment_threshold)
-             or is_mostly_contained(other, merged, containment_threshold)):
-                merged = merge_boxes(merged, other)
-
-        # 2) On-the-fly pruning: see if `merged` overlaps or duplicates any accepted box
-        conflict = False
-        for acc in accepted:
-            if np.array_equal(merged, acc) or do_rectangles_overlap(merged, acc, overlap_threshold):
-                conflict = True
+        start = 0
+        while start < len(bboxes):
+            hits = mutually_contained(merged, bboxes[start:], containment_threshold)
+            if i >= start:
+                hits[i - start] = False
+            rescan = False
+            for j in start + np.flatnonzero(hits):
+                grown = np.concatenate(
+                    [np.minimum(merged[:2], bboxes[j, :2]), np.maximum(merged[2:], bboxes[j, 2:])]
+                )
+                if not np.array_equal(grown, merged):
+                    merged = grown
+                    start = j + 1
+                    rescan = True
+                    break
+            if not rescan:
                 break
 
-        if conflict:
-            # skip this one entirely
-            continue
-
-        # 3) Optionally, remove any already-accepted boxes that overlap too much with the new merged box
-        accepted = [
-            acc for acc in accepted
-            if not (np.array_equal(acc, merged)
-                    or do_rectangles_overlap(merged, acc, overlap_threshold))
-        ]
+        # 2) On-the-fly pruning: skip `merged` if it duplicates or overlaps
+        # any accepted box. Otherwise no accepted box overlaps it either, so
+        # there is nothing to remove before accepting it.
+        if accepted:
+            accepted_boxes = np.array(accepted)
+            conflict = (accepted_boxes == merged).all(axis=1) | (
+                pairwise_iou([merged], accepted_boxes)[0] >= overlap_threshold
+            )
+            if conflict.any():
+                continue
 
-        # 4) Finally accept the new box
         accepted.append(merged)
 
-    return np.array(accepted)
\ No newline at end of file
+    return np.array(accepted)
@@ -1,12 +1,15 @@
 import math
 import numpy as np
 from typing import Callable, Any
-from .general import calculate_iou
 
 
 class ImageSlicer:
     """
     Utility class to handle slicing extremely tall images (Webtoons) for object detection and recombining results.
+    
+    Wide images (double-page spreads, panoramas) and, if `tile_size` is set,
+    very large pages are cut into a grid of overlapping tiles instead, and
+    the same merge rules are applied along both axes.
     """
     
     def __init__(self, 
@@ -17,7 +20,10 @@ class ImageSlicer:
                  merge_iou_threshold: float = 0.2,
                  duplicate_iou_threshold: float = 0.5,
                  merge_y_distance_threshold: float = 0.1,
-                 containment_threshold: float = 0.85):  
+                 containment_threshold: float = 0.85,
+                 width_to_height_ratio_threshold: float = 1.3,
+                 target_tile_ratio: float = 1.0,
+                 tile_size: int = 0):  
         """
         Initialize the image slicer with configuration parameters.
         
@@ -32,6 +38,9 @@ class ImageSlicer:
             merge_y_distance_threshold: Maximum distance (relative to image height) 
                                       between boxes to be considered for merging
             containment_threshold: Threshold for determining if one box is contained within another
+            width_to_height_ratio_threshold: Aspect ratio threshold to cut wide images into columns
+            target_tile_ratio: Desired width/height ratio of each column of a wide image
+            tile_size: Maximum tile edge in pixels for 2-D tiling of large images (0 disables)
         """
         self.height_to_width_ratio_threshold = height_to_width_ratio_threshold
         self.target_slice_ratio = target_slice_ratio
@@ -41,12 +50,75 @@ class ImageSlicer:
         self.duplicate_iou_threshold = duplicate_iou_threshold
         self.merge_y_distance_threshold = merge_y_distance_threshold
         self.containment_threshold = containment_threshold
+        self.width_to_height_ratio_threshold = width_to_height_ratio_threshold
+        self.target_tile_ratio = target_tile_ratio
+        self.tile_size = tile_size
         
-    def should_slice(self, image: np.ndarray) -> bool:
+    def is_tall(self, image: np.ndarray) -> bool:
         height, width = image.shape[:2]
         aspect_ratio = height / width
         return aspect_ratio > self.height_to_width_ratio_threshold
     
+    def should_slice(self, image: np.ndarray) -> bool:
+        if self.is_tall(image):
+            return True
+        rows, columns = self.get_tile_grid(image)
+        return len(rows) * len(columns) > 1
+    
+    def get_tile_grid(self, image: np.ndarray) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """
+        Row and column spans of the detection tiles.
+        
+        Tall images keep the webtoon slicing (full-width rows). Other images
+        are cut into columns when wider than `width_to_height_ratio_threshold`,
+        and into tiles of at most `tile_size` pixels if set.
+        
+        Args:
+            image: Input image as numpy array
+            
+        Returns:
+            Tuple of (row spans, column spans) as (start, end) pairs
+        """
+        height, width = image.shape[:2]
+        
+        if self.is_tall(image):
+            _, slice_height, effective_slice_height, _ = self.calculate_slice_params(image)
+            rows = []
+            for slice_number in range(math.ceil(height / effective_slice_height)):
+                start_y = slice_number * effective_slice_height
+                if slice_number == math.ceil(height / effective_slice_height) - 1:
+                    end_y = height
+                else:
+                    end_y = min(start_y + slice_height, height)
+                rows.append((start_y, end_y))
+            return rows, [(0, width)]
+        
+        tile_height, tile_width = height, width
+        if width / height > self.width_to_height_ratio_threshold:
+            tile_width = int(height * self.target_tile_ratio)
+        if self.tile_size:
+            tile_height = min(tile_height, self.tile_size)
+            tile_width = min(tile_width, self.tile_size)
+        
+        rows = self._axis_spans(height, tile_height, self.overlap_height_ratio)
+        columns = self._axis_spans(width, tile_width, self.overlap_height_ratio)
+        return rows, columns
+    
+    @staticmethod
+    def _axis_spans(length: int, tile_length: int, overlap_ratio: float) -> list[tuple[int, int]]:
+        """
+        Cut an axis into equally sized, evenly spaced tiles that overlap by at
+        least `overlap_ratio` of `tile_length`.
+        """
+        if length <= tile_length or tile_length <= 0:
+            return [(0, length)]
+        
+        overlap = int(tile_length * overlap_ratio)
+        num_tiles = math.ceil((length - overlap) / (tile_length - overlap))
+        tile_length = math.ceil((length + (num_tiles - 1) * overlap) / num_tiles)
+        starts = [round(k * (length - tile_length) / (num_tiles - 1)) for k in range(num_tiles)]
+        return [(start, start + tile_length) for start in starts]
+    
     def calculate_slice_params(self, image: np.ndarray) -> tuple[int, int, int, int]:
         height, width = image.shape[:2]
         
@@ -98,13 +170,14 @@ class ImageSlicer:
         
         return slice_image, start_y, end_y
     
-    def adjust_box_coordinates(self, boxes: np.ndarray, start_y: int) -> np.ndarray:
+    def adjust_box_coordinates(self, boxes: np.ndarray, start_y: int, start_x: int = 0) -> np.ndarray:
         """
         Adjust box coordinates to match original image.
         
         Args:
             boxes: Array of boxes in format [x1, y1, x2, y2]
             start_y: Y-coordinate offset for this slice
+            start_x: X-coordinate offset for this tile
             
         Returns:
             Adjusted boxes
@@ -115,6 +188,9 @@ class ImageSlicer:
         adjusted_boxes = boxes.copy()
         adjusted_boxes[:, 1] += start_y  # y1
         adjusted_boxes[:, 3] += start_y  # y2
+        if start_x:
+            adjusted_boxes[:, 0] += start_x  # x1
+            adjusted_boxes[:, 2] += start_x  # x2
         return adjusted_boxes
     
     def box_contained(self, box1: list[float], box2: list[float]) -> tuple[bool, float, int]:
@@ -157,12 +233,101 @@ class ImageSlicer:
         
         return False, containment_ratio, 0
     
+    def _merge_pair(self, box1: list, box2: list, y_distance_threshold: float):
+        """
+        Decide whether box2 is merged into box1.
+        
+        Args:
+            box1: The box being grown, [x1, y1, x2, y2]
+            box2: A later box, [x1, y1, x2, y2]
+            y_distance_threshold: Vertical merge distance in pixels
+            
+        Returns:
+            None if box2 is kept, otherwise the new value of box1 (box2 is dropped)
+        """
+        # Calculate box dimensions
+        box1_width = box1[2] - box1[0]
+        box1_height = box1[3] - box1[1]
+        box2_width = box2[2] - box2[0]
+        box2_height = box2[3] - box2[1]
+        box1_area = box1_width * box1_height
+        box2_area = box2_width * box2_height
+        
+        intersection_x1 = max(box1[0], box2[0])
+        intersection_y1 = max(box1[1], box2[1])
+        intersection_x2 = min(box1[2], box2[2])
+        intersection_y2 = min(box1[3], box2[3])
+        
+        if intersection_x2 > intersection_x1 and intersection_y2 > intersection_y1:
+            intersection_area = (intersection_x2 - intersection_x1) * (intersection_y2 - intersection_y1)
+            
+            # Case 1: One box is mostly contained within the other (see `box_contained`)
+            containment_ratio = intersection_area / min(box1_area, box2_area)
+            if containment_ratio >= self.containment_threshold:
+                # Keep the larger box
+                return box1 if box1_area > box2_area else box2
+        else:
+            intersection_area = 0
+        
+        # Case 2: High IoU - likely the same object detected twice (duplicate)
+        union_area = box1_area + box2_area - intersection_area
+        iou = intersection_area / union_area if union_area != 0 else 0
+        if iou >= self.duplicate_iou_threshold:
+            # Choose the larger box (which often has better coverage of the object)
+            return box2 if box2_area > box1_area else box1
+        
+        # Calculate vertical distance between boxes
+        y_dist = min(abs(box1[1] - box2[3]), abs(box1[3] - box2[1]))
+        
+        # Calculate horizontal overlap
+        x_overlap = max(0, min(box1[2], box2[2]) - max(box1[0], box2[0]))
+        x_overlap_ratio = x_overlap / min(box1_width, box2_width) if min(box1_width, box2_width) > 0 else 0
+        
+        # Calculate size ratio to prevent merging very different sized boxes
+        size_ratio = min(box1_area, box2_area) / max(box1_area, box2_area) if max(box1_area, box2_area) > 0 else 0
+        
+        # Case 3: Boxes likely part of the same object across slices
+        # More strict conditions to prevent over-merging
+        if (y_dist < y_distance_threshold and  # Close vertically
+            x_overlap_ratio > self.merge_iou_threshold and  # Sufficient horizontal overlap
+            size_ratio > 0.3 and  # Similar size (prevent merging very different sized boxes)
+            # Check that boxes are not too far apart horizontally
+            abs(box1[0] - box2[0]) < 0.5 * max(box1_width, box2_width) and
+            abs(box1[2] - box2[2]) < 0.5 * max(box1_width, box2_width)):
+            
+            # Merge the boxes
+            merged_box = [
+                min(box1[0], box2[0]),
+                min(box1[1], box2[1]),
+                max(box1[2], box2[2]),
+                max(box1[3], box2[3])
+            ]
+            
+            # Additional check: Don't allow merged boxes to get too large
+            merged_width = merged_box[2] - merged_box[0]
+            merged_height = merged_box[3] - merged_box[1]
+            merged_area = merged_width * merged_height
+            
+            # If merged box is more than 3x larger than either original box, don't merge
+            if merged_area > 3 * max(box1_area, box2_area):
+                return None
+            return merged_box
+        
+        return None
+    
     def merge_overlapping_boxes(self, boxes: np.ndarray, class_ids: np.ndarray = None, 
                                image_height: int = 1) -> tuple[np.ndarray, np.ndarray]:
         """
         Merge boxes that are likely part of the same object across slices and
         remove duplicate detections from overlapping slices.
         
+        Every box is grown by absorbing the later boxes it merges with, in list
+        order. Two boxes can only merge if they overlap or are less than
+        `merge_y_distance_threshold` apart vertically, so instead of comparing
+        every pair this sweeps a y-sorted index and only compares each box with
+        the later boxes inside its vertical window. Results are identical to
+        `merge_overlapping_boxes_naive`.
+        
         Args:
             boxes: Array of boxes in format [x1, y1, x2, y2]
             class_ids: Array of class IDs corresponding to each box
@@ -173,6 +338,82 @@ class ImageSlicer:
         """
         if boxes.size == 0:
             return boxes, np.array([]) if class_ids is not None else boxes
+        
+        # Calculate distance threshold in pixels
+        y_distance_threshold = self.merge_y_distance_threshold * image_height
+        
+        # The window argument needs well-formed boxes and thresholds that
+        # require an actual overlap; anything else takes the reference path
+        if (y_distance_threshold < 0 or self.duplicate_iou_threshold <= 0
+                or self.merge_iou_threshold < 0
+                or np.any(boxes[:, 2] < boxes[:, 0]) or np.any(boxes[:, 3] < boxes[:, 1])):
+            return self.merge_overlapping_boxes_naive(boxes, class_ids, image_height)
+        
+        box_list = boxes.tolist()
+        class_list = class_ids.tolist() if class_ids is not None else None
+        n = len(box_list)
+        alive = [True] * n
+        
+        # Boxes sorted by top edge. A box with top edge y1 can only reach down
+        # to y1 + max_height, which bounds the range searched for a window.
+        order = np.argsort(boxes[:, 1], kind='stable')
+        sorted_y1 = boxes[order, 1]
+        y2 = boxes[:, 3]
+        max_height = float(np.max(boxes[:, 3] - boxes[:, 1]))
+        
+        def candidates(box: list, after: int) -> list[int]:
+            # Later boxes whose vertical extent intersects (y1 - T, y2 + T).
+            # The window is padded by a pixel so float rounding can only add
+            # candidates, never drop one.
+            low = box[1] - y_distance_threshold - 1
+            high = box[3] + y_distance_threshold + 1
+            start = np.searchsorted(sorted_y1, low - max_height, side='left')
+            stop = np.searchsorted(sorted_y1, high, side='left')
+            found = order[start:stop]
+            found = found[(found > after) & (y2[found] > low)]
+            return np.sort(found).tolist()
+        
+        for i in range(n):
+            if not alive[i]:
+                continue
+            
+            box_i = box_list[i]
+            pending = candidates(box_i, i)
+            while pending:
+                j = pending.pop(0)
+                if not alive[j]:
+                    continue
+                # Only merge boxes with same class ID if class_ids is provided
+                if class_list is not None and class_list[i] != class_list[j]:
+                    continue
+                
+                new_box = self._merge_pair(box_i, box_list[j], y_distance_threshold)
+                if new_box is None:
+                    continue
+                
+                alive[j] = False
+                if new_box is not box_i:
+                    # The window moved, look again at the boxes after j
+                    box_i = new_box
+                    pending = candidates(box_i, j)
+            box_list[i] = box_i
+        
+        merged_boxes = np.array([box for box, keep in zip(box_list, alive) if keep])
+        merged_class_ids = (
+            np.array([c for c, keep in zip(class_list, alive) if keep])
+            if class_ids is not None else None
+        )
+        
+        return merged_boxes, merged_class_ids
+    
+    def merge_overlapping_boxes_naive(self, boxes: np.ndarray, class_ids: np.ndarray = None, 
+                                      image_height: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Reference implementation of `merge_overlapping_boxes` that compares
+        every pair of boxes. Kept for parity checks and benchmarks.
+        """
+        if boxes.size == 0:
+            return boxes, np.array([]) if class_ids is not None else boxes
             
         # Convert to list for easier manipulation
         box_list = boxes.tolist()
@@ -189,95 +430,16 @@ class ImageSlicer:
                 if class_ids is not None and class_list[i] != class_list[j]:
                     j += 1
                     continue
-                    
-                box1 = box_list[i]
-                box2 = box_list[j]
-                
-                # Calculate IoU to identify duplicates or highly overlapping boxes
-                iou = calculate_iou(box1, box2)
-                
-                # Calculate box dimensions
-                box1_width = box1[2] - box1[0]
-                box1_height = box1[3] - box1[1]
-                box2_width = box2[2] - box2[0]
-                box2_height = box2[3] - box2[1]
-                box1_area = box1_width * box1_height
-                box2_area = box2_width * box2_height
-                
-                # Check for containment (one box mostly inside another)
-                is_contained, containment_ratio, which_contains = self.box_contained(box1, box2)
-                
-                # Case 1: One box is mostly contained within the other
-                if is_contained:
-                    # Keep the larger box
-                    if which_contains == 1:  # box1 contains box2
-                        # Remove box2
-                        box_list.pop(j)
-                        if class_ids is not None:
-                            class_list.pop(j)
-                    else:  # box2 contains box1
-                        # Replace box1 with box2 and remove box2
-                        box_list[i] = box2
-                        box_list.pop(j)
-                        if class_ids is not None:
-                            class_list.pop(j)
-                    continue
                 
-                # Case 2: High IoU - likely the same object detected twice (duplicate)
-                if iou >= self.duplicate_iou_threshold:
-                    # Choose the larger box (which often has better coverage of the object)
-                    if box2_area > box1_area:
-                        box_list[i] = box2  # Keep the larger box
-                    
-                    # Remove the duplicate
-                    box_list.pop(j)
-                    if class_ids is not None:
-                        class_list.pop(j)
+                new_box = self._merge_pair(box_list[i], box_list[j], y_distance_threshold)
+                if new_box is None:
+                    j += 1
                     continue
                 
-                # Calculate vertical distance between boxes
-                y_dist = min(abs(box1[1] - box2[3]), abs(box1[3] - box2[1]))
-                
-                # Calculate horizontal overlap
-                x_overlap = max(0, min(box1[2], box2[2]) - max(box1[0], box2[0]))
-                x_overlap_ratio = x_overlap / min(box1_width, box2_width) if min(box1_width, box2_width) > 0 else 0
-                
-                # Calculate size ratio to prevent merging very different sized boxes
-                size_ratio = min(box1_area, box2_area) / max(box1_area, box2_area) if max(box1_area, box2_area) > 0 else 0
-                
-                # Case 3: Boxes likely part of the same object across slices
-                # More strict conditions to prevent over-merging
-                if (y_dist < y_distance_threshold and  # Close vertically
-                    x_overlap_ratio > self.merge_iou_threshold and  # Sufficient horizontal overlap
-                    size_ratio > 0.3 and  # Similar size (prevent merging very different sized boxes)
-                    # Check that boxes are not too far apart horizontally
-                    abs(box1[0] - box2[0]) < 0.5 * max(box1_width, box2_width) and
-                    abs(box1[2] - box2[2]) < 0.5 * max(box1_width, box2_width)):
-                    
-                    # Merge the boxes
-                    merged_box = [
-                        min(box1[0], box2[0]),
-                        min(box1[1], box2[1]),
-                        max(box1[2], box2[2]),
-                        max(box1[3], box2[3])
-                    ]
-                    
-                    # Additional check: Don't allow merged boxes to get too large
-                    merged_width = merged_box[2] - merged_box[0]
-                    merged_height = merged_box[3] - merged_box[1]
-                    merged_area = merged_width * merged_height
-                    
-                    # If merged box is more than 3x larger than either original box, don't merge
-                    if merged_area > 3 * max(box1_area, box2_area):
-                        j += 1
-                        continue
-                        
-                    box_list[i] = merged_box
-                    box_list.pop(j)
-                    if class_ids is not None:
-                        class_list.pop(j)
-                else:
-                    j += 1
+                box_list[i] = new_box
+                box_list.pop(j)
+                if class_ids is not None:
+                    class_list.pop(j)
             i += 1
             
         merged_boxes = np.array(box_list)
@@ -285,6 +447,24 @@ class ImageSlicer:
         
         return merged_boxes, merged_class_ids
     
+    def get_tiles(self, image: np.ndarray) -> list[tuple[np.ndarray, tuple[int, int]]]:
+        """
+        Cut an image into its overlapping detection tiles, row by row.
+        
+        Args:
+            image: Input image as numpy array
+            
+        Returns:
+            List of (tile image, (start_x, start_y)) tuples
+        """
+        rows, columns = self.get_tile_grid(image)
+        tiles = []
+        for start_y, end_y in rows:
+            for start_x, end_x in columns:
+                tile = image[start_y:end_y, start_x:end_x].copy()
+                tiles.append((tile, (start_x, start_y)))
+        return tiles
+    
     def process_slices_for_detection(self, 
                                     image: np.ndarray, 
                                     detect_func: Callable) -> Any:
@@ -303,23 +483,59 @@ class ImageSlicer:
         if not self.should_slice(image):
             # If image doesn't need slicing, process it directly
             return detect_func(image)
-            
-        # Calculate slicing parameters
-        slice_width, slice_height, effective_slice_height, num_slices = self.calculate_slice_params(image)
         
-        # First, let's determine the return type by calling the function on the first slice
-        slice_img, start_y, _ = self.get_slice(
-            image, 0, effective_slice_height, slice_height
-        )
-        first_result = detect_func(slice_img)
+        tiles = self.get_tiles(image)
+        results = [detect_func(tile) for tile, _ in tiles]
+        return self.combine_slice_results(image, results, [offset for _, offset in tiles])
+    
+    def process_slices_for_batch_detection(self,
+                                           image: np.ndarray,
+                                           detect_batch_func: Callable[[list[np.ndarray]], list],
+                                           max_batch_size: int = 4) -> Any:
+        """
+        Same as `process_slices_for_detection`, but runs the slices (or tiles)
+        through a detector that accepts a list of images, `max_batch_size` at a time.
+        
+        Args:
+            image: Input image as numpy array
+            detect_batch_func: Function that performs detection on a list of
+                              images and returns one result per image
+            max_batch_size: Maximum number of slices per detector call
+            
+        Returns:
+            Detection results combined from all slices
+        """
+        if not self.should_slice(image):
+            return detect_batch_func([image])[0]
+        
+        tiles = self.get_tiles(image)
+        max_batch_size = max(1, max_batch_size)
+        results = []
+        for start in range(0, len(tiles), max_batch_size):
+            batch = [tile for tile, _ in tiles[start:start + max_batch_size]]
+            results.extend(detect_batch_func(batch))
+        return self.combine_slice_results(image, results, [offset for _, offset in tiles])
+    
+    def combine_slice_results(self, image: np.ndarray, results: list, offsets: list) -> Any:
+        """
+        Map per-slice detections back to image coordinates and merge them.
         
+        Args:
+            image: The original (unsliced) image
+            results: Detection result of every slice
+            offsets: start_y of every slice, or (start_x, start_y) of every tile
+            
+        Returns:
+            Combined detection results, matching the type of the slice results
+        """
+        offsets = [offset if isinstance(offset, tuple) else (0, offset) for offset in offsets]
         # Check return type to determine how to process the results
-        if isinstance(first_result, tuple) and len(first_result) == 2:
+        if isinstance(results[0], tuple) and len(results[0]) == 2:
             # Case 1: Function returns a tuple of two arrays (bubble_boxes, text_boxes)
-            return self._process_box_tuple_results(image, detect_func, effective_slice_height)
-        elif isinstance(first_result, np.ndarray):
+            return self._combine_box_tuple_results(image, results, offsets)
+        elif isinstance(results[0], np.ndarray):
             # Case 2: Function returns a single array of boxes
-            return self._process_single_box_array_results(image, detect_func, effective_slice_height)
+            return self._combine_single_box_array_results(image, results, offsets)
         else:
             # For any other return type, we'll need to handle it specifically
             # This is just a placeholder for custom implementations
@@ -327,43 +543,32 @@ class ImageSlicer:
                 "Detector return type not supported. Please implement custom slicing logic."
             )
     
-    def _process_box_tuple_results(self, 
-                                  image: np.ndarray,
-                                  detect_func: Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]],
-                                  effective_slice_height: int) -> tuple[np.ndarray, np.ndarray]:
+    def _combine_box_tuple_results(self, 
+                                   image: np.ndarray,
+                                   results: list[tuple[np.ndarray, np.ndarray]],
+                                   offsets: list[int]) -> tuple[np.ndarray, np.ndarray]:
         """
-        Process slices for detectors that return a tuple of (bubble_boxes, text_boxes).
+        Combine slice results of detectors that return a tuple of (bubble_boxes, text_boxes).
         
         Args:
             image: Input image
-            detect_func: Detection function
-            effective_slice_height: Height of slice minus overlap
+            results: (bubble_boxes, text_boxes) of every slice
+            offsets: (start_x, start_y) of every slice
             
         Returns:
             Tuple of (combined_bubble_boxes, combined_text_boxes)
         """
-        height, width = image.shape[:2]
-        num_slices = math.ceil(height / effective_slice_height)
-        slice_height = int(width * self.target_slice_ratio)
-        
         all_bubble_boxes = []
         all_text_boxes = []
         
-        for slice_number in range(num_slices):
-            slice_img, start_y, _ = self.get_slice(
-                image, slice_number, effective_slice_height, slice_height
-            )
-            
-            # Run detection on this slice
-            bubble_boxes, text_boxes = detect_func(slice_img)
-            
+        for (bubble_boxes, text_boxes), (start_x, start_y) in zip(results, offsets):
             # Adjust coordinates to match original image
             if isinstance(bubble_boxes, np.ndarray) and bubble_boxes.size > 0:
-                bubble_boxes = self.adjust_box_coordinates(bubble_boxes, start_y)
+                bubble_boxes = self.adjust_box_coordinates(bubble_boxes, start_y, start_x)
                 all_bubble_boxes.append(bubble_boxes)
                 
             if isinstance(text_boxes, np.ndarray) and text_boxes.size > 0:
-                text_boxes = self.adjust_box_coordinates(text_boxes, start_y)
+                text_boxes = self.adjust_box_coordinates(text_boxes, start_y, start_x)
                 all_text_boxes.append(text_boxes)
         
         # Combine all detections
@@ -372,51 +577,34 @@ class ImageSlicer:
         
         # Merge overlapping boxes and remove duplicates
         if combined_bubble_boxes.size > 0:
-            combined_bubble_boxes, _ = self.merge_overlapping_boxes(
-                combined_bubble_boxes, 
-                image_height=image.shape[0]
-            )
+            combined_bubble_boxes = self.merge_tile_boxes(combined_bubble_boxes, image, offsets)
             
         if combined_text_boxes.size > 0:
-            combined_text_boxes, _ = self.merge_overlapping_boxes(
-                combined_text_boxes,
-                image_height=image.shape[0]
-            )
+            combined_text_boxes = self.merge_tile_boxes(combined_text_boxes, image, offsets)
             
         return combined_bubble_boxes, combined_text_boxes
     
-    def _process_single_box_array_results(self, 
+    def _combine_single_box_array_results(self, 
                                           image: np.ndarray, 
-                                          detect_func: Callable[[np.ndarray], np.ndarray],
-                                          effective_slice_height: int) -> np.ndarray:
+                                          results: list[np.ndarray],
+                                          offsets: list[int]) -> np.ndarray:
         """
-        Process slices for detectors that return a single array of boxes.
+        Combine slice results of detectors that return a single array of boxes.
         
         Args:
             image: Input image
-            detect_func: Detection function
-            effective_slice_height: Height of slice minus overlap
+            results: Boxes of every slice
+            offsets: (start_x, start_y) of every slice
             
         Returns:
             Combined array of boxes
         """
-        height, width = image.shape[:2]
-        num_slices = math.ceil(height / effective_slice_height)
-        slice_height = int(width * self.target_slice_ratio)
-        
         all_boxes = []
         
-        for slice_number in range(num_slices):
-            slice_img, start_y, _ = self.get_slice(
-                image, slice_number, effective_slice_height, slice_height
-            )
-            
-            # Run detection on this slice
-            boxes = detect_func(slice_img)
-            
+        for boxes, (start_x, start_y) in zip(results, offsets):
             # Adjust coordinates to match original image
             if isinstance(boxes, np.ndarray) and boxes.size > 0:
-                boxes = self.adjust_box_coordinates(boxes, start_y)
+                boxes = self.adjust_box_coordinates(boxes, start_y, start_x)
                 all_boxes.append(boxes)
         
         # Combine all detections
@@ -424,9 +612,36 @@ class ImageSlicer:
         
         # Merge overlapping boxes and remove duplicates
         if combined_boxes.size > 0:
-            combined_boxes, _ = self.merge_overlapping_boxes(
-                combined_boxes, 
-                image_height=image.shape[0]
-            )
+            combined_boxes = self.merge_tile_boxes(combined_boxes, image, offsets)
             
-        return combined_boxes
\ No newline at end of file
+        return combined_boxes
+    
+    def merge_tile_boxes(self, boxes: np.ndarray, image: np.ndarray,
+                         offsets: list[tuple[int, int]]) -> np.ndarray:
+        """
+        Merge boxes of a tile grid along every axis the grid was cut on.
+        
+        Rows are merged with `merge_overlapping_boxes` as for webtoon slices.
+        Columns reuse the same rules on transposed boxes (x and y swapped), so
+        boxes split by a vertical cut are joined like boxes split by a
+        horizontal one.
+        
+        Args:
+            boxes: Boxes of all tiles in image coordinates
+            image: The original (untiled) image
+            offsets: (start_x, start_y) of every tile
+            
+        Returns:
+            Merged boxes
+        """
+        height, width = image.shape[:2]
+        cut_rows = len({start_y for _, start_y in offsets}) > 1
+        cut_columns = len({start_x for start_x, _ in offsets}) > 1
+        
+        if cut_rows or not cut_columns:
+            boxes, _ = self.merge_overlapping_boxes(boxes, image_height=height)
+        if cut_columns and boxes.size > 0:
+            transposed = boxes[:, [1, 0, 3, 2]]
+            transposed, _ = self.merge_overlapping_boxes(transposed, image_height=width)
+            boxes = transposed[:, [1, 0, 3, 2]]
+        return boxes
\ No newline at end of file
@@ -11,6 +11,10 @@ class OCREngine(ABC):
     Abstract base class for all OCR engines.
     Each OCR implementation should inherit from this class and implement the process_image method.
     """
+
+    # Engines keeping no per-call state (API clients) set this, so one
+    # instance serves concurrent requests instead of being leased exclusively
+    thread_safe = False
     
     @abstractmethod
     def process_image(self, img: np.ndarray, blk_list: list[TextBlock]) -> list[TextBlock]:
@@ -36,6 +40,17 @@ class OCREngine(ABC):
         """
         pass
 
+    def stats(self) -> dict:
+        """Runtime statistics of the engine, empty if it keeps none."""
+        return {}
+
+    def is_cacheable(self, blk: TextBlock) -> bool:
+        """
+        Whether the text `process_image` left on a block may be cached.
+        Engines leave "" on errors, which must not be cached.
+        """
+        return bool(blk.text)
+
     @staticmethod
     def set_source_language(blk_list: list[TextBlock], lang_code: str) -> None:
         """
@@ -0,0 +1,110 @@
+import threading
+from typing import Callable, ContextManager
+
+import numpy as np
+
+from .base import OCREngine
+from ..utils.textblock import TextBlock
+
+
+class CascadeOCR(OCREngine):
+    """
+    Local OCR engine first, remote LLM OCR only for the blocks it is unsure of.
+
+    Every block goes through the local engine (MangaOCR, Pororo, DocTR...).
+    Blocks it returns without text, or with a confidence below `threshold`,
+    are sent again to the remote engine. A block keeps its local text when
+    the remote engine returns none for it (counted as unresolved, and not
+    cached). Blocks from engines that report no confidence are only
+    escalated when empty.
+
+    Both engines are leased from the engine pool for every call, so the
+    cascade itself holds no model and is shared by concurrent requests.
+    """
+
+    thread_safe = True
+
+    def __init__(self):
+        self.local = None
+        self.remote = None
+        self.threshold = 0.5
+        self.local_name = None
+        self.remote_name = None
+        self._lock = threading.Lock()
+        self.blocks = 0
+        self.escalated = 0
+        self.unresolved = 0
+
+    def initialize(self, local: Callable[[], ContextManager[OCREngine]],
+                   remote: Callable[[], ContextManager[OCREngine]],
+                   threshold: float = 0.5) -> None:
+        """
+        Initialize the cascade.
+
+        Args:
+            local: Leases the engine every block goes through
+            remote: Leases the engine the uncertain blocks are escalated to
+            threshold: Blocks with a confidence below this are escalated
+        """
+        self.local = local
+        self.remote = remote
+        self.threshold = threshold
+
+    def process_image(self, img: np.ndarray, blk_list: list[TextBlock]) -> list[TextBlock]:
+        # Give the local engine back before waiting on the remote one
+        with self.local() as local:
+            self.local_name = type(local).__name__
+            local.process_image(img, blk_list)
+
+        uncertain = [blk for blk in blk_list if self._is_uncertain(blk)]
+        unresolved = 0
+        if uncertain:
+            local_results = [(blk.text, blk.ocr_confidence) for blk in uncertain]
+            # A checkout timeout is not a remote error and is raised
+            with self.remote() as remote:
+                self.remote_name = type(remote).__name__
+                # Blocks the remote engine skips (invalid crops...) stay empty
+                # and fall back to the local result below
+                for blk in uncertain:
+                    blk.text = ""
+                try:
+                    remote.process_image(img, uncertain)
+                except Exception as e:
+                    print(f"Cascade OCR remote error: {str(e)}")
+
+            for blk, (text, confidence) in zip(uncertain, local_results):
+                if blk.text:
+                    # LLM engines report no confidence
+                    blk.ocr_confidence = None
+                else:
+                    blk.text, blk.ocr_confidence = text, confidence
+                    unresolved += 1
+
+        with self._lock:
+            self.blocks += len(blk_list)
+            self.escalated += len(uncertain)
+            self.unresolved += unresolved
+        return blk_list
+
+    def stats(self) -> dict:
+        """Number of blocks seen, escalated to the remote engine, and the escalation rate."""
+        with self._lock:
+            return {
+                "local": self.local_name,
+                "remote": self.remote_name,
+                "threshold": self.threshold,
+                "blocks": self.blocks,
+                "escalated": self.escalated,
+                "unresolved": self.unresolved,
+                "escalation_rate": self.escalated / self.blocks if self.blocks else 0.0,
+            }
+
+    def is_cacheable(self, blk: TextBlock) -> bool:
+        # Blocks still uncertain (the remote engine failed or gave no text)
+        # must be escalated again on the next request
+        return not self._is_uncertain(blk)
+
+    def _is_uncertain(self, blk: TextBlock) -> bool:
+        if not blk.text or not blk.text.strip():
+            return True
+        return blk.ocr_confidence is not None and blk.ocr_confidence < self.threshold
@@ -0,0 +1,189 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, wait
+from typing import Any, Callable
+
+import requests
+
+# HTTP statuses worth retrying: rate limited or a transient server error
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class RetryableError(Exception):
+    """A request failed in a way that may succeed if sent again later."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity` at once."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: float = None) -> bool:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            False if `deadline` (monotonic time) passed before a token was free
+        """
+        if self.rate <= 0:
+            return True
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait_time = (1 - self.tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait_time > deadline:
+                return False
+            time.sleep(wait_time)
+
+
+class RequestDispatcher:
+    """
+    Runs the per-block requests of an LLM OCR provider concurrently.
+
+    One dispatcher is shared by every engine talking to the same provider, so
+    `max_concurrency` and the token-bucket rate limit hold across pages and
+    requests. Calls raising `RetryableError` are retried with full-jitter
+    exponential backoff, and every block gets an overall `block_timeout`
+    (queueing, rate limiting and retries included).
+    """
+
+    def __init__(self, name: str, max_concurrency: int = 8,
+                 requests_per_second: float = 5.0, burst: int = 8,
+                 max_retries: int = 3, backoff_base: float = 0.5,
+                 backoff_max: float = 8.0, block_timeout: float = 60.0,
+                 request_timeout: float = 20.0):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.block_timeout = block_timeout
+        self.request_timeout = request_timeout
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix=f"ocr-{name}"
+        )
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+        self.timeouts = 0
+
+    def map(self, fn: Callable[[Any], Any], items: list) -> list:
+        """
+        Call `fn` on every item concurrently.
+
+        Returns:
+            One entry per item, in order: the result, or the exception raised
+            (a `TimeoutError` if the block ran out of time)
+        """
+        deadline = time.monotonic() + self.block_timeout
+        futures = [self._pool.submit(self._call, fn, item, deadline) for item in items]
+        wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+
+        results = []
+        for future in futures:
+            if not future.done():
+                # The request keeps its own HTTP timeout, stop waiting for it
+                future.cancel()
+                with self._lock:
+                    self.timeouts += 1
+                results.append(TimeoutError(f"{self.name} OCR block timed out"))
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retries": self.retries,
+                "timeouts": self.timeouts,
+            }
+
+    def _call(self, fn: Callable[[Any], Any], item: Any, deadline: float) -> Any:
+        with self._lock:
+            self.in_flight += 1
+        try:
+            attempt = 0
+            while True:
+                if not self.bucket.acquire(deadline):
+                    raise TimeoutError(f"{self.name} OCR rate limit wait exceeded the block timeout")
+                try:
+                    result = fn(item)
+                except RetryableError:
+                    delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+                    if attempt >= self.max_retries or time.monotonic() + delay > deadline:
+                        raise
+                    attempt += 1
+                    with self._lock:
+                        self.retries += 1
+                    time.sleep(delay)
+                    continue
+                with self._lock:
+                    self.completed += 1
+                return result
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def post_json(url: str, timeout: float, **kwargs) -> requests.Response:
+    """
+    `requests.post` that raises `RetryableError` on timeouts, connection
+    errors and retryable HTTP statuses. Other responses are returned as is.
+    """
+    try:
+        response = requests.post(url, timeout=timeout, **kwargs)
+    except (requests.Timeout, requests.ConnectionError) as e:
+        raise RetryableError(str(e)) from e
+    if response.status_code in RETRY_STATUS:
+        raise RetryableError(f"API error: {response.status_code} {response.text}")
+    return response
+
+
+_dispatchers: dict[str, RequestDispatcher] = {}
+_dispatchers_lock = threading.Lock()
+
+
+def get_dispatcher(provider: str, config: dict = None) -> RequestDispatcher:
+    """
+    Shared dispatcher of a provider, created from `config` on first use.
+
+    Args:
+        provider: Provider name, e.g. 'openai' or 'gemini'
+        config: RequestDispatcher keyword arguments
+    """
+    with _dispatchers_lock:
+        if provider not in _dispatchers:
+            _dispatchers[provider] = RequestDispatcher(provider, **(config or {}))
+        return _dispatchers[provider]
+
+
+def dispatcher_stats() -> dict:
+    """Statistics of every provider dispatcher created so far."""
+    with _dispatchers_lock:
+        dispatchers = dict(_dispatchers)
+    return {name: dispatcher.stats() for name, dispatcher in dispatchers.items()}
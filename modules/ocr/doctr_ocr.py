@@ -4,6 +4,10 @@ import torch
 from .base import OCREngine
 from ..utils.textblock import TextBlock
 from ..utils.pipeline_utils import lists_to_blk_list
+from ..utils.mosaic import crop_gap, merge_regions, pack_regions, sheet_box_to_image
+
+# Pixels kept around every block region, so lines sticking out are not cut
+REGION_MARGIN = 8
 
 
 class DocTROCR(OCREngine):
@@ -12,18 +16,26 @@ class DocTROCR(OCREngine):
     def __init__(self):
         self.model = None
         self.device = 'cpu'
+        self.region_crop = False
+        self.sheet_size = 1024
         
-    def initialize(self, device: str = 'cpu') -> None:
+    def initialize(self, device: str = 'cpu', region_crop: bool = False,
+                   sheet_size: int = 1024) -> None:
         """
          Initialize the DocTR engine.
          
          Args:
              device: Device to use ('cpu' or 'cuda')
+             region_crop: Only read the pixels of the detected blocks, packed
+                          into composite sheets, instead of the whole page
+             sheet_size: Maximum width and height of a composite sheet
          """
         
         from doctr.models import ocr_predictor
 
         self.device = device
+        self.region_crop = region_crop
+        self.sheet_size = sheet_size
         # Initialize model if not already loaded
         if self.model is None:
             self.model = ocr_predictor(
@@ -38,40 +50,82 @@ class DocTROCR(OCREngine):
         
     def process_image(self, img: np.ndarray, blk_list: list[TextBlock]) -> list[TextBlock]:
         try:
-            # Process whole image with DocTR
-            result = self.model([img])
-            
-            # Extract text and bounding boxes
-            texts_bboxes = []
-            texts_string = []
-            
-            # Process result to extract boxes and text
-            for page in result.pages:
-                h, w = page.dimensions
-                for block in page.blocks:
-                    for line in block.lines:
-                        # Get text from line
-                        line_text = " ".join(word.value for word in line.words)
-                        if not line_text.strip():
-                            continue
-                            
-                        # Get coordinates and normalize to absolute pixel values
-                        x_min, y_min = line.geometry[0]
-                        x_max, y_max = line.geometry[1]
-                        
-                        # Convert relative coordinates to absolute pixel coordinates
-                        x1 = int(x_min * w)
-                        y1 = int(y_min * h)
-                        x2 = int(x_max * w)
-                        y2 = int(y_max * h)
-                        
-                        texts_bboxes.append((x1, y1, x2, y2))
-                        texts_string.append(line_text)
+            if not self.region_crop:
+                # Process whole image with DocTR
+                page = self.model([img]).pages[0]
+                texts_bboxes, texts_string, texts_confidence = self._read_lines(page)
+            else:
+                texts_bboxes, texts_string, texts_confidence = self._read_block_regions(img, blk_list)
             
             # Match detected text to provided blocks using lists_to_blk_list
-            return lists_to_blk_list(blk_list, texts_bboxes, texts_string)
+            return lists_to_blk_list(blk_list, texts_bboxes, texts_string, texts_confidence)
             
         except Exception as e:
             print(f"DocTR OCR error: {str(e)}")
             return blk_list
+
+    def _read_block_regions(self, img: np.ndarray, blk_list: list[TextBlock]) -> tuple[list, list, list]:
+        """
+        Run DocTR on composite sheets of the block regions only. Words are
+        mapped back to their region one by one and lines regrouped per
+        region, as DocTR may join the words of neighbouring regions.
+        """
+        regions = merge_regions(
+            [blk.bubble_xyxy if blk.bubble_xyxy is not None else blk.xyxy for blk in blk_list],
+            img.shape, margin=REGION_MARGIN,
+        )
+        if not regions:
+            return [], [], []
+        gap = crop_gap([(y2 - y1, x2 - x1) for x1, y1, x2, y2 in regions], self.sheet_size)
+        sheets = pack_regions(img, regions, self.sheet_size, self.sheet_size, padding=gap)
+        result = self.model([sheet.image for sheet in sheets])
+
+        texts_bboxes = []
+        texts_string = []
+        texts_confidence = []
+        for sheet, page in zip(sheets, result.pages):
+            h, w = page.dimensions
+            for line in self._lines(page):
+                words_per_region = {}
+                for word in line.words:
+                    mapped = sheet_box_to_image(sheet, regions, self._to_pixels(word.geometry, w, h))
+                    if mapped is not None:
+                        index, bbox = mapped
+                        words_per_region.setdefault(index, []).append((bbox, word))
+
+                for words in words_per_region.values():
+                    texts_bboxes.append((
+                        min(bbox[0] for bbox, _ in words), min(bbox[1] for bbox, _ in words),
+                        max(bbox[2] for bbox, _ in words), max(bbox[3] for bbox, _ in words),
+                    ))
+                    texts_string.append(" ".join(word.value for _, word in words))
+                    texts_confidence.append(min(word.confidence for _, word in words))
+        return texts_bboxes, texts_string, texts_confidence
+
+    def _read_lines(self, page) -> tuple[list, list, list]:
+        """Line boxes (absolute pixels), texts and confidences of a DocTR page."""
+        texts_bboxes = []
+        texts_string = []
+        texts_confidence = []
+        h, w = page.dimensions
+        for line in self._lines(page):
+            texts_bboxes.append(self._to_pixels(line.geometry, w, h))
+            texts_string.append(" ".join(word.value for word in line.words))
+            # A line is as uncertain as its least confident word
+            texts_confidence.append(min(word.confidence for word in line.words))
+        return texts_bboxes, texts_string, texts_confidence
+
+    @staticmethod
+    def _lines(page) -> list:
+        """Lines of a DocTR page holding some text."""
+        return [
+            line for block in page.blocks for line in block.lines
+            if " ".join(word.value for word in line.words).strip()
+        ]
+
+    @staticmethod
+    def _to_pixels(geometry, w: int, h: int) -> tuple[int, int, int, int]:
+        """Convert relative ((x_min, y_min), (x_max, y_max)) to absolute pixel coordinates."""
+        (x_min, y_min), (x_max, y_max) = geometry
+        return int(x_min * w), int(y_min * h), int(x_max * w), int(y_max * h)
     
@@ -1,5 +1,6 @@
 import json
 import hashlib
+from contextlib import contextmanager
 
 from .base import OCREngine
 from .microsoft_ocr import MicrosoftOCR
@@ -10,42 +11,108 @@ from .manga_ocr.engine import MangaOCREngine
 from .pororo.engine import PororoOCREngine
 from .doctr_ocr import DocTROCR
 from .gemini_ocr import GeminiOCR
+from .cascade_ocr import CascadeOCR
+from ..utils.engine_pool import EnginePool
 
 class OCRFactory:
     """Factory for creating appropriate OCR engines based on config."""
     
-    _engines = {}  # Cache of created engines
+    # Loaded engines, bounded by estimated memory and checked out per request
+    _pool = EnginePool("ocr")
 
     LLM_ENGINE_IDENTIFIERS = {
         "GPT": GPTOCR,
         "Gemini": GeminiOCR,
     }
+
+    # Engines that call a remote API instead of running a local model
+    REMOTE_MODELS = {
+        "Microsoft OCR",
+        "Google Cloud Vision",
+        "GPT-4.1-mini",
+        "Gemini-2.0-Flash",
+    }
+    REMOTE_DEFAULT_LANGUAGES = {"Russian"}
+
+    # Options changing the text engines read from a given crop
+    RESULT_OPTIONS = (
+        "expansion_percentage", "lang", "pororo_composite",
+        "region_crop", "region_sheet_size", "sprite_sheet",
+    )
     
     @classmethod
-    def create_engine(cls, config:dict, source_lang_english: str, ocr_model: str) -> OCREngine:
+    @contextmanager
+    def lease(cls, config:dict, source_lang_english: str, ocr_model: str):
         """
-        Create or retrieve an appropriate OCR engine based on config.
+        Check out an appropriate OCR engine based on config until the block
+        exits: exclusively for local models, shared for API clients.
         
         Args:
             config: config object with OCR configuration
             source_lang_english: Source language in English
             ocr_model: OCR model to use
             
-        Returns:
+        Yields:
             Appropriate OCR engine instance
         """
+        cls._pool.configure(**config.get('engine_pool', {}))
+        
         # Create a cache key based on model and language
         cache_key = cls._create_cache_key(ocr_model, source_lang_english, config)
         
-        # Return cached engine if available
-        if cache_key in cls._engines:
-            return cls._engines[cache_key]
+        # Reuse an idle engine, or create one based on model or language
+        if cls._uses_cascade(config, source_lang_english, ocr_model):
+            cache_key = f"cascade_{cache_key}"
+            factory = lambda: cls._create_cascade_ocr(config, source_lang_english, ocr_model)
+        else:
+            factory = lambda: cls._create_new_engine(config, source_lang_english, ocr_model)
+        with cls._pool.lease(cache_key, factory) as engine:
+            yield engine
+    
+    @classmethod
+    def pool_stats(cls) -> dict:
+        """Occupancy of the engine pool."""
+        return cls._pool.stats()
+    
+    @classmethod
+    def engine_stats(cls) -> dict:
+        """Runtime statistics of the loaded engines that keep any."""
+        stats = {}
+        counts = {}
+        for key, engine in cls._pool.instances():
+            engine_stats = engine.stats()
+            if engine_stats:
+                # Replicas of a key are reported one by one
+                counts[key] = counts.get(key, 0) + 1
+                stats[key if counts[key] == 1 else f"{key}#{counts[key]}"] = engine_stats
+        return stats
+    
+    @classmethod
+    def cache_signature(cls, config:dict, source_lang_english: str, ocr_model: str) -> dict:
+        """
+        Description of everything besides the crop that affects the text
+        recognized by the selected engine, known without loading it.
         
-        # Create engine based on model or language
-        engine = cls._create_new_engine(config, source_lang_english, ocr_model)
-        cls._engines[cache_key] = engine
-        return engine
+        Returns:
+            JSON-serializable dictionary, part of the OCR cache namespace
+        """
+        signature = {"model": ocr_model, "language": source_lang_english}
+        signature.update((option, config[option]) for option in cls.RESULT_OPTIONS if option in config)
+        if cls._uses_cascade(config, source_lang_english, ocr_model):
+            cascade = config.get('cascade', {})
+            signature["cascade"] = {
+                "threshold": cascade.get('threshold', 0.5),
+                "remote": cascade.get('remote', 'GPT-4.1-mini'),
+            }
+        return signature
     
+    @classmethod
+    def is_remote_engine(cls, source_lang_english: str, ocr_model: str) -> bool:
+        """Return True if the selected engine is network-bound rather than CPU/GPU-bound."""
+        if ocr_model in cls.REMOTE_MODELS:
+            return True
+        return ocr_model == "Default" and source_lang_english in cls.REMOTE_DEFAULT_LANGUAGES
+
     @classmethod
     def _create_cache_key(cls, ocr_model: str,
                         source_lang: str,
@@ -114,10 +181,52 @@ class OCRFactory:
         
         # For Default, use language-specific engines
         if ocr_model == 'Default' and source_lang_english in language_factories:
-            return language_factories[source_lang_english](config)
+            engine = language_factories[source_lang_english](config)
+        else:
+            # Fallback to doctr for any other language
+            engine = cls._create_doctr_ocr(config)
         
-        # Fallback to doctr for any other language
-        return cls._create_doctr_ocr(config)
+        return engine
+    
+    @classmethod
+    def _uses_cascade(cls, config:dict, source_lang_english: str, ocr_model: str) -> bool:
+        """
+        Whether the local engine (reporting a per-block confidence) selected
+        for the language escalates uncertain blocks to an LLM.
+        """
+        if ocr_model != 'Default' or source_lang_english in cls.REMOTE_DEFAULT_LANGUAGES:
+            return False
+        cascade = config.get('cascade', {})
+        credentials = config.get('credentials') or {}
+        # Without an API key every escalation would fail
+        return cascade.get('enabled', False) and bool(credentials.get('api_key'))
+    
+    @classmethod
+    def _create_cascade_ocr(cls, config:dict, source_lang_english: str, ocr_model: str) -> OCREngine:
+        """
+        Cascade escalating the uncertain blocks of the local engine to an LLM.
+        Both engines stay in the pool under their own key: the local one is
+        leased exclusively per call, the LLM one is shared.
+        """
+        cascade = config.get('cascade', {})
+        remote_model = cascade.get('remote', 'GPT-4.1-mini')
+        local_key = cls._create_cache_key(ocr_model, source_lang_english, config)
+        remote_key = cls._create_cache_key(remote_model, source_lang_english, config)
+        
+        def create_remote() -> OCREngine:
+            if 'Gemini' in remote_model:
+                return cls._create_gemini_ocr(config, remote_model)
+            return cls._create_gpt_ocr(config, remote_model)
+        
+        engine = CascadeOCR()
+        engine.initialize(
+            local=lambda: cls._pool.lease(
+                local_key, lambda: cls._create_new_engine(config, source_lang_english, ocr_model)
+            ),
+            remote=lambda: cls._pool.lease(remote_key, create_remote),
+            threshold=cascade.get('threshold', 0.5),
+        )
+        return engine
     
     @staticmethod
     def _create_microsoft_ocr(config:dict) -> OCREngine:
@@ -142,7 +251,10 @@ class OCRFactory:
         credentials = config.get("credentials")
         api_key = credentials.get('api_key', '')
         expansion_percentage = config.get('expansion_percentage', 0)
-        engine.initialize(api_key=api_key, model=model, expansion_percentage=expansion_percentage)
+        dispatcher = config.get('dispatcher', {}).get('openai')
+        sprite_sheet = OCRFactory._sprite_sheet_size(config, 'openai')
+        engine.initialize(api_key=api_key, model=model, expansion_percentage=expansion_percentage,
+                          dispatcher=dispatcher, sprite_sheet=sprite_sheet)
         return engine
     
     @staticmethod
@@ -150,28 +262,36 @@ class OCRFactory:
         engine = MangaOCREngine()
         device = config.get('device', 'cpu')
         expansion_percentage = config.get('expansion_percentage', 5)
-        engine.initialize(device=device,expansion_percentage=expansion_percentage)
+        batch_size = config.get('batch_size', 16)
+        engine.initialize(device=device,expansion_percentage=expansion_percentage,
+                          batch_size=batch_size)
         return engine
     
     @staticmethod
     def _create_pororo_ocr(config:dict) -> OCREngine:
         engine = PororoOCREngine()
         lang = config.get('lang', 'ko')
-        engine.initialize(lang=lang)
+        composite = config.get('pororo_composite', False)
+        batch_size = config.get('pororo_batch_size', 32)
+        engine.initialize(lang=lang, composite=composite, batch_size=batch_size)
         return engine
     
     @staticmethod
     def _create_paddle_ocr(config:dict) -> OCREngine:
         engine = PaddleOCREngine()
         lang = config.get('lang', 'ch')
-        engine.initialize(lang=lang)
+        region_crop = config.get('region_crop', False)
+        sheet_size = config.get('region_sheet_size', 1024)
+        engine.initialize(lang=lang, region_crop=region_crop, sheet_size=sheet_size)
         return engine
     
     @staticmethod
     def _create_doctr_ocr(config:dict) -> OCREngine:
         engine = DocTROCR()
         device = config.get('device', 'cpu')
-        engine.initialize(device=device)
+        region_crop = config.get('region_crop', False)
+        sheet_size = config.get('region_sheet_size', 1024)
+        engine.initialize(device=device, region_crop=region_crop, sheet_size=sheet_size)
         return engine
     
     @staticmethod
@@ -180,5 +300,17 @@ class OCRFactory:
         credentials = config.get("credentials")
         api_key = credentials.get('api_key', '')
         expansion_percentage=config.get('expansion_percentage', 5)
-        engine.initialize(api_key=api_key, model=model, expansion_percentage=expansion_percentage)
-        return engine
\ No newline at end of file
+        dispatcher = config.get('dispatcher', {}).get('gemini')
+        sprite_sheet = OCRFactory._sprite_sheet_size(config, 'gemini')
+        engine.initialize(api_key=api_key, model=model, expansion_percentage=expansion_percentage,
+                          dispatcher=dispatcher, sprite_sheet=sprite_sheet)
+        return engine
+    
+    @staticmethod
+    def _sprite_sheet_size(config:dict, provider: str):
+        """(max_width, max_height) of LLM OCR sprite sheets, or None if disabled."""
+        sprite_sheet = config.get('sprite_sheet', {})
+        if not sprite_sheet.get('enabled', False):
+            return None
+        size = sprite_sheet.get(provider, {})
+        return size.get('max_width', 1536), size.get('max_height', 768)
@@ -1,28 +1,40 @@
 import base64
 import cv2
 import numpy as np
-import requests
 
 from .base import OCREngine
+from .dispatcher import RetryableError, get_dispatcher, post_json
+from .sprite_sheet import recognize_crops
 from ..utils.textblock import TextBlock, adjust_text_line_coordinates
 from ..utils.translator_utils import MODEL_MAP
 
+OCR_PROMPT = """
+            Extract the text in this image exactly as it appears. 
+            Only output the raw text with no additional comments or descriptions.
+            """
+
 
 class GeminiOCR(OCREngine):
     """OCR engine using Google Gemini models via REST API with block processing method."""
 
+    thread_safe = True
+
     def __init__(self):
         self.api_key = None
         self.expansion_percentage = 5
         self.model = ""
         self.api_base_url = "https://generativelanguage.googleapis.com/v1beta/models"
         self.max_output_tokens = 5000
+        self.dispatcher = None
+        self.sprite_sheet = None
 
     def initialize(
         self,
         api_key: str,
         model: str = "Gemini-2.0-Flash",
         expansion_percentage: int = 5,
+        dispatcher: dict = None,
+        sprite_sheet: tuple[int, int] = None,
     ) -> None:
         """
         Initialize the Gemini OCR with API key and parameters.
@@ -31,10 +43,17 @@ class GeminiOCR(OCREngine):
             settings: Settings page containing credentials
             model: Gemini model to use for OCR (defaults to Gemini-2.0-Flash)
             expansion_percentage: Percentage to expand text bounding boxes
+            dispatcher: Concurrency, rate limit and retry settings shared by
+                        all Gemini OCR requests (see `RequestDispatcher`)
+            sprite_sheet: (max_width, max_height) of the labelled mosaics the
+                          crops of a page are packed into, None to send one
+                          request per block
         """
         self.expansion_percentage = expansion_percentage
         self.api_key = api_key
         self.model = MODEL_MAP.get(model)
+        self.dispatcher = get_dispatcher("gemini", dispatcher)
+        self.sprite_sheet = sprite_sheet
 
     def process_image(
         self, img: np.ndarray, blk_list: list[TextBlock]
@@ -56,7 +75,9 @@ class GeminiOCR(OCREngine):
     ) -> list[TextBlock]:
         """
         Process an image by processing individual text regions separately.
-        Similar to GPTOCR approach, each text block is cropped and sent individually.
+        Similar to GPTOCR approach, each text block is cropped and sent individually,
+        concurrently through the shared Gemini dispatcher. With sprite sheets
+        enabled, the crops are packed into a few labelled mosaics instead.
 
         Args:
             img: Input image as numpy array
@@ -65,6 +86,8 @@ class GeminiOCR(OCREngine):
         Returns:
             List of updated TextBlock objects with recognized text
         """
+        cropped_blks = []
+        cropped_imgs = []
         for blk in blk_list:
             try:
                 # Get box coordinates
@@ -89,25 +112,42 @@ class GeminiOCR(OCREngine):
                 ):
                     # Crop image and encode
                     cropped_img = img[y1:y2, x1:x2]
-                    encoded_img = self.encode_image(cropped_img)
-
-                    # Get OCR result from Gemini
-                    blk.text = self._get_gemini_block_ocr(encoded_img)
+                    cropped_imgs.append(cropped_img)
+                    cropped_blks.append(blk)
             except Exception as e:
                 print(f"Gemini OCR error on block: {str(e)}")
                 blk.text = ""
 
+        # Get OCR results from Gemini
+        results = recognize_crops(
+            cropped_imgs,
+            self._get_gemini_block_ocr,
+            self.encode_image,
+            self.dispatcher,
+            self.sprite_sheet,
+        )
+        for blk, result in zip(cropped_blks, results):
+            if isinstance(result, Exception):
+                print(f"Gemini OCR error on block: {str(result)}")
+                blk.text = ""
+            else:
+                blk.text = result
+
         return blk_list
 
-    def _get_gemini_block_ocr(self, base64_image: str) -> str:
+    def _get_gemini_block_ocr(self, base64_image: str, prompt: str = OCR_PROMPT) -> str:
         """
         Get OCR result for a single block from Gemini model.
 
         Args:
             base64_image: Base64 encoded image
+            prompt: Instruction sent with the image
 
         Returns:
             OCR result text
+
+        Raises:
+            RetryableError: On timeouts, rate limiting and transient server errors
         """
         if not self.api_key:
             raise ValueError("API key not initialized. Call initialize() first.")
@@ -122,10 +162,6 @@ class GeminiOCR(OCREngine):
             }
 
             # Prepare payload
-            prompt = """
-            Extract the text in this image exactly as it appears. 
-            Only output the raw text with no additional comments or descriptions.
-            """
             payload = {
                 "contents": [
                     {
@@ -145,7 +181,12 @@ class GeminiOCR(OCREngine):
 
             # Make POST request to Gemini API
             headers = {"Content-Type": "application/json"}
-            response = requests.post(url, headers=headers, json=payload, timeout=20)
+            response = post_json(
+                url,
+                timeout=self.dispatcher.request_timeout,
+                headers=headers,
+                json=payload,
+            )
 
             # Handle response
             if response.status_code == 200:
@@ -171,6 +212,8 @@ class GeminiOCR(OCREngine):
                 print(f"API error: {response.status_code} {response.text}")
                 return ""
 
+        except RetryableError:
+            raise
         except Exception as e:
             print(f"Gemini API request error: {str(e)}")
             return ""
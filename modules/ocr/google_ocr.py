@@ -11,6 +11,8 @@ from ..utils.pipeline_utils import lists_to_blk_list
 
 class GoogleOCR(OCREngine):
     """OCR engine using Google Cloud Vision API."""
+
+    thread_safe = True
     
     def __init__(self):
         self.api_key = None
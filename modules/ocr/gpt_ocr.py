@@ -1,16 +1,21 @@
 import base64
 import cv2
 import numpy as np
-import requests
 import json
 
 from .base import OCREngine
+from .dispatcher import RetryableError, get_dispatcher, post_json
+from .sprite_sheet import recognize_crops
 from ..utils.textblock import TextBlock, adjust_text_line_coordinates
 from ..utils.translator_utils import MODEL_MAP
 
+OCR_PROMPT = "Write out the text in this image. Do NOT Translate. Do not write anything else"
+
 
 class GPTOCR(OCREngine):
     """OCR engine using GPT vision capabilities via direct REST API calls."""
+
+    thread_safe = True
     
     def __init__(self):
         self.api_key = None
@@ -18,9 +23,12 @@ class GPTOCR(OCREngine):
         self.model = None
         self.api_base_url = 'https://api.openai.com/v1/chat/completions'
         self.max_tokens = 5000
+        self.dispatcher = None
+        self.sprite_sheet = None
         
     def initialize(self, api_key: str, model: str = 'GPT-4.1-mini', 
-                  expansion_percentage: int = 0) -> None:
+                  expansion_percentage: int = 0, dispatcher: dict = None,
+                  sprite_sheet: tuple[int, int] = None) -> None:
         """
         Initialize the GPT OCR with API key and parameters.
         
@@ -28,15 +36,25 @@ class GPTOCR(OCREngine):
             api_key: OpenAI API key for authentication
             model: GPT model to use for OCR (defaults to gpt-4o)
             expansion_percentage: Percentage to expand text bounding boxes
+            dispatcher: Concurrency, rate limit and retry settings shared by
+                        all OpenAI OCR requests (see `RequestDispatcher`)
+            sprite_sheet: (max_width, max_height) of the labelled mosaics the
+                          crops of a page are packed into, None to send one
+                          request per block
         """
         self.api_key = api_key
         self.model = MODEL_MAP.get(model)
         self.expansion_percentage = expansion_percentage
+        self.dispatcher = get_dispatcher('openai', dispatcher)
+        self.sprite_sheet = sprite_sheet
         
     def process_image(self, img: np.ndarray, blk_list: list[TextBlock]) -> list[TextBlock]:
         """
         Process an image with GPT-based OCR by processing individual text regions.
         
+        The requests of all blocks are sent concurrently through the shared
+        OpenAI dispatcher, packed into sprite sheets if enabled.
+        
         Args:
             img: Input image as numpy array
             blk_list: List of TextBlock objects to update with OCR text
@@ -44,6 +62,8 @@ class GPTOCR(OCREngine):
         Returns:
             List of updated TextBlock objects with recognized text
         """
+        cropped_blks = []
+        cropped_imgs = []
         for blk in blk_list:
             try:
                 # Get box coordinates
@@ -61,25 +81,39 @@ class GPTOCR(OCREngine):
                 if x1 < x2 and y1 < y2 and x1 >= 0 and y1 >= 0 and x2 <= img.shape[1] and y2 <= img.shape[0]:
                     # Crop image and encode
                     cropped_img = img[y1:y2, x1:x2]
-                    cv2_to_gpt = self.encode_image(cropped_img)
-                    
-                    # Get OCR result from GPT
-                    blk.text = self._get_gpt_ocr(cv2_to_gpt)
+                    cropped_imgs.append(cropped_img)
+                    cropped_blks.append(blk)
             except Exception as e:
                 print(f"GPT OCR error on block: {str(e)}")
                 blk.text = ""
+        
+        # Get OCR results from GPT
+        results = recognize_crops(
+            cropped_imgs, self._get_gpt_ocr, self.encode_image,
+            self.dispatcher, self.sprite_sheet
+        )
+        for blk, result in zip(cropped_blks, results):
+            if isinstance(result, Exception):
+                print(f"GPT OCR error on block: {str(result)}")
+                blk.text = ""
+            else:
+                blk.text = result
                 
         return blk_list
     
-    def _get_gpt_ocr(self, base64_image: str) -> str:
+    def _get_gpt_ocr(self, base64_image: str, prompt: str = OCR_PROMPT) -> str:
         """
         Get OCR result from GPT model using direct REST API call.
         
         Args:
             base64_image: Base64 encoded image
+            prompt: Instruction sent with the image
             
         Returns:
             OCR result text
+            
+        Raises:
+            RetryableError: On timeouts, rate limiting and transient server errors
         """
         if not self.api_key:
             raise ValueError("API key not initialized. Call initialize() first.")
@@ -98,7 +132,7 @@ class GPTOCR(OCREngine):
                     {
                         "role": "user",
                         "content": [
-                            {"type": "text", "text": "Write out the text in this image. Do NOT Translate. Do not write anything else"},
+                            {"type": "text", "text": prompt},
                             {"type": "image_url", "image_url": {"url": f"data:image/jpg;base64,{base64_image}"}}
                         ]
                     }
@@ -107,11 +141,11 @@ class GPTOCR(OCREngine):
             }
             
             # Make POST request to OpenAI API
-            response = requests.post(
+            response = post_json(
                 self.api_base_url,
+                timeout=self.dispatcher.request_timeout,
                 headers=headers,
                 data=json.dumps(payload),
-                timeout=20
             )
             
             # Parse response
@@ -124,6 +158,8 @@ class GPTOCR(OCREngine):
                 print(f"API error: {response.status_code} {response.text}")
                 return ""
                 
+        except RetryableError:
+            raise
         except Exception as e:
             print(f"GPT API request error: {str(e)}")
             return ""
\ No newline at end of file
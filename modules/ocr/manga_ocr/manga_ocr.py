@@ -27,6 +27,50 @@ class MangaOcr:
         x = post_process(x)
         return x
 
+    @torch.no_grad()
+    def batch(self, images: list[np.ndarray], batch_size: int = 16,
+              return_confidence: bool = False):
+        """
+        Recognize several crops with one preprocessing pass and one
+        `generate` call per chunk of `batch_size` crops.
+
+        Every crop is resized to the encoder input size, so crops of any
+        shape share a batch. Sequences that finish early are padded by
+        `generate` and the padding is dropped when decoding.
+
+        With `return_confidence`, also returns the geometric mean of the
+        probabilities of the generated tokens of every crop.
+        """
+        texts = []
+        confidences = []
+        for start in range(0, len(images), batch_size):
+            chunk = images[start:start + batch_size]
+            x = self.processor(chunk, return_tensors="pt").pixel_values
+            if not return_confidence:
+                x = self.model.generate(x.to(self.model.device)).cpu()
+            else:
+                out = self.model.generate(
+                    x.to(self.model.device),
+                    output_scores=True,
+                    return_dict_in_generate=True,
+                )
+                scores = self.model.compute_transition_scores(
+                    out.sequences, out.scores, normalize_logits=True
+                ).cpu()
+                x = out.sequences.cpu()
+                # Padding after the end of a finished sequence does not count
+                generated = x[:, 1:]
+                mask = generated != self.tokenizer.pad_token_id
+                mask[:, 0] = True
+                scores = torch.where(mask, scores, torch.zeros_like(scores))
+                log_probs = scores.sum(dim=1) / mask.sum(dim=1)
+                confidences.extend(torch.exp(log_probs).tolist())
+            decoded = self.tokenizer.batch_decode(x, skip_special_tokens=True)
+            texts.extend(post_process(text) for text in decoded)
+        if return_confidence:
+            return texts, confidences
+        return texts
+
 def post_process(text):
     text = ''.join(text.split())
     text = text.replace('…', '...')
@@ -8,6 +8,8 @@ from ..utils.pipeline_utils import lists_to_blk_list
 
 class MicrosoftOCR(OCREngine):
     """OCR engine using Microsoft Azure Computer Vision API."""
+
+    thread_safe = True
     
     def __init__(self):
         self.client = None
@@ -11,45 +11,42 @@ class PororoOCREngine(OCREngine):
     def __init__(self):
         self.model = None
         self.expansion_percentage = 5
+        self.composite = False
+        self.batch_size = 32
         
-    def initialize(self, lang: str = 'ko', expansion_percentage: int = 5) -> None:
+    def initialize(self, lang: str = 'ko', expansion_percentage: int = 5,
+                   composite: bool = False, batch_size: int = 32) -> None:
         """
         Initialize the PororoOCR engine.
         
         Args:
             lang: Language code for OCR model - default is 'ko' (Korean)
             expansion_percentage: Percentage to expand text bounding boxes
+            composite: Run CRAFT once over a composite of all block crops and
+                       recognize every text line of the page in batches,
+                       instead of the full pipeline per block
+            batch_size: Number of text lines per recognizer batch
         """
 
         from .main import PororoOcr
 
         self.expansion_percentage = expansion_percentage
+        self.composite = composite
+        self.batch_size = max(1, batch_size)
         if self.model is None:
             get_models(pororo_data)
             self.model = PororoOcr(lang=lang)
         
     def process_image(self, img: np.ndarray, blk_list: list[TextBlock]) -> list[TextBlock]:
+        if self.composite:
+            return self._process_composite(img, blk_list)
+        
         for blk in blk_list:
             try:
-                # Get box coordinates
-                if blk.bubble_xyxy is not None:
-                    x1, y1, x2, y2 = blk.bubble_xyxy
-                else:
-                    x1, y1, x2, y2 = adjust_text_line_coordinates(
-                        blk.xyxy, 
-                        self.expansion_percentage, 
-                        self.expansion_percentage, 
-                        img
-                    )
-                
-                # Check if coordinates are valid
-                if x1 < x2 and y1 < y2 and x1 >= 0 and y1 >= 0 and x2 <= img.shape[1] and y2 <= img.shape[0]:
+                crop = self._crop_block(img, blk)
+                if crop is not None:
                     # Crop image and run OCR
-                    cropped_img = img[y1:y2, x1:x2]
-                    self.model.run_ocr(cropped_img)
-                    result = self.model.get_ocr_result()
-                    descriptions = result.get('description', [])
-                    blk.text = ' '.join(descriptions)
+                    blk.text, blk.ocr_confidence = self._recognize_block(crop)
                 else:
                     print('Invalid textbbox to target img')
                     blk.text = ""
@@ -57,4 +54,69 @@ class PororoOCREngine(OCREngine):
                 print(f"PororoOCR error on block: {str(e)}")
                 blk.text = ""
                 
-        return blk_list
\ No newline at end of file
+        return blk_list
+    
+    def _process_composite(self, img: np.ndarray, blk_list: list[TextBlock]) -> list[TextBlock]:
+        crops = []
+        cropped_blks = []
+        for blk in blk_list:
+            try:
+                crop = self._crop_block(img, blk)
+                if crop is not None:
+                    crops.append(crop)
+                    cropped_blks.append(blk)
+                else:
+                    print('Invalid textbbox to target img')
+                    blk.text = ""
+            except Exception as e:
+                print(f"PororoOCR error on block: {str(e)}")
+                blk.text = ""
+        
+        if not crops:
+            return blk_list
+        
+        try:
+            results = self.model.run_ocr_batch(crops, batch_size=self.batch_size)
+        except Exception as e:
+            # Fall back to the per-block pipeline so one bad crop only loses its own text
+            print(f"PororoOCR batch error, retrying per block: {str(e)}")
+            for blk, crop in zip(cropped_blks, crops):
+                try:
+                    blk.text, blk.ocr_confidence = self._recognize_block(crop)
+                except Exception as e:
+                    print(f"PororoOCR error on block: {str(e)}")
+                    blk.text = ""
+            return blk_list
+        
+        for blk, result in zip(cropped_blks, results):
+            blk.text, blk.ocr_confidence = self._block_result(result)
+        
+        return blk_list
+    
+    def _crop_block(self, img: np.ndarray, blk: TextBlock):
+        # Get box coordinates
+        if blk.bubble_xyxy is not None:
+            x1, y1, x2, y2 = blk.bubble_xyxy
+        else:
+            x1, y1, x2, y2 = adjust_text_line_coordinates(
+                blk.xyxy, 
+                self.expansion_percentage, 
+                self.expansion_percentage, 
+                img
+            )
+        
+        # Check if coordinates are valid
+        if x1 < x2 and y1 < y2 and x1 >= 0 and y1 >= 0 and x2 <= img.shape[1] and y2 <= img.shape[0]:
+            return img[y1:y2, x1:x2]
+        return None
+    
+    def _recognize_block(self, crop: np.ndarray) -> tuple[str, float]:
+        self.model.run_ocr(crop)
+        return self._block_result(self.model.get_ocr_result())
+    
+    @staticmethod
+    def _block_result(result: dict) -> tuple[str, float]:
+        """Text of a block and its least confident paragraph (None without text)."""
+        descriptions = result.get('description', [])
+        confidences = result.get('confidence', [])
+        return ' '.join(descriptions), min(confidences) if confidences else None
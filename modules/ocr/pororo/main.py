@@ -29,6 +29,10 @@ class PororoOcr:
 
         return ocr_text
 
+    def run_ocr_batch(self, images: list, batch_size: int = 32):
+        """Run OCR on several images, with one detector pass per composite and batched recognition."""
+        return self._ocr.predict_batch(images, detail=True, batch_size=batch_size)
+
     @staticmethod
     def get_available_langs():
         return SUPPORTED_TASKS["ocr"].get_available_langs()
@@ -25,6 +25,7 @@ from .utils import (
     group_text_box,
     reformat_input,
 )
+from modules.utils.mosaic import crop_gap, pack_crops
 
 LOGGER = getLogger(__name__)
 
@@ -89,6 +90,10 @@ class Reader(object):
             free_list (list): e.g., []
         """
         text_box = get_textbox(self.detector, img, opt2val)
+        return self._group(text_box, opt2val)
+
+    def _group(self, text_box: list, opt2val: dict):
+        """Group CRAFT word polygons into line boxes, dropping small ones."""
         horizontal_list, free_list = group_text_box(
             text_box,
             opt2val["slope_ths"],
@@ -243,3 +248,107 @@ class Reader(object):
         )
 
         return result
+
+    def recognize_batch(
+        self,
+        images: list,
+        batch_size: int = 32,
+        paragraph: bool = True,
+        padding: int = 16,
+        **kwargs,
+    ):
+        """
+        Read text in many crops (e.g. all bubbles of a page) at once.
+        Crops are packed into composite images of at most `canvas_size` so
+        CRAFT runs once per composite instead of once per crop, and the line
+        crops of every composite go through the recognizer together in
+        batches of `batch_size`. Words CRAFT finds on a composite are mapped
+        back to their crop and grouped into lines crop by crop, so lines
+        never span two crops.
+        :param images: list of numpy arrays
+        :param padding: minimum gap between crops on a composite (see
+            `crop_gap`)
+        :param kwargs: same detection/recognition options as `__call__`
+        :return:
+            list with, for every image, the result `__call__` would return
+            (boxes relative to that image)
+        """
+        options = dict(
+            n_workers=0,
+            skip_details=False,
+            min_size=20,
+            contrast_ths=0.1,
+            adjust_contrast=0.5,
+            filter_ths=0.003,
+            text_threshold=0.7,
+            low_text=0.4,
+            link_threshold=0.4,
+            canvas_size=2560,
+            mag_ratio=1.0,
+            slope_ths=0.1,
+            ycenter_ths=0.5,
+            height_ths=0.5,
+            width_ths=0.5,
+            add_margin=0.1,
+        )
+        options.update(kwargs)
+        self.opt2val.update(options)
+        self.opt2val["batch_size"] = batch_size
+        self.opt2val["paragraph"] = paragraph
+
+        inputs = [reformat_input(image) for image in images]
+        imgs = [img for img, _ in inputs]
+        canvas_size = self.opt2val["canvas_size"]
+        # CRAFT links characters across narrow gaps
+        gap = crop_gap([img.shape for img in imgs], canvas_size, padding)
+        sheets = pack_crops(imgs, canvas_size, canvas_size, padding=gap)
+
+        # Line crops of all composites, with the crop they belong to
+        image_list, owners = [], []
+        for sheet in sheets:
+            text_box = get_textbox(self.detector, sheet.image, self.opt2val)
+            words = {index: [] for index, *_ in sheet.placements}
+            offsets = {index: (x1, y1, x2 - x1, y2 - y1)
+                       for index, x1, y1, x2, y2 in sheet.placements}
+            for poly in text_box:
+                xs, ys = poly[0::2], poly[1::2]
+                owner = sheet.overlapping(xs.min(), ys.min(), xs.max(), ys.max())
+                if owner < 0:
+                    continue
+                # Word polygon in the coordinates of its crop, clipped to it
+                x0, y0, w, h = offsets[owner]
+                local = poly.copy()
+                local[0::2] = np.clip(xs - x0, 0, w)
+                local[1::2] = np.clip(ys - y0, 0, h)
+                words[owner].append(local)
+
+            for owner, text_box in words.items():
+                if not text_box:
+                    continue
+                horizontal_list, free_list = self._group(text_box, self.opt2val)
+                lines, _ = get_image_list(
+                    horizontal_list,
+                    free_list,
+                    inputs[owner][1],
+                    model_height=self.opt2val["imgH"],
+                )
+                image_list.extend(lines)
+                owners.extend([owner] * len(lines))
+
+        per_image = [[] for _ in images]
+        if image_list:
+            result = get_text(image_list, self.recognizer, self.converter,
+                              self.opt2val)
+            for owner, item in zip(owners, result):
+                per_image[owner].append(item)
+
+        results = []
+        for result in per_image:
+            # Restore the vertical order `get_image_list` gives a single image
+            result = sorted(result, key=lambda item: item[0][0][1])
+            if paragraph:
+                result = get_paragraph(result, mode="ltr")
+            if self.opt2val["skip_details"]:
+                result = [item[1] for item in result]
+            results.append(result)
+        return results
@@ -0,0 +1,198 @@
+"""
+Batched CTC decoders for the brainOCR recognizer.
+
+`ctc_greedy_decode` and `ctc_beam_decode` process a whole batch of
+recognizer outputs at once with tensor operations, instead of the per-sample,
+per-timestep Python loops of `CTCLabelConverter.decode_greedy` and
+`ctcBeamSearch` in `utils.py`. They give the same results (see
+`benchmarks/ctc_decode.py` for the parity check and timings).
+"""
+import numpy as np
+import torch
+
+# Multiplier of the rolling hash identifying beam labelings
+_HASH_PRIME = np.uint64(0x100000001B3)
+
+
+def _collapse(labels: np.ndarray, lengths: np.ndarray, vocab: list, blank: int) -> list:
+    """
+    Texts of padded label rows, dropping blanks and repeated labels.
+
+    Args:
+        labels: (N, L) int array
+        lengths: (N,) number of valid labels of every row
+    """
+    n, width = labels.shape
+    positions = np.arange(width)[None, :]
+    previous = np.concatenate([np.full((n, 1), -1, dtype=labels.dtype), labels[:, :-1]], axis=1)
+    keep = (positions < lengths[:, None]) & (labels != blank) & (labels != previous)
+
+    rows, cols = np.nonzero(keep)
+    chars = np.asarray(vocab, dtype=object)[labels[rows, cols]]
+    bounds = np.searchsorted(rows, np.arange(n + 1))
+    return ["".join(chars[bounds[i]:bounds[i + 1]]) for i in range(n)]
+
+
+def ctc_greedy_decode(preds_prob: torch.Tensor, vocab: list, blank: int = 0) -> tuple[list, list]:
+    """
+    Greedy (best path) decoding of a batch.
+
+    Args:
+        preds_prob: (N, T, C) class probabilities, on any device
+        vocab: Label of every class
+        blank: Index of the CTC blank
+
+    Returns:
+        Texts, and their confidence (product of the best class probabilities)
+    """
+    if preds_prob.size(0) == 0:
+        return [], []
+    max_prob, indices = preds_prob.max(dim=2)
+    confidences = max_prob.cumprod(dim=1)[:, -1].cpu().tolist()
+
+    indices = indices.cpu().numpy()
+    lengths = np.full(len(indices), indices.shape[1])
+    return _collapse(indices, lengths, vocab, blank), confidences
+
+
+def ctc_beam_decode(mat: np.ndarray, vocab: list, beam_width: int = 5, blank: int = 0) -> list:
+    """
+    Beam search decoding of a batch, without language model.
+
+    Follows `ctcBeamSearch` exactly: the same beam labelings (which keep a
+    blank between repeated characters and a trailing blank), the same
+    candidate characters (probability >= 0.5 / C), the same summation order
+    and the same tie-breaking, but every beam of every sample of the batch
+    is extended in one set of array operations per time step.
+
+    Args:
+        mat: (N, T, C) class probabilities
+        vocab: Label of every class
+        beam_width: Number of labelings kept at every time step
+        blank: Index of the CTC blank
+
+    Returns:
+        Text of the most probable labeling of every sample
+    """
+    mat = np.asarray(mat)
+    n, steps, classes = mat.shape
+    if n == 0:
+        return []
+    dtype = mat.dtype
+    width = steps + 1
+    rows = np.arange(n)
+    beams = np.arange(beam_width)[None, :]
+
+    # Beams of every sample; only `valid` ones are live. Labelings are kept
+    # as label rows plus two hashes: of the whole labeling, and of the
+    # labeling without its trailing blank.
+    valid = np.zeros((n, beam_width), dtype=bool)
+    valid[:, 0] = True
+    pr_blank = np.zeros((n, beam_width), dtype=dtype)
+    pr_blank[:, 0] = 1
+    pr_non_blank = np.zeros((n, beam_width), dtype=dtype)
+    pr_total = pr_blank.copy()
+    labels = np.zeros((n, beam_width, width), dtype=np.int64)
+    lengths = np.zeros((n, beam_width), dtype=np.int64)
+    hashes = np.zeros((n, beam_width), dtype=np.uint64)
+    base_hashes = np.zeros((n, beam_width), dtype=np.uint64)
+
+    # Visiting order of `ctcBeamSearch`: beam by beam, the beam itself then its extensions
+    stay_order = np.arange(beam_width) * (classes + 1)
+    for t in range(steps):
+        probs = mat[:, t, :]
+        last = np.where(lengths > 0, labels[rows[:, None], beams, np.maximum(lengths - 1, 0)], -1)
+        before_last = np.where(lengths > 1, labels[rows[:, None], beams, np.maximum(lengths - 2, 0)], -1)
+
+        # Beams kept as they are: paths ending with a blank or repeating the last label
+        stay_pnb = np.where(lengths > 0, pr_non_blank * probs[rows[:, None], np.maximum(last, 0)], 0).astype(dtype)
+        stay_pb = pr_total * probs[:, blank][:, None]
+        stay_n, stay_b = np.nonzero(valid)
+
+        # Beams extended with every probable label
+        ext_n, ext_b, ext_c = np.nonzero(valid[:, :, None] & (probs >= 0.5 / classes)[:, None, :])
+        ext_last = last[ext_n, ext_b]
+        same = ext_last == ext_c
+        ext_pr = probs[ext_n, ext_c] * np.where(same, pr_blank[ext_n, ext_b], pr_total[ext_n, ext_b])
+
+        # Labeling after the extension: a blank after an empty labeling or a
+        # trailing blank changes nothing; a label after a trailing blank
+        # replaces it unless it repeats the label before it
+        unchanged = (ext_c == blank) & ((ext_last == -1) | (ext_last == blank))
+        drop_blank = (ext_c != blank) & (ext_last == blank) & (before_last[ext_n, ext_b] != ext_c)
+        parent_hash = np.where(drop_blank, base_hashes[ext_n, ext_b], hashes[ext_n, ext_b])
+        ext_hash = np.where(
+            unchanged,
+            hashes[ext_n, ext_b],
+            parent_hash * _HASH_PRIME + (ext_c.astype(np.uint64) + np.uint64(1)),
+        )
+
+        # All candidates in the order `ctcBeamSearch` visits them
+        cand_n = np.concatenate([stay_n, ext_n])
+        cand_b = np.concatenate([stay_b, ext_b])
+        cand_c = np.concatenate([np.full(len(stay_n), -1), ext_c])
+        cand_order = np.concatenate([stay_order[stay_b], ext_b * (classes + 1) + ext_c + 1])
+        cand_hash = np.concatenate([hashes[stay_n, stay_b], ext_hash])
+        cand_pb = np.concatenate([stay_pb[stay_n, stay_b], np.zeros(len(ext_n), dtype=dtype)])
+        cand_pnb = np.concatenate([stay_pnb[stay_n, stay_b], ext_pr])
+        cand_pt = np.concatenate([stay_pb[stay_n, stay_b] + stay_pnb[stay_n, stay_b], ext_pr])
+        cand_unchanged = np.concatenate([np.ones(len(stay_n), dtype=bool), unchanged])
+        cand_drop = np.concatenate([np.zeros(len(stay_n), dtype=bool), drop_blank])
+
+        # Merge candidates reaching the same labeling, summing in visiting order
+        order = np.lexsort((cand_order, cand_hash, cand_n))
+        key_n, key_hash = cand_n[order], cand_hash[order]
+        starts = np.ones(len(order), dtype=bool)
+        starts[1:] = (key_n[1:] != key_n[:-1]) | (key_hash[1:] != key_hash[:-1])
+        group = np.cumsum(starts) - 1
+        first = order[starts]
+        group_pb = np.zeros(len(first), dtype=dtype)
+        group_pnb = np.zeros(len(first), dtype=dtype)
+        group_pt = np.zeros(len(first), dtype=dtype)
+        np.add.at(group_pb, group, cand_pb[order])
+        np.add.at(group_pnb, group, cand_pnb[order])
+        np.add.at(group_pt, group, cand_pt[order])
+
+        # Keep the `beam_width` most probable labelings, ties in visiting order
+        group_n = cand_n[first]
+        ranking = np.lexsort((cand_order[first], -group_pt, group_n))
+        sorted_n = group_n[ranking]
+        rank = np.arange(len(ranking)) - np.searchsorted(sorted_n, sorted_n)
+        kept = ranking[rank < beam_width]
+        new_n, new_b = group_n[kept], rank[rank < beam_width]
+        source = first[kept]
+
+        # Build the labels of the kept beams from their parent beam
+        src_n, src_b, src_c = cand_n[source], cand_b[source], cand_c[source]
+        new_labels = labels[src_n, src_b].copy()
+        new_lengths = lengths[src_n, src_b].copy()
+        new_hashes = cand_hash[source]
+        new_base = base_hashes[src_n, src_b].copy()
+        append = ~cand_unchanged[source]
+        drop = cand_drop[source]
+        position = new_lengths - drop
+        new_labels[append, position[append]] = src_c[append]
+        new_lengths[append] = position[append] + 1
+        # Hash without the trailing blank: the parent's hash when a blank was
+        # just appended, the labeling's own hash when it ends with a label
+        appended_blank = append & (src_c == blank)
+        new_base = np.where(appended_blank, hashes[src_n, src_b], np.where(append, new_hashes, new_base))
+
+        valid = np.zeros((n, beam_width), dtype=bool)
+        valid[new_n, new_b] = True
+        pr_blank = np.zeros((n, beam_width), dtype=dtype)
+        pr_non_blank = np.zeros((n, beam_width), dtype=dtype)
+        pr_total = np.zeros((n, beam_width), dtype=dtype)
+        pr_blank[new_n, new_b] = group_pb[kept]
+        pr_non_blank[new_n, new_b] = group_pnb[kept]
+        pr_total[new_n, new_b] = group_pt[kept]
+        labels[new_n, new_b] = new_labels
+        lengths = np.zeros((n, beam_width), dtype=np.int64)
+        lengths[new_n, new_b] = new_lengths
+        hashes = np.zeros((n, beam_width), dtype=np.uint64)
+        hashes[new_n, new_b] = new_hashes
+        base_hashes = np.zeros((n, beam_width), dtype=np.uint64)
+        base_hashes[new_n, new_b] = new_base
+
+    # Beams are stored best first
+    return _collapse(labels[:, 0], lengths[:, 0], vocab, blank)
@@ -120,29 +120,18 @@ def recognizer_predict(model, converter, test_loader, opt2val: dict):
     result = []
     with torch.no_grad():
         for image_tensors in test_loader:
-            batch_size = image_tensors.size(0)
             inputs = image_tensors.to(device)
             preds = model(inputs)  # (N, length, num_classes)
 
-            # rebalance
+            # rebalance, on the model's device
             preds_prob = F.softmax(preds, dim=2)
-            preds_prob = preds_prob.cpu().detach().numpy()
-            pred_norm = preds_prob.sum(axis=2)
-            preds_prob = preds_prob / np.expand_dims(pred_norm, axis=-1)
-            preds_prob = torch.from_numpy(preds_prob).float().to(device)
+            preds_prob = preds_prob / preds_prob.sum(dim=2, keepdim=True)
 
             # Select max probabilty (greedy decoding), then decode index to character
-            preds_lengths = torch.IntTensor([preds.size(1)] *
-                                            batch_size)  # (N,)
-            _, preds_indices = preds_prob.max(2)  # (N, length)
-            preds_indices = preds_indices.view(-1)  # (N*length)
-            preds_str = converter.decode_greedy(preds_indices, preds_lengths)
-
-            preds_max_prob, _ = preds_prob.max(dim=2)
-
-            for pred, pred_max_prob in zip(preds_str, preds_max_prob):
-                confidence_score = pred_max_prob.cumprod(dim=0)[-1]
-                result.append([pred, confidence_score.item()])
+            preds_str, confidence_scores = converter.decode_greedy_batch(
+                preds_prob)
+            result.extend([pred, confidence_score] for pred, confidence_score
+                          in zip(preds_str, confidence_scores))
 
     return result
 
@@ -12,6 +12,7 @@ import torch
 from PIL import Image
 from torch import Tensor
 
+from .ctc import ctc_beam_decode, ctc_greedy_decode
 from .imgproc import load_image
 
 
@@ -331,7 +332,19 @@ class CTCLabelConverter(object):
             index += length
         return texts
 
+    def decode_greedy_batch(self, preds_prob: Tensor):
+        """decode a whole batch of class probabilities at once.
+
+        :param preds_prob (3D float Tensor): [N, length, num_classes]
+        :return: texts, and their confidence scores
+        """
+        return ctc_greedy_decode(preds_prob, self.vocab, self.ignored_index)
+
     def decode_beamsearch(self, mat, lm_model, lm_factor, beam_width: int = 5):
+        if lm_model is None:
+            # Without language model the whole batch is searched at once
+            return ctc_beam_decode(mat, self.vocab, beam_width, self.ignored_index)
+
         texts = []
         for i in range(mat.shape[0]):
             text = ctcBeamSearch(
@@ -574,8 +587,9 @@ def get_paragraph(raw_result,
         max_y = max(all_y)
         height = max_y - min_y
         box_group.append([
-            box[1], min_x, max_x, min_y, max_y, height, 0.5 * (min_y + max_y), 0
-        ])  # last element indicates group
+            box[1], min_x, max_x, min_y, max_y, height, 0.5 * (min_y + max_y), 0,
+            box[2] if len(box) > 2 else None,
+        ])  # element 7 indicates group, element 8 is the confidence score
     # cluster boxes into paragraph
     current_group = 1
     while len([box for box in box_group if box[7] == 0]) > 0:
@@ -617,6 +631,9 @@ def get_paragraph(raw_result,
         max_gx = max([box[2] for box in current_box_group])
         min_gy = min([box[3] for box in current_box_group])
         max_gy = max([box[4] for box in current_box_group])
+        # a paragraph is as confident as its least confident line
+        scores = [box[8] for box in current_box_group]
+        confidence = None if None in scores else min(scores)
 
         text = ""
         while len(current_box_group) > 0:
@@ -647,7 +664,7 @@ def get_paragraph(raw_result,
                 [min_gx, max_gy],
             ],
             text[1:],
-        ])
+        ] + ([] if confidence is None else [confidence]))
 
     return result
 
@@ -133,13 +133,14 @@ class PororoOCR(PororoSimpleBase):
 
         if not detail:
             return [
-                sorted_ocr_results[i][-1]
+                sorted_ocr_results[i][1]
                 for i in range(len(sorted_ocr_results))
             ]
 
         result_dict = {
             "description": list(),
             "bounding_poly": list(),
+            "confidence": list(),
         }
 
         for ocr_result in sorted_ocr_results:
@@ -152,6 +153,8 @@ class PororoOCR(PororoSimpleBase):
                 })
 
             result_dict["description"].append(ocr_result[1])
+            if len(ocr_result) > 2:
+                result_dict["confidence"].append(ocr_result[2])
             result_dict["bounding_poly"].append({
                 "description": ocr_result[1],
                 "vertices": vertices
@@ -179,3 +182,25 @@ class PororoOCR(PororoSimpleBase):
             ),
             detail,
         )
+
+    def predict_batch(self, images: list, **kwargs):
+        """
+        Conduct Optical Character Recognition (OCR) on many images at once
+
+        Args:
+            images (list): numpy arrays, e.g. the text block crops of a page
+            detail (bool): if True, returned to include details. (bounding poly, vertices, etc)
+            batch_size (int): number of line crops per recognizer batch
+
+        """
+        detail = kwargs.get("detail", False)
+        batch_size = kwargs.get("batch_size", 32)
+
+        return [
+            self._postprocess(ocr_results, detail)
+            for ocr_results in self._model.recognize_batch(
+                images,
+                batch_size=batch_size,
+                paragraph=True,
+            )
+        ]
@@ -1,9 +1,12 @@
+import json
 import numpy as np
-from typing import Any
+from typing import Any, Optional
 
+from store.ocr_cache import OCRCache
 from ..utils.textblock import TextBlock
 from ..utils.pipeline_utils import language_codes
 from .factory import OCRFactory
+from .dispatcher import dispatcher_stats
 
 
 class OCRProcessor:
@@ -11,11 +14,14 @@ class OCRProcessor:
     Processor for OCR operations using various engines.
 
     Uses a factory pattern to create and utilize the appropriate OCR engine
-    based on settings and language.
+    based on settings and language. With a cache, blocks whose crop was
+    already recognized by the same engine and language are not sent to the
+    engine again, and no engine is checked out when every block hits.
     """
 
-    def __init__(self, config: dict = {}):
+    def __init__(self, config: dict = {}, cache: Optional[OCRCache] = None):
         self.config: dict = config
+        self.cache = cache
         self.source_lang = None
         self.source_lang_english = None
 
@@ -51,18 +57,82 @@ class OCRProcessor:
         self._set_source_language(blk_list)
 
         try:
-            # Get appropriate OCR engine from factory
-            engine = OCRFactory.create_engine(
-                self.config, self.source_lang_english, self.ocr_model
-            )
-
-            # Process image with selected engine
-            return engine.process_image(img, blk_list)
-
+            if self.cache is not None:
+                return self._process_cached(img, blk_list)
+            # Check out an appropriate OCR engine from the factory pool
+            with self._lease() as engine:
+                # Process image with selected engine
+                return engine.process_image(img, blk_list)
+
+        except TimeoutError:
+            # No engine became free: fail the page rather than return it untranslated
+            raise
         except Exception as e:
             print(f"OCR processing error: {str(e)}")
             return blk_list
 
+    def _lease(self):
+        return OCRFactory.lease(self.config, self.source_lang_english, self.ocr_model)
+
+    def _process_cached(self, img: np.ndarray, blk_list: list[TextBlock]) -> list[TextBlock]:
+        """Serve blocks from the cache and run the engine on the misses only."""
+        namespace = json.dumps(
+            OCRFactory.cache_signature(self.config, self.source_lang_english, self.ocr_model),
+            sort_keys=True,
+        )
+        keys = [self.cache.make_key(self._cache_crop(img, blk), namespace) for blk in blk_list]
+        cached = self.cache.get_many(keys)
+
+        missing = []
+        for blk, key in zip(blk_list, keys):
+            text = cached.get(key)
+            if text is None:
+                missing.append((blk, key))
+            else:
+                blk.text = text
+
+        if missing:
+            with self._lease() as engine:
+                engine.process_image(img, [blk for blk, _ in missing])
+                for blk, key in missing:
+                    if engine.is_cacheable(blk):
+                        self.cache.put(key, blk.text)
+        return blk_list
+
+    @staticmethod
+    def _cache_crop(img: np.ndarray, blk: TextBlock) -> np.ndarray:
+        """
+        Pixels identifying a block for the cache: the region covering the text
+        box and its bubble (engines crop either), with both boxes drawn in as
+        their position inside the region also changes the result.
+        """
+        boxes = [blk.xyxy] if blk.bubble_xyxy is None else [blk.xyxy, blk.bubble_xyxy]
+        h, w = img.shape[:2]
+        x1 = max(0, min(int(b[0]) for b in boxes))
+        y1 = max(0, min(int(b[1]) for b in boxes))
+        x2 = min(w, max(int(b[2]) for b in boxes))
+        y2 = min(h, max(int(b[3]) for b in boxes))
+        geometry = np.array(
+            [int(v) - o for b in boxes for v, o in zip(b, (x1, y1, x1, y1))], dtype=np.int32
+        )
+        crop = np.ascontiguousarray(img[y1:y2, x1:x2])
+        return np.concatenate([geometry.view(np.uint8), crop.reshape(-1)])
+
+    def uses_network(self) -> bool:
+        """Whether the configured engine is a remote API (cloud or LLM OCR)."""
+        return OCRFactory.is_remote_engine(self.source_lang_english, self.ocr_model)
+
+    def stats(self) -> dict:
+        """Runtime statistics of the OCR engines (request dispatchers, engine pool, cascades, cache...)."""
+        stats = {
+            "dispatchers": dispatcher_stats(),
+            "pool": OCRFactory.pool_stats(),
+            "engines": OCRFactory.engine_stats(),
+        }
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
     def _set_source_language(self, blk_list: list[TextBlock]) -> None:
         source_lang_code = language_codes.get(self.source_lang_english, "en")
         for blk in blk_list:
@@ -0,0 +1,132 @@
+"""
+Sprite-sheet mode for LLM OCR engines.
+
+Instead of one request per text block, the crops of a page are labelled with
+a number, packed into a few mosaic images sized for the provider's image
+budget and sent in one request per mosaic. The model answers with JSON keyed
+by label; blocks whose label is missing from the answer are retried one by one.
+"""
+import json
+import re
+from typing import Callable
+
+import cv2
+import numpy as np
+
+from ..utils.mosaic import Sheet, pack_crops
+from .dispatcher import RequestDispatcher
+
+SPRITE_PROMPT = (
+    "This image contains several text regions from a comic page. Each region "
+    "is framed in red with its number written in red above it. Write out the "
+    "text of every region. Do NOT Translate. Answer with only a JSON object "
+    "mapping each region number to its text, for example "
+    '{"1": "text of region 1", "2": "text of region 2"}. '
+    'Use "" for a region without text.'
+)
+
+LABEL_HEIGHT = 28
+LABEL_COLOR = (0, 0, 255)
+
+
+def label_crop(crop: np.ndarray, label: str) -> np.ndarray:
+    """Frame a crop and write its label in a strip above it."""
+    if crop.ndim == 2:
+        crop = cv2.cvtColor(crop, cv2.COLOR_GRAY2BGR)
+    framed = cv2.copyMakeBorder(crop, 2, 2, 2, 2, cv2.BORDER_CONSTANT, value=LABEL_COLOR)
+    labelled = cv2.copyMakeBorder(
+        framed, LABEL_HEIGHT, 0, 0, 0, cv2.BORDER_CONSTANT, value=(255, 255, 255)
+    )
+    cv2.putText(
+        labelled, label, (2, LABEL_HEIGHT - 6), cv2.FONT_HERSHEY_SIMPLEX,
+        0.8, LABEL_COLOR, 2, cv2.LINE_AA
+    )
+    return labelled
+
+
+def build_sheets(crops: list[np.ndarray], max_width: int, max_height: int,
+                 padding: int = 12) -> list[Sheet]:
+    """
+    Label crops 1..N and pack them into sheets of at most `max_width` x
+    `max_height`. Crops too large for a sheet are shrunk to fit.
+    """
+    labelled = []
+    for index, crop in enumerate(crops):
+        # Room left for the crop once frame, label strip and padding are added
+        room_w = max_width - 2 * padding - 4
+        room_h = max_height - 2 * padding - 4 - LABEL_HEIGHT
+        h, w = crop.shape[:2]
+        scale = min(1.0, room_w / w, room_h / h)
+        if scale < 1:
+            crop = cv2.resize(crop, (max(1, int(w * scale)), max(1, int(h * scale))),
+                              interpolation=cv2.INTER_AREA)
+        labelled.append(label_crop(crop, str(index + 1)))
+    return pack_crops(labelled, max_width, max_height, padding=padding)
+
+
+def parse_labelled_json(text: str) -> dict[str, str]:
+    """
+    Extract the {label: text} object from a model answer, tolerating code
+    fences and surrounding prose.
+
+    Returns:
+        Dictionary of label to text, empty if no valid JSON object was found
+    """
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    if not match:
+        return {}
+    try:
+        answer = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(answer, dict):
+        return {}
+    return {
+        str(label).strip().lstrip("#"): value if isinstance(value, str) else str(value)
+        for label, value in answer.items()
+        if value is not None
+    }
+
+
+def recognize_crops(crops: list[np.ndarray],
+                    request_fn: Callable[..., str],
+                    encode: Callable[[np.ndarray], str],
+                    dispatcher: RequestDispatcher,
+                    sheet_size: tuple[int, int] = None) -> list:
+    """
+    OCR crops with an LLM, through sprite sheets if `sheet_size` is given.
+
+    Args:
+        crops: Block crops of a page
+        request_fn: `request_fn(base64_image)` returns the text of one crop,
+                    `request_fn(base64_image, prompt)` answers a custom prompt
+        encode: Image to base64 encoder
+        dispatcher: Provider dispatcher the requests go through
+        sheet_size: (max_width, max_height) of a sheet, None for per-block requests
+
+    Returns:
+        Text (or the exception raised) of every crop, in order
+    """
+    results = [None] * len(crops)
+
+    if sheet_size and len(crops) > 1:
+        sheets = build_sheets(crops, *sheet_size)
+        answers = dispatcher.map(
+            lambda sheet: request_fn(encode(sheet.image), SPRITE_PROMPT), sheets
+        )
+        for sheet, answer in zip(sheets, answers):
+            if isinstance(answer, Exception):
+                print(f"Sprite sheet OCR error: {str(answer)}")
+                continue
+            texts = parse_labelled_json(answer)
+            for index, *_ in sheet.placements:
+                text = texts.get(str(index + 1))
+                if text is not None:
+                    results[index] = text
+
+    # Per-block requests for everything the sheets did not answer
+    missing = [index for index, result in enumerate(results) if result is None]
+    fallback = dispatcher.map(lambda index: request_fn(encode(crops[index])), missing)
+    for index, result in zip(missing, fallback):
+        results[index] = result
+    return results
@@ -1,7 +1,8 @@
 import json
 import hashlib
+from contextlib import contextmanager
 
-from .base import TranslationEngine
+from .base import LLMTranslation, TranslationEngine
 from .google import GoogleTranslation
 from .microsoft import MicrosoftTranslation
 from .deepl import DeepLTranslation
@@ -11,12 +12,14 @@ from .llm.claude import ClaudeTranslation
 from .llm.gemini import GeminiTranslation
 from .llm.deepseek import DeepseekTranslation
 from .llm.custom import CustomTranslation
+from ..utils.engine_pool import EnginePool
 
 
 class TranslationFactory:
     """Factory for creating appropriate translation engines based on config."""
 
-    _engines = {}  # Cache of created engines
+    # Loaded engines, bounded by estimated memory and checked out per request
+    _pool = EnginePool("translation")
 
     # Map traditional translation services to their engine classes
     TRADITIONAL_ENGINES = {
@@ -40,11 +43,13 @@ class TranslationFactory:
     DEFAULT_LLM_ENGINE = GPTTranslation
 
     @classmethod
-    def create_engine(
+    @contextmanager
+    def lease(
         cls, config: dict, source_lang: str, target_lang: str, translator_model: str
-    ) -> TranslationEngine:
+    ):
         """
-        Create or retrieve an appropriate translation engine based on config.
+        Check out an appropriate translation engine based on config, for
+        exclusive use until the block exits.
 
         Args:
             config: config object with translation configuration
@@ -52,18 +57,35 @@ class TranslationFactory:
             target_lang: Target language name
             translator_model: Key identifying which translator to use
 
-        Returns:
+        Yields:
             Appropriate translation engine instance
         """
+        cls._pool.configure(**config.get("engine_pool", {}))
+
         # Create a cache key based on translator and language pair
         cache_key = cls._create_cache_key(
             translator_model, source_lang, target_lang, config
         )
 
-        # Return cached engine if available
-        if cache_key in cls._engines:
-            return cls._engines[cache_key]
+        # Reuse an idle engine, or create one
+        with cls._pool.lease(
+            cache_key,
+            lambda: cls._create_new_engine(
+                config, source_lang, target_lang, translator_model
+            ),
+        ) as engine:
+            yield engine
 
+    @classmethod
+    def pool_stats(cls) -> dict:
+        """Occupancy of the engine pool."""
+        return cls._pool.stats()
+
+    @classmethod
+    def _create_new_engine(
+        cls, config: dict, source_lang: str, target_lang: str, translator_model: str
+    ) -> TranslationEngine:
+        """Create and initialize a translation engine."""
         # Determine engine class and create engine
         engine_class = cls._get_engine_class(translator_model)
         engine = engine_class()
@@ -73,11 +95,13 @@ class TranslationFactory:
             engine.initialize(config, source_lang, target_lang)
         else:
             engine.initialize(config, source_lang, target_lang, translator_model)
-
-        # Cache the engine
-        cls._engines[cache_key] = engine
         return engine
 
+    @classmethod
+    def is_llm_engine(cls, translator_model: str) -> bool:
+        """Whether the translator takes the page image and extra context."""
+        return issubclass(cls._get_engine_class(translator_model), LLMTranslation)
+
     @classmethod
     def _get_engine_class(cls, translator_model: str):
         """Get the appropriate engine class based on translator key."""
@@ -1,7 +1,6 @@
 import numpy as np
 
 from ..utils.textblock import TextBlock
-from .base import LLMTranslation
 from .factory import TranslationFactory
 
 
@@ -35,13 +34,9 @@ class Translator:
         self.target_lang = self.config.get("target_lang", "Vietnamese")
         self.target_lang_en = self._get_english_lang(self.config, self.target_lang)
 
-        # Create appropriate engine using factory
-        self.engine = TranslationFactory.create_engine(
-            self.config, self.source_lang_en, self.target_lang_en, self.translator_key
-        )
-
-        # Track engine type for method dispatching
-        self.is_llm_engine = isinstance(self.engine, LLMTranslation)
+        # Track engine type for method dispatching; the engine itself is
+        # checked out from the factory pool for every translation
+        self.is_llm_engine = TranslationFactory.is_llm_engine(self.translator_key)
 
     def _get_translator_key(self, localized_translator: str) -> str:
         """
@@ -99,9 +94,16 @@ class Translator:
         Returns:
             List of updated TextBlock objects with translations
         """
-        if self.is_llm_engine:
-            # LLM translators need image and extra context
-            return self.engine.translate(blk_list, image, extra_context)
-        else:
-            # Text-based translators only need the text blocks
-            return self.engine.translate(blk_list)
+        with TranslationFactory.lease(
+            self.config, self.source_lang_en, self.target_lang_en, self.translator_key
+        ) as engine:
+            if self.is_llm_engine:
+                # LLM translators need image and extra context
+                return engine.translate(blk_list, image, extra_context)
+            else:
+                # Text-based translators only need the text blocks
+                return engine.translate(blk_list)
+
+    def stats(self) -> dict:
+        """Occupancy of the translation engine pool."""
+        return {"pool": TranslationFactory.pool_stats()}
@@ -17,6 +17,13 @@ def is_image_file(filename):
     return filename.lower().endswith(image_extensions)
 
 
+def is_archive_file(filename):
+    archive_extensions = (
+        ".cbr", ".cbz", ".cbt", ".cb7", ".zip", ".rar", ".7z", ".tar", ".pdf", ".epub"
+    )
+    return filename.lower().endswith(archive_extensions)
+
+
 def extract_archive(file_path: str, extract_to: str):
     image_paths = []
     file_lower = file_path.lower()
@@ -0,0 +1,256 @@
+"""
+Bounded pool of loaded OCR / translation engines.
+
+Engines are keyed like the factories' former `_engines` dicts (model,
+language and credentials hash). Every key holds up to `replicas` instances,
+and each instance is used by one request at a time (checkout / release),
+so engines that are not thread-safe are never shared by concurrent requests.
+Engines declaring `thread_safe = True` (API clients) are instead loaded once
+and leased to any number of requests at the same time.
+The memory of all idle and in-use instances is estimated when they are
+created. Once the total exceeds `max_bytes`, keys that are idle are evicted
+in least recently used order.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable
+
+# Fallback estimate when an engine holds no measurable model (API clients)
+MIN_ENGINE_BYTES = 1024 * 1024
+
+
+def _rss_bytes() -> int:
+    """Resident set size of the process, 0 where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def _module_bytes(obj: Any, depth: int = 3, seen: set = None) -> int:
+    """Bytes of the torch parameters and buffers reachable from an engine's attributes."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen or depth < 0:
+        return 0
+    seen.add(id(obj))
+
+    if hasattr(obj, "parameters") and hasattr(obj, "buffers"):
+        try:
+            tensors = list(obj.parameters()) + list(obj.buffers())
+            return sum(t.numel() * t.element_size() for t in tensors)
+        except Exception:
+            return 0
+
+    total = 0
+    for value in getattr(obj, "__dict__", {}).values():
+        if isinstance(value, (str, bytes, int, float, bool, type(None))):
+            continue
+        total += _module_bytes(value, depth - 1, seen)
+    return total
+
+
+def estimate_engine_bytes(engine: Any, rss_delta: int = 0) -> int:
+    """
+    Estimated resident memory of an engine.
+
+    The larger of the torch weights found on the engine and the growth of
+    the process RSS while it was created (which also covers ONNX and
+    Paddle models), and at least `MIN_ENGINE_BYTES`.
+    """
+    return max(MIN_ENGINE_BYTES, _module_bytes(engine), rss_delta)
+
+
+class _Entry:
+    """Instances of one engine key."""
+
+    def __init__(self):
+        self.engines: list = []  # every created instance
+        self.idle: list = []
+        self.instances = 0  # idle + in use + being created
+        self.in_use = 0
+        self.shared = False  # the first instance is thread-safe, lease it to everyone
+        self.bytes = 0
+        self.last_used = time.monotonic()
+
+
+class EnginePool:
+    """
+    LRU pool of engines bounded by estimated memory.
+
+    Use `lease(key, factory)` as a context manager: it checks out an idle
+    instance of `key`, creates one with `factory()` when all are busy and
+    fewer than `replicas` exist, or waits for one to be returned. Instances
+    with a true `thread_safe` attribute are shared by every lease of their key.
+    """
+
+    def __init__(self, name: str, max_bytes: int = 4 * 1024 ** 3,
+                 replicas: int = 1, checkout_timeout: float = 300.0):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.replicas = max(1, replicas)
+        self.checkout_timeout = checkout_timeout
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._owners: dict[int, _Entry] = {}  # id of every loaded instance -> its entry
+        self._cond = threading.Condition()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.evictions = 0
+
+    def configure(self, max_bytes: int = None, replicas: int = None,
+                  checkout_timeout: float = None) -> None:
+        """Update the limits; they apply from the next checkout."""
+        with self._cond:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if replicas is not None:
+                self.replicas = max(1, replicas)
+            if checkout_timeout is not None:
+                self.checkout_timeout = checkout_timeout
+            self._cond.notify_all()
+
+    @contextmanager
+    def lease(self, key: str, factory: Callable[[], Any]):
+        """Check out an instance of `key` for the duration of the block."""
+        engine = self.checkout(key, factory)
+        try:
+            yield engine
+        finally:
+            self.release(key, engine)
+
+    def checkout(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Take an instance of `key` for exclusive use (shared use for
+        thread-safe engines). Return it with `release`.
+
+        Raises:
+            TimeoutError: if no instance became free within `checkout_timeout`
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._cond:
+            waited = False
+            while True:
+                # Fetch the entry again after every wait: a failed load may
+                # have dropped it, or eviction replaced it, in the meantime
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._entries[key] = _Entry()
+                self._entries.move_to_end(key)
+                entry.last_used = time.monotonic()
+                if (entry.shared and entry.engines) or entry.idle:
+                    break
+                # Only load more replicas once the first instance told whether
+                # it is thread-safe (one shared instance is then enough)
+                if entry.instances < self.replicas and (entry.engines or not entry.instances):
+                    break
+                waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No {self.name} engine '{key}' free")
+                self._cond.wait(remaining)
+            if waited:
+                self.waits += 1
+
+            entry.in_use += 1
+            if entry.shared and entry.engines:
+                self.hits += 1
+                return entry.engines[0]
+            if entry.idle:
+                self.hits += 1
+                return entry.idle.pop()
+            # Reserve the slot, then load the model outside the lock
+            entry.instances += 1
+            self.misses += 1
+
+        try:
+            rss_before = _rss_bytes()
+            engine = factory()
+            size = estimate_engine_bytes(engine, _rss_bytes() - rss_before)
+        except BaseException:
+            with self._cond:
+                entry.instances -= 1
+                entry.in_use -= 1
+                self._drop_if_empty(key, entry)
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            entry.engines.append(engine)
+            entry.shared = entry.shared or getattr(engine, "thread_safe", False)
+            entry.bytes += size
+            self.current_bytes += size
+            self._owners[id(engine)] = entry
+            self._evict()
+            # Requests waiting on a thread-safe engine can all use it now
+            self._cond.notify_all()
+        return engine
+
+    def release(self, key: str, engine: Any) -> None:
+        """Return an instance taken with `checkout`."""
+        with self._cond:
+            # The entry the instance was checked out from, not whatever
+            # entry `key` maps to now
+            entry = self._owners.get(id(engine))
+            if entry is None:
+                return
+            entry.in_use -= 1
+            if not entry.shared:
+                entry.idle.append(engine)
+            entry.last_used = time.monotonic()
+            self._evict()
+            self._cond.notify_all()
+
+    def instances(self) -> list[tuple[str, Any]]:
+        """(key, engine) of every loaded instance, e.g. to collect their statistics."""
+        with self._cond:
+            return [(key, engine) for key, entry in self._entries.items() for engine in entry.engines]
+
+    def stats(self) -> dict:
+        """Pool occupancy and checkout counters."""
+        with self._cond:
+            checkouts = self.hits + self.misses
+            return {
+                "engines": len(self._entries),
+                "instances": sum(e.instances for e in self._entries.values()),
+                "in_use": sum(e.in_use for e in self._entries.values()),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "replicas": self.replicas,
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / checkouts if checkouts else 0.0,
+                "keys": {
+                    key: {"instances": e.instances, "in_use": e.in_use,
+                          "shared": e.shared, "bytes": e.bytes}
+                    for key, e in self._entries.items()
+                },
+            }
+
+    def _evict(self) -> None:
+        # Called with the lock held. Only whole keys without a checked out
+        # instance can go; the most recently used key always stays.
+        for key in list(self._entries):
+            if self.current_bytes <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            # An instance still being created is counted but not yet listed
+            if entry.in_use or entry.instances != len(entry.engines) or key == next(reversed(self._entries)):
+                continue
+            del self._entries[key]
+            self.current_bytes -= entry.bytes
+            self.evictions += 1
+            for engine in entry.engines:
+                self._owners.pop(id(engine), None)
+            entry.idle.clear()
+            entry.engines.clear()
+
+    def _drop_if_empty(self, key: str, entry: "_Entry") -> None:
+        if entry.instances == 0 and self._entries.get(key) is entry:
+            del self._entries[key]
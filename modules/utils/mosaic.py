@@ -0,0 +1,183 @@
+"""
+Pack many small crops into a few large images (sprite sheets).
+
+Used to run a detector once over all text blocks of a page, or to send all
+crops to an OCR provider in one image, and map the results back to the crops.
+"""
+import numpy as np
+
+
+class Sheet:
+    """A packed image and where every crop was placed on it."""
+
+    def __init__(self, image: np.ndarray, placements: list[tuple[int, int, int, int, int]]):
+        self.image = image
+        # (crop index, x1, y1, x2, y2) in sheet coordinates
+        self.placements = placements
+
+    def overlapping(self, x1: float, y1: float, x2: float, y2: float) -> int:
+        """
+        Index of the crop a box of the sheet overlaps the most.
+
+        Returns:
+            Crop index, or -1 if the box only covers padding
+        """
+        best, best_area = -1, 0
+        for index, px1, py1, px2, py2 in self.placements:
+            area = max(0, min(x2, px2) - max(x1, px1)) * max(0, min(y2, py2) - max(y1, py1))
+            if area > best_area:
+                best, best_area = index, area
+        return best
+
+
+def crop_gap(shapes: list[tuple], max_size: int, padding: int = 16) -> int:
+    """
+    Gap to leave between crops on a sheet so text detectors do not link the
+    text of neighbouring crops: about a text line, taken as a quarter of the
+    short side of the largest crop.
+
+    Args:
+        shapes: (height, width, ...) of every crop
+        max_size: Sheet size; the gap stays within a sixteenth of it so
+                  sheets remain dense
+        padding: Minimum gap
+
+    Returns:
+        Gap in pixels
+    """
+    line = max((min(shape[:2]) // 4 for shape in shapes), default=0)
+    return max(padding, min(line, max_size // 16))
+
+
+def pack_crops(crops: list[np.ndarray], max_width: int, max_height: int,
+               padding: int = 16, background: int = 255) -> list[Sheet]:
+    """
+    Shelf-pack crops into sheets of at most `max_width` x `max_height`.
+
+    Crops are placed tallest first, left to right on shelves, with `padding`
+    pixels of `background` around each so that neighbours never touch. A crop
+    larger than the sheet size gets a sheet of its own. Sheets are trimmed to
+    the area actually used.
+
+    Args:
+        crops: Images with the same number of channels
+        max_width: Maximum sheet width
+        max_height: Maximum sheet height
+        padding: Gap between crops and around the sheet border
+        background: Fill value of the empty area
+
+    Returns:
+        List of sheets
+    """
+    order = sorted(range(len(crops)), key=lambda i: crops[i].shape[0], reverse=True)
+
+    layouts = []  # one list of (index, x, y) per sheet
+    current = []
+    x = y = padding
+    shelf_height = 0
+    for index in order:
+        h, w = crops[index].shape[:2]
+        if h + 2 * padding > max_height or w + 2 * padding > max_width:
+            layouts.append([(index, padding, padding)])
+            continue
+        if x + w + padding > max_width and x > padding:
+            # Next shelf
+            x = padding
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + h + padding > max_height and current:
+            # Next sheet
+            layouts.append(current)
+            current = []
+            x = y = padding
+            shelf_height = 0
+        current.append((index, x, y))
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    if current:
+        layouts.append(current)
+
+    sheets = []
+    for layout in layouts:
+        width = max(x + crops[i].shape[1] for i, x, _ in layout) + padding
+        height = max(y + crops[i].shape[0] for i, _, y in layout) + padding
+        shape = (height, width) + crops[layout[0][0]].shape[2:]
+        image = np.full(shape, background, dtype=crops[layout[0][0]].dtype)
+
+        placements = []
+        for index, x, y in layout:
+            h, w = crops[index].shape[:2]
+            image[y:y + h, x:x + w] = crops[index]
+            placements.append((index, x, y, x + w, y + h))
+        sheets.append(Sheet(image, placements))
+    return sheets
+
+
+def merge_regions(regions, image_shape: tuple, margin: int = 0) -> list[tuple[int, int, int, int]]:
+    """
+    Grow regions by `margin`, clip them to the image and merge the ones that
+    overlap, so no pixel is cropped (and recognized) twice.
+
+    Args:
+        regions: Boxes as [x1, y1, x2, y2]
+        image_shape: Shape of the image the regions belong to
+        margin: Pixels added on every side of a region
+
+    Returns:
+        Disjoint integer boxes, sorted top to bottom
+    """
+    h, w = image_shape[:2]
+    boxes = []
+    for x1, y1, x2, y2 in regions:
+        box = [
+            max(0, int(min(x1, x2)) - margin), max(0, int(min(y1, y2)) - margin),
+            min(w, int(max(x1, x2)) + margin), min(h, int(max(y1, y2)) + margin),
+        ]
+        if box[2] > box[0] and box[3] > box[1]:
+            boxes.append(box)
+
+    merged = True
+    while merged:
+        merged = False
+        result = []
+        for box in boxes:
+            for other in result:
+                if box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]:
+                    other[:] = [min(box[0], other[0]), min(box[1], other[1]),
+                                max(box[2], other[2]), max(box[3], other[3])]
+                    merged = True
+                    break
+            else:
+                result.append(box)
+        boxes = result
+    return sorted((tuple(box) for box in boxes), key=lambda b: (b[1], b[0]))
+
+
+def pack_regions(image: np.ndarray, regions: list[tuple[int, int, int, int]],
+                 max_width: int, max_height: int, padding: int = 16,
+                 background: int = 255) -> list[Sheet]:
+    """Pack the image crops of disjoint regions into composite sheets (see `pack_crops`)."""
+    crops = [image[y1:y2, x1:x2] for x1, y1, x2, y2 in regions]
+    return pack_crops(crops, max_width, max_height, padding=padding, background=background)
+
+
+def sheet_box_to_image(sheet: Sheet, regions: list[tuple[int, int, int, int]], box) -> tuple | None:
+    """
+    Map a box found on a sheet made by `pack_regions` back to image coordinates.
+
+    The box belongs to the crop it overlaps the most, and is clipped to it.
+
+    Returns:
+        (region index, (x1, y1, x2, y2) in image coordinates), or None if the
+        box only covers the padding between crops
+    """
+    x1, y1, x2, y2 = box
+    index = sheet.overlapping(x1, y1, x2, y2)
+    if index < 0:
+        return None
+    _, px1, py1, px2, py2 = next(p for p in sheet.placements if p[0] == index)
+    rx1, ry1 = regions[index][:2]
+    return index, (
+        max(x1, px1) - px1 + rx1, max(y1, py1) - py1 + ry1,
+        min(x2, px2) - px1 + rx1, min(y2, py2) - py1 + ry1,
+    )
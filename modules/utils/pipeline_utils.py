@@ -4,10 +4,11 @@ import os
 import base64
 
 from .textblock import TextBlock, sort_textblock_rectangles
-from ..detection.utils.general import (
-    does_rectangle_fit,
-    is_mostly_contained,
-    get_inpaint_bboxes,
+from ..detection.utils.general import get_inpaint_bboxes
+from ..detection.utils.geometry import (
+    grid_containment,
+    pairwise_fits,
+    pairwise_mostly_contained,
 )
 from ..inpainting.lama import LaMa
 from ..inpainting.mi_gan import MIGAN
@@ -92,25 +93,42 @@ def encode_image_array(img_array: np.ndarray):
     return base64.b64encode(img_bytes).decode("utf-8")
 
 
+# Block × line pairs above which lines are matched through a spatial grid
+# instead of testing every pair (measured crossover, see benchmarks/ocr_line_matching.py)
+GRID_MIN_PAIRS = 40000
+
+
 def lists_to_blk_list(
-    blk_list: list[TextBlock], texts_bboxes: list, texts_string: list
+    blk_list: list[TextBlock], texts_bboxes: list, texts_string: list,
+    texts_confidence: list = None,
 ):
     group = list(zip(texts_bboxes, texts_string))
 
-    for blk in blk_list:
-        blk_entries = []
-
-        for line, text in group:
-            if blk.bubble_xyxy is not None:
-                if does_rectangle_fit(blk.bubble_xyxy, line):
-                    blk_entries.append((line, text))
-                elif is_mostly_contained(blk.bubble_xyxy, line, 0.5):
-                    blk_entries.append((line, text))
-
-            elif does_rectangle_fit(blk.xyxy, line):
-                blk_entries.append((line, text))
-            elif is_mostly_contained(blk.xyxy, line, 0.5):
-                blk_entries.append((line, text))
+    # A line belongs to a block if it fits in (or is mostly inside) the
+    # block's bubble, or the block itself when it has no bubble
+    regions = [
+        blk.bubble_xyxy if blk.bubble_xyxy is not None else blk.xyxy
+        for blk in blk_list
+    ]
+    if group and regions and len(group) * len(regions) >= GRID_MIN_PAIRS:
+        membership = grid_containment(regions, texts_bboxes, 0.5)
+    elif group and regions:
+        membership = pairwise_fits(regions, texts_bboxes) | pairwise_mostly_contained(
+            regions, texts_bboxes, 0.5
+        )
+    else:
+        membership = np.zeros((len(regions), len(group)), dtype=bool)
+
+    for blk, members in zip(blk_list, membership):
+        member_idx = np.flatnonzero(members)
+        blk_entries = [group[idx] for idx in member_idx]
+
+        # A block is as uncertain as its least confident line
+        if texts_confidence is not None:
+            blk.ocr_confidence = (
+                float(min(texts_confidence[idx] for idx in member_idx))
+                if len(member_idx) else None
+            )
 
         # Sort and join text entries
         sorted_entries = sort_textblock_rectangles(
@@ -0,0 +1,78 @@
+"""
+Compact binary serialization for pipeline objects.
+
+Uses msgpack with extension types so that numpy arrays and TextBlock
+objects survive a round trip through a database column or a file on disk.
+"""
+import msgpack
+import numpy as np
+
+from .textblock import TextBlock
+
+# msgpack extension type codes
+EXT_NDARRAY = 1
+EXT_TEXTBLOCK = 2
+
+
+def _default(obj):
+    """Encode objects msgpack does not know about."""
+    if isinstance(obj, np.ndarray):
+        payload = msgpack.packb(
+            [obj.dtype.str, list(obj.shape), np.ascontiguousarray(obj).tobytes()]
+        )
+        return msgpack.ExtType(EXT_NDARRAY, payload)
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+
+    if isinstance(obj, TextBlock):
+        payload = msgpack.packb(vars(obj), default=_default, use_bin_type=True)
+        return msgpack.ExtType(EXT_TEXTBLOCK, payload)
+
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def _ext_hook(code: int, data: bytes):
+    """Decode the extension types produced by `_default`."""
+    if code == EXT_NDARRAY:
+        dtype, shape, buffer = msgpack.unpackb(data)
+        # Copy so the array owns writable memory instead of pointing into `data`
+        return np.frombuffer(buffer, dtype=np.dtype(dtype)).reshape(shape).copy()
+
+    if code == EXT_TEXTBLOCK:
+        attributes = msgpack.unpackb(
+            data, ext_hook=_ext_hook, raw=False, strict_map_key=False
+        )
+        blk = TextBlock.__new__(TextBlock)
+        blk.__dict__.update(attributes)
+        return blk
+
+    return msgpack.ExtType(code, data)
+
+
+def pack(obj) -> bytes:
+    """
+    Serialize an object (dicts, lists, numpy arrays, TextBlocks...) to bytes.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        msgpack encoded bytes
+    """
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+
+def unpack(data: bytes):
+    """
+    Deserialize bytes produced by `pack`.
+
+    Args:
+        data: msgpack encoded bytes
+
+    Returns:
+        The decoded object
+    """
+    return msgpack.unpackb(
+        data, ext_hook=_ext_hook, raw=False, strict_map_key=False
+    )
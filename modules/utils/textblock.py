@@ -1,3 +1,4 @@
+import bisect
 from typing import List, Tuple
 import numpy as np
 import cv2
@@ -46,6 +47,8 @@ class TextBlock(object):
             )
         self.texts = texts if texts is not None else []
         self.text = " ".join(self.texts) if self.texts else text
+        # Recognition confidence in [0, 1] reported by the OCR engine, if any
+        self.ocr_confidence = None
         self.translation = translation
 
         self.line_spacing = line_spacing
@@ -105,57 +108,55 @@ def sort_textblock_rectangles(
     threshold: int = 10,
 ):
 
-    def in_same_line(bbox_a, bbox_b, direction, threshold):
-        """
-        Checks if two bounding boxes are on the same line based on their relative positions.
-
-        Args:
-            bbox_a (tuple): Bounding box coordinates for the first object (x1, y1, x2, y2).
-            bbox_b (tuple): Bounding box coordinates for the second object (x1, y1, x2, y2).
-            direction (str): The predominant text direction, either 'horizontal' or 'vertical'.
-            threshold (float): Maximum distance between the centers of the bounding boxes to be considered on the same line.
-
-        Returns:
-            bool: True if the bounding boxes are on the same line, False otherwise.
-        """
-        # Calculate the center points of the bounding boxes
-        center_a = ((bbox_a[0] + bbox_a[2]) / 2, (bbox_a[1] + bbox_a[3]) / 2)
-        center_b = ((bbox_b[0] + bbox_b[2]) / 2, (bbox_b[1] + bbox_b[3]) / 2)
-
-        # For horizontal text, check if the centers are within the same horizontal band
-        if "hor" in direction:
-            return abs(center_a[1] - center_b[1]) <= threshold
-        # For vertical text, check if the centers are within the same vertical band
-        elif "ver" in direction:
-            return abs(center_a[0] - center_b[0]) <= threshold
-
-    # Group word bounding boxes into lines
+    # Boxes are on the same line when their centres are within `threshold`
+    # across the reading direction: y for horizontal text, x for vertical
+    if "hor" in direction:
+        axis = 1
+    elif "ver" in direction:
+        axis = 0
+    else:
+        axis = None
+
+    # Group word bounding boxes into lines. Each box joins the line of the
+    # closest (L1 distance of top-left corners) already placed box on the
+    # same line; ties go to the earliest line, then the earliest box in it.
+    # Placed boxes are kept sorted by centre, so the candidates come from a
+    # bisected range instead of a scan over every placed box.
     lines = []
-    remaining_boxes = coords_text_list[:]  # create a shallow copy
-
-    while remaining_boxes:
-        box = remaining_boxes.pop(0)
-        current_line = [box]
-        closest_line = None
-        closest_distance = float("inf")
-
-        # Find the closest existing line to the current bounding box
-        for line in lines:
-            for line_box in line:
-                if in_same_line(box[0], line_box[0], direction, threshold):
-                    distance = abs(box[0][0] - line_box[0][0]) + abs(
-                        box[0][1] - line_box[0][1]
-                    )
-                    if distance < closest_distance:
-                        closest_line = line
-                        closest_distance = distance
-
-        # If a close line was found, add the bounding box to that line
-        if closest_line is not None:
-            closest_line.append(box)
-        # Otherwise, create a new line with the current bounding box
+    centres = []  # sorted centres of the placed boxes
+    placed = []  # (line index, position in line, box), aligned with `centres`
+
+    for box in coords_text_list:
+        bbox = box[0]
+        if axis is None:
+            lines.append([box])
+            continue
+
+        centre = (bbox[axis] + bbox[axis + 2]) / 2
+        lo = bisect.bisect_left(centres, centre - threshold - 1)
+        hi = bisect.bisect_right(centres, centre + threshold + 1)
+
+        closest = None
+        for line_index, position, line_box in placed[lo:hi]:
+            line_bbox = line_box[0]
+            line_centre = (line_bbox[axis] + line_bbox[axis + 2]) / 2
+            if abs(centre - line_centre) > threshold:
+                continue
+            distance = abs(bbox[0] - line_bbox[0]) + abs(bbox[1] - line_bbox[1])
+            if closest is None or (distance, line_index, position) < closest:
+                closest = (distance, line_index, position)
+
+        # Add the box to the closest line, or start a new line with it
+        if closest is None:
+            line_index = len(lines)
+            lines.append([box])
         else:
-            lines.append(current_line)
+            line_index = closest[1]
+            lines[line_index].append(box)
+
+        index = bisect.bisect_right(centres, centre)
+        centres.insert(index, centre)
+        placed.insert(index, (line_index, len(lines[line_index]) - 1, box))
 
     # Sort the boxes in each line based on the reading direction
     for i, line in enumerate(lines):
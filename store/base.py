@@ -0,0 +1,101 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class JobStore(ABC):
+    """
+    Abstract base class for job state storage.
+
+    A job is identified by its image_id and holds the upload path, the
+    languages, the current status, the detected text blocks and the paths
+    of any produced results. Every backend must be safe to share between
+    the request handlers of one process.
+    """
+
+    @abstractmethod
+    def create(self, job_id: str, status: str = "uploaded", **fields) -> dict:
+        """
+        Create (or replace) a job.
+
+        Args:
+            job_id: Unique job identifier
+            status: Initial job status
+            **fields: Any extra job fields (path, languages, blocks...)
+
+        Returns:
+            The stored job as a dict
+        """
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[dict]:
+        """
+        Retrieve a job.
+
+        Args:
+            job_id: Unique job identifier
+
+        Returns:
+            The job as a dict, or None if it does not exist
+        """
+        pass
+
+    @abstractmethod
+    def update(self, job_id: str, **fields) -> bool:
+        """
+        Update some fields of an existing job.
+
+        Args:
+            job_id: Unique job identifier
+            **fields: Fields to set on the job
+
+        Returns:
+            True if the job exists and was updated
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, job_id: str) -> bool:
+        """
+        Delete a job.
+
+        Args:
+            job_id: Unique job identifier
+
+        Returns:
+            True if a job was deleted
+        """
+        pass
+
+    @abstractmethod
+    def list_jobs(
+        self, status: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> list[dict]:
+        """
+        List jobs, newest first, without their text blocks.
+
+        Args:
+            status: Only return jobs with this status
+            limit: Maximum number of jobs to return
+            offset: Number of jobs to skip
+
+        Returns:
+            List of jobs as dicts
+        """
+        pass
+
+    @abstractmethod
+    def purge(self, older_than: float) -> int:
+        """
+        Delete every job created before a timestamp.
+
+        Args:
+            older_than: Unix timestamp
+
+        Returns:
+            Number of deleted jobs
+        """
+        pass
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
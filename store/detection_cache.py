@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import struct
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+# Entry file layout: header followed by the bubble and text boxes as
+# little-endian int32 [x1, y1, x2, y2] rows.
+HEADER_FORMAT = "<4sHII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"CTDC"
+VERSION = 1
+
+
+class DetectionCache:
+    """
+    Content-addressed, size-bounded on-disk cache of raw detection boxes.
+
+    Entries are keyed by a hash of the decoded pixels and of the detector
+    configuration, so a re-uploaded page or a retried job skips detection
+    entirely, while changing the model, threshold or slicer parameters
+    naturally misses. Eviction is least recently used, by file mtime, which
+    is refreshed on every hit so the order survives restarts.
+    """
+
+    def __init__(self, path: str = "results/cache/detection", max_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._load_index()
+
+    @staticmethod
+    def make_key(image: np.ndarray, signature: dict) -> str:
+        """
+        Cache key of an image for a given detector configuration.
+
+        Args:
+            image: Image as numpy array
+            signature: JSON-serializable description of the detector config
+
+        Returns:
+            Hex digest identifying the (image, config) pair
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{image.dtype.str}{image.shape}".encode("utf-8"))
+        digest.update(memoryview(np.ascontiguousarray(image)).cast("B"))
+        digest.update(json.dumps(signature, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """
+        Look up the boxes stored for a key.
+
+        Returns:
+            Tuple of (bubble_boxes, text_boxes), or None on a miss
+        """
+        file_path = self._file_path(key)
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            boxes = self._decode(data)
+        except (OSError, ValueError, struct.error):
+            boxes = None
+
+        with self._lock:
+            if boxes is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+        try:
+            os.utime(file_path)
+        except OSError:
+            pass
+        return boxes
+
+    def put(self, key: str, bubble_boxes: np.ndarray, text_boxes: np.ndarray) -> None:
+        """Store the boxes of a key, evicting old entries to stay within budget."""
+        data = self._encode(bubble_boxes, text_boxes)
+        if len(data) > self.max_bytes:
+            return
+
+        file_path = self._file_path(key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial file
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+
+        evicted = []
+        with self._lock:
+            self.current_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self.current_bytes += len(data)
+            self.writes += 1
+
+            while self.current_bytes > self.max_bytes:
+                old_key, size = self._entries.popitem(last=False)
+                self.current_bytes -= size
+                self.evictions += 1
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            try:
+                os.remove(self._file_path(old_key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self.current_bytes = 0
+        for key in keys:
+            try:
+                os.remove(self._file_path(key))
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        """Return cache occupancy and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], f"{key}.bin")
+
+    def _load_index(self) -> None:
+        # Rebuild the LRU order from the files left by previous runs
+        if not os.path.isdir(self.path):
+            return
+        found = []
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                if not name.endswith(".bin"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self.current_bytes += size
+
+    @staticmethod
+    def _encode(bubble_boxes: np.ndarray, text_boxes: np.ndarray) -> bytes:
+        bubbles = np.asarray(bubble_boxes).reshape(-1, 4).astype("<i4")
+        texts = np.asarray(text_boxes).reshape(-1, 4).astype("<i4")
+        header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(bubbles), len(texts))
+        return header + bubbles.tobytes() + texts.tobytes()
+
+    @staticmethod
+    def _decode(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+        magic, version, n_bubbles, n_texts = struct.unpack_from(HEADER_FORMAT, data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a detection cache entry")
+        if len(data) != HEADER_SIZE + (n_bubbles + n_texts) * 16:
+            raise ValueError("Truncated detection cache entry")
+
+        boxes = np.frombuffer(data, dtype="<i4", offset=HEADER_SIZE).astype(int).reshape(-1, 4)
+        # Empty results are stored as the 1-D empty arrays the engines return
+        bubbles = boxes[:n_bubbles] if n_bubbles else np.array([])
+        texts = boxes[n_bubbles:] if n_texts else np.array([])
+        return bubbles, texts
@@ -0,0 +1,42 @@
+from .base import JobStore
+from .memory import InMemoryJobStore
+from .sqlite import SQLiteJobStore
+
+
+class JobStoreFactory:
+    """Factory for creating the job store backend based on config."""
+
+    @classmethod
+    def create_store(cls, config: dict) -> JobStore:
+        """
+        Create the job store selected in the storage config.
+
+        Args:
+            config: storage config, the `job_store` section selects the backend
+
+        Returns:
+            Appropriate job store instance
+        """
+        store_config = config.get("job_store") or {}
+
+        # Map backend names to factory methods
+        store_factories = {
+            "sqlite": cls._create_sqlite_store,
+            "memory": cls._create_memory_store,
+        }
+
+        # Get the appropriate factory method, defaulting to SQLite
+        backend = store_config.get("backend", "sqlite")
+        factory_method = store_factories.get(backend, cls._create_sqlite_store)
+        return factory_method(store_config)
+
+    @staticmethod
+    def _create_sqlite_store(store_config: dict) -> JobStore:
+        return SQLiteJobStore(
+            path=store_config.get("path", "results/jobs.db"),
+            ttl_seconds=store_config.get("ttl_seconds", 0),
+        )
+
+    @staticmethod
+    def _create_memory_store(store_config: dict) -> JobStore:
+        return InMemoryJobStore(ttl_seconds=store_config.get("ttl_seconds", 0))
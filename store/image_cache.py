@@ -0,0 +1,234 @@
+import hashlib
+import struct
+import threading
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+import cv2
+import numpy as np
+
+# Shared memory segment layout: header followed by the raw uint8 pixels.
+# The magic is written last so a reader never sees a half-written image.
+HEADER_FORMAT = "<4sIII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"CTIC"
+
+
+def _open_shared_memory(
+    name: str, create: bool = False, size: int = 0
+) -> shared_memory.SharedMemory:
+    """
+    Open a shared memory segment without registering it with the resource
+    tracker, which would otherwise unlink it when *this* process exits even
+    though other workers are still using it.
+    """
+    try:
+        return shared_memory.SharedMemory(
+            name=name, create=create, size=size, track=False
+        )
+    except TypeError:
+        # Python < 3.13 has no `track` argument
+        shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class DecodedImageCache:
+    """
+    Byte-budgeted LRU cache of decoded RGB images keyed by image_id.
+
+    The step-by-step endpoints all work on the same upload, so the decoded
+    array is kept around instead of running `cv2.imread` + `cv2.cvtColor`
+    again for every step. Cached arrays are read-only.
+
+    With `shared_memory` enabled the pixels are also published in a named
+    POSIX shared memory segment so another worker process serving the next
+    step can attach to it instead of decoding the file again. The byte budget
+    is accounted per process.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, shared_memory: bool = False):
+        self.max_bytes = max_bytes
+        self.shared_memory = shared_memory
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_hits = 0
+        self._created: set[str] = set()  # segments published by this process
+
+    def get(self, image_id: str, path: str) -> np.ndarray:
+        """
+        Return the decoded RGB image for an image_id, decoding it on a miss.
+
+        Args:
+            image_id: Unique image identifier
+            path: Path of the image file, used on a cache miss
+
+        Returns:
+            Read-only RGB image as numpy array
+        """
+        with self._lock:
+            entry = self._entries.get(image_id)
+            if entry is not None:
+                self._entries.move_to_end(image_id)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        image, shm = None, None
+        if self.shared_memory:
+            image, shm = self._attach_shared(image_id)
+            if image is not None:
+                self.shared_hits += 1
+
+        if image is None:
+            image = cv2.imread(path)
+            if image is None:
+                raise FileNotFoundError(f"Could not read image: {path}")
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            if self.shared_memory:
+                image, shm = self._publish_shared(image_id, image)
+
+        image.setflags(write=False)
+        self._insert(image_id, image, shm)
+        return image
+
+    def invalidate(self, image_id: str) -> None:
+        """Drop an image from the cache (and from shared memory, if this worker published it)."""
+        with self._lock:
+            entry = self._entries.pop(image_id, None)
+            if entry is not None:
+                self.current_bytes -= entry[0].nbytes
+        if entry is not None:
+            self._release(entry[1], unlink=True)
+
+    def clear(self) -> None:
+        """Drop every cached image."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self.current_bytes = 0
+        for _, shm in entries:
+            self._release(shm, unlink=True)
+
+    def close(self) -> None:
+        """
+        Drop every cached image and unlink the shared memory segments this
+        process published, so they do not outlive the worker in /dev/shm.
+        Segments attached from other workers are left to their owner.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self.current_bytes = 0
+            created = list(self._created)
+        for _, shm in entries:
+            self._release(shm, unlink=False)
+        for name in created:
+            try:
+                shm = _open_shared_memory(name)
+            except (FileNotFoundError, OSError):
+                # Already unlinked by another worker
+                continue
+            self._release(shm, unlink=True)
+
+    def stats(self) -> dict:
+        """Return cache occupancy and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared_hits": self.shared_hits,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _insert(self, image_id: str, image: np.ndarray, shm) -> None:
+        # Images larger than the whole budget are returned but never cached
+        if image.nbytes > self.max_bytes:
+            self._release(shm, unlink=False)
+            return
+
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(image_id, None)
+            if previous is not None:
+                self.current_bytes -= previous[0].nbytes
+                evicted.append(previous[1])
+
+            self._entries[image_id] = (image, shm)
+            self.current_bytes += image.nbytes
+
+            # Evict least recently used images until we fit the budget again
+            while self.current_bytes > self.max_bytes:
+                _, (old_image, old_shm) = self._entries.popitem(last=False)
+                self.current_bytes -= old_image.nbytes
+                self.evictions += 1
+                evicted.append(old_shm)
+
+        for old_shm in evicted:
+            self._release(old_shm, unlink=True)
+
+    @staticmethod
+    def _segment_name(image_id: str) -> str:
+        # Segment names are limited to ~30 characters on some platforms
+        return "ct_" + hashlib.sha1(image_id.encode("utf-8")).hexdigest()[:24]
+
+    def _attach_shared(self, image_id: str):
+        try:
+            shm = _open_shared_memory(self._segment_name(image_id))
+        except (FileNotFoundError, OSError):
+            return None, None
+
+        magic, h, w, c = struct.unpack_from(HEADER_FORMAT, shm.buf, 0)
+        if magic != MAGIC or shm.size < HEADER_SIZE + h * w * c:
+            # Still being written by another process (or garbage)
+            shm.close()
+            return None, None
+
+        image = np.ndarray((h, w, c), dtype=np.uint8, buffer=shm.buf, offset=HEADER_SIZE)
+        return image, shm
+
+    def _publish_shared(self, image_id: str, image: np.ndarray):
+        h, w, c = image.shape
+        try:
+            shm = _open_shared_memory(
+                self._segment_name(image_id), create=True, size=HEADER_SIZE + image.nbytes
+            )
+        except (FileExistsError, OSError):
+            # Another worker is publishing the same image, keep a private copy
+            return image, None
+
+        with self._lock:
+            self._created.add(shm.name)
+        shared = np.ndarray(image.shape, dtype=np.uint8, buffer=shm.buf, offset=HEADER_SIZE)
+        shared[:] = image
+        struct.pack_into(HEADER_FORMAT, shm.buf, 0, MAGIC, h, w, c)
+        return shared, shm
+
+    def _release(self, shm, unlink: bool) -> None:
+        if shm is None:
+            return
+        if unlink:
+            # Segments attached from another worker stay published: only
+            # their owner unlinks them
+            with self._lock:
+                unlink = shm.name in self._created
+                self._created.discard(shm.name)
+        try:
+            shm.close()
+        except BufferError:
+            # A caller still holds a view on the pixels, the mapping goes
+            # away when that view is garbage collected
+            pass
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Optional
+
+from .base import JobStore
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Job store backed by a process-local dict.
+
+    State is lost on restart and is not shared between worker processes,
+    use SQLiteJobStore for that. Expired jobs are dropped when `ttl_seconds`
+    is set so the dict does not grow without bound.
+    """
+
+    def __init__(self, ttl_seconds: float = 0, purge_interval: float = 60):
+        self._jobs: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval = purge_interval
+        self._last_purge = time.time()
+
+    def create(self, job_id: str, status: str = "uploaded", **fields) -> dict:
+        now = time.time()
+        job = dict(fields, job_id=job_id, status=status, created_at=now, updated_at=now)
+        with self._lock:
+            self._jobs[job_id] = job
+        self._maybe_purge(now)
+        return dict(job)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def update(self, job_id: str, **fields) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            job.update(fields)
+            job["updated_at"] = time.time()
+            return True
+
+    def delete(self, job_id: str) -> bool:
+        with self._lock:
+            return self._jobs.pop(job_id, None) is not None
+
+    def list_jobs(
+        self, status: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> list[dict]:
+        with self._lock:
+            jobs = [
+                {k: v for k, v in job.items() if k != "blocks"}
+                for job in self._jobs.values()
+                if status is None or job["status"] == status
+            ]
+        jobs.sort(key=lambda job: job["created_at"], reverse=True)
+        return jobs[offset : offset + limit]
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job["created_at"] < older_than
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+    def _maybe_purge(self, now: float) -> None:
+        if not self.ttl_seconds or now - self._last_purge < self.purge_interval:
+            return
+        self._last_purge = now
+        self.purge(now - self.ttl_seconds)
@@ -0,0 +1,218 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ocr_accessed_at ON ocr (accessed_at);
+"""
+
+# Per-row bookkeeping added to the text size when accounting the budget
+ROW_OVERHEAD = 64
+
+# Keys per SELECT ... IN, below SQLite's bound parameter limit
+LOOKUP_CHUNK = 500
+
+# Hit times remembered before the ones older than the touch interval are dropped
+MAX_TOUCHED = 4096
+
+
+class OCRCache:
+    """
+    Size-bounded, persistent cache of recognized text keyed by crop content.
+
+    Keys hash the pixels of a text block crop together with the engine and
+    source language, so retried jobs, re-uploaded pages and recurring sound
+    effects or panels skip recognition (and paid API calls) entirely. Rows
+    live in an SQLite database in WAL mode, shared by every worker process;
+    eviction is least recently used, by an `accessed_at` column refreshed on
+    hits. Hits only write it once per key every `touch_interval` seconds, in
+    one transaction per lookup, so reads stay reads.
+    """
+
+    def __init__(self, path: str = "results/cache/ocr.db",
+                 max_bytes: int = 16 * 1024 * 1024, timeout: float = 30,
+                 touch_interval: float = 60):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.touch_interval = touch_interval
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._touched: dict[str, float] = {}  # key -> last accessed_at written by this process
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        self.current_bytes = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM ocr"
+        ).fetchone()[0]
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def make_key(crop: np.ndarray, namespace: str) -> str:
+        """
+        Cache key of a crop for a given engine.
+
+        Args:
+            crop: Pixels the engine recognizes text from
+            namespace: Engine name, model and source language
+
+        Returns:
+            Hex digest identifying the (crop, engine) pair
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{namespace}|{crop.dtype.str}{crop.shape}".encode("utf-8"))
+        digest.update(memoryview(np.ascontiguousarray(crop)).cast("B"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up the text stored for a key.
+
+        Returns:
+            Recognized text, or None on a miss
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """
+        Look up the text stored for several keys at once.
+
+        Returns:
+            Recognized text of every key found; missing keys are absent
+        """
+        conn = self._connection()
+        unique = list(dict.fromkeys(keys))
+        found = {}
+        for start in range(0, len(unique), LOOKUP_CHUNK):
+            chunk = unique[start:start + LOOKUP_CHUNK]
+            found.update(conn.execute(
+                f"SELECT key, text FROM ocr WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall())
+        hits = sum(key in found for key in keys)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+        self._touch(list(found))
+        return found
+
+    def put(self, key: str, text: str) -> None:
+        """Store the text of a key, evicting old entries to stay within budget."""
+        size = len(text.encode("utf-8")) + len(key) + ROW_OVERHEAD
+        if size > self.max_bytes:
+            return
+
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            previous = conn.execute(
+                "SELECT size FROM ocr WHERE key = ?", (key,)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO ocr (key, text, size, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time()),
+            )
+        with self._lock:
+            self._touched[key] = time.time()
+            self.current_bytes += size - (previous[0] if previous else 0)
+            self.writes += 1
+            over_budget = self.current_bytes > self.max_bytes
+        if over_budget:
+            self._evict()
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        self._connection().execute("DELETE FROM ocr")
+        with self._lock:
+            self._touched.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """Return cache occupancy and hit/miss counters."""
+        entries = self._connection().execute("SELECT COUNT(*) FROM ocr").fetchone()[0]
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _touch(self, keys: list[str]) -> None:
+        # Refresh the LRU position of hits not refreshed within the interval
+        now = time.time()
+        with self._lock:
+            stale = [key for key in keys if now - self._touched.get(key, 0) >= self.touch_interval]
+            for key in stale:
+                self._touched[key] = now
+            if len(self._touched) > MAX_TOUCHED:
+                # Forget keys whose next hit has to be written anyway
+                self._touched = {
+                    key: at for key, at in self._touched.items() if now - at < self.touch_interval
+                }
+        if not stale:
+            return
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "UPDATE ocr SET accessed_at = ? WHERE key = ?", [(now, key) for key in stale]
+            )
+
+    def _evict(self) -> None:
+        # Drop the least recently used rows down to 90% of the budget, so a
+        # full cache does not evict on every single write
+        target = int(self.max_bytes * 0.9)
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Other processes write to the same file, recount under the lock
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr").fetchone()[0]
+            evicted = 0
+            for key, size in conn.execute(
+                "SELECT key, size FROM ocr ORDER BY accessed_at"
+            ).fetchall():
+                if total <= target:
+                    break
+                conn.execute("DELETE FROM ocr WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+        with self._lock:
+            self.current_bytes = total
+            self.evictions += evicted
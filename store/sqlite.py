@@ -0,0 +1,186 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from modules.utils.serialization import pack, unpack
+from .base import JobStore
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    data BLOB NOT NULL,
+    blocks BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs (created_at);
+"""
+
+# Columns stored outside of the msgpack `data` blob
+COLUMN_FIELDS = ("job_id", "status", "created_at", "updated_at", "blocks")
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Job store backed by an embedded SQLite database.
+
+    The database runs in WAL mode so several uvicorn worker processes can
+    share one file. `status` and `created_at` are indexed columns, the text
+    blocks and every other field are stored as msgpack blobs.
+    """
+
+    def __init__(
+        self,
+        path: str = "results/jobs.db",
+        ttl_seconds: float = 0,
+        purge_interval: float = 60,
+        timeout: float = 30,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval = purge_interval
+        self.timeout = timeout
+        self._local = threading.local()
+        self._last_purge = time.time()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection of the calling thread, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _split_fields(fields: dict) -> tuple[dict, Optional[bytes], bool]:
+        """Separate the blocks from the other fields of a job."""
+        data = {k: v for k, v in fields.items() if k not in COLUMN_FIELDS}
+        has_blocks = "blocks" in fields
+        blocks = pack(fields["blocks"]) if has_blocks else None
+        return data, blocks, has_blocks
+
+    @staticmethod
+    def _row_to_job(row: tuple, with_blocks: bool = True) -> dict:
+        job_id, status, created_at, updated_at, data, blocks = row
+        job = unpack(data)
+        job.update(
+            job_id=job_id, status=status, created_at=created_at, updated_at=updated_at
+        )
+        if with_blocks and blocks is not None:
+            job["blocks"] = unpack(blocks)
+        return job
+
+    def create(self, job_id: str, status: str = "uploaded", **fields) -> dict:
+        now = time.time()
+        data, blocks, _ = self._split_fields(fields)
+        self._connection().execute(
+            "INSERT OR REPLACE INTO jobs "
+            "(job_id, status, created_at, updated_at, data, blocks) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, status, now, now, pack(data), blocks),
+        )
+        self._maybe_purge(now)
+        return dict(fields, job_id=job_id, status=status, created_at=now, updated_at=now)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT job_id, status, created_at, updated_at, data, blocks "
+                "FROM jobs WHERE job_id = ?",
+                (job_id,),
+            )
+            .fetchone()
+        )
+        return self._row_to_job(row) if row is not None else None
+
+    def __contains__(self, job_id: str) -> bool:
+        row = (
+            self._connection()
+            .execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,))
+            .fetchone()
+        )
+        return row is not None
+
+    def update(self, job_id: str, **fields) -> bool:
+        conn = self._connection()
+        new_data, blocks, has_blocks = self._split_fields(fields)
+
+        # BEGIN IMMEDIATE takes the write lock up front so the read-modify-write
+        # of the data blob cannot interleave with another worker process
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT status, data FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return False
+
+            status, data = row
+            data = unpack(data)
+            data.update(new_data)
+            status = fields.get("status", status)
+
+            if has_blocks:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, updated_at = ?, data = ?, blocks = ? "
+                    "WHERE job_id = ?",
+                    (status, time.time(), pack(data), blocks, job_id),
+                )
+            else:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, updated_at = ?, data = ? "
+                    "WHERE job_id = ?",
+                    (status, time.time(), pack(data), job_id),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return True
+
+    def delete(self, job_id: str) -> bool:
+        cursor = self._connection().execute(
+            "DELETE FROM jobs WHERE job_id = ?", (job_id,)
+        )
+        return cursor.rowcount > 0
+
+    def list_jobs(
+        self, status: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> list[dict]:
+        query = "SELECT job_id, status, created_at, updated_at, data, NULL FROM jobs"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        rows = self._connection().execute(query, params + (limit, offset)).fetchall()
+        return [self._row_to_job(row, with_blocks=False) for row in rows]
+
+    def purge(self, older_than: float) -> int:
+        cursor = self._connection().execute(
+            "DELETE FROM jobs WHERE created_at < ?", (older_than,)
+        )
+        return cursor.rowcount
+
+    def _maybe_purge(self, now: float) -> None:
+        if not self.ttl_seconds or now - self._last_purge < self.purge_interval:
+            return
+        self._last_purge = now
+        self.purge(now - self.ttl_seconds)
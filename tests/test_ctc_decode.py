@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from modules.ocr.pororo.pororo.models.brainOCR.ctc import ctc_beam_decode, ctc_greedy_decode
+from modules.ocr.pororo.pororo.models.brainOCR.utils import CTCLabelConverter, ctcBeamSearch
+
+VOCAB = ["[blank]"] + [chr(0xAC00 + i) for i in range(11)]
+
+
+def recognizer_probs(rng, batch, steps, classes, sharpness):
+    """Softmax outputs with frequent blanks and repeated characters."""
+    logits = rng.normal(size=(batch, steps, classes)).astype(np.float32) * sharpness
+    peaks = rng.integers(0, min(classes, 6), size=(batch, steps))
+    logits[np.arange(batch)[:, None], np.arange(steps)[None], peaks] += 3 * sharpness
+    exp = np.exp(logits - logits.max(axis=2, keepdims=True))
+    return (exp / exp.sum(axis=2, keepdims=True)).astype(np.float32)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_beam_decode_matches_reference(seed):
+    rng = np.random.default_rng(seed)
+    classes = int(rng.integers(2, len(VOCAB) + 1))
+    steps = int(rng.integers(0, 25))
+    beam_width = int(rng.integers(1, 7))
+    mat = recognizer_probs(rng, int(rng.integers(1, 5)), steps, classes, float(rng.uniform(0.2, 2)))
+
+    expected = [ctcBeamSearch(m, VOCAB[:classes], 0, None, beam_width=beam_width) for m in mat]
+    assert ctc_beam_decode(mat, VOCAB[:classes], beam_width) == expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_beam_decode_matches_reference_with_ties(seed):
+    rng = np.random.default_rng(seed)
+    classes = int(rng.integers(2, 6))
+    weights = rng.integers(1, 4, size=(3, int(rng.integers(1, 15)), classes)).astype(np.float32)
+    mat = (weights / weights.sum(axis=2, keepdims=True)).astype(np.float32)
+    beam_width = int(rng.integers(1, 5))
+
+    expected = [ctcBeamSearch(m, VOCAB[:classes], 0, None, beam_width=beam_width) for m in mat]
+    assert ctc_beam_decode(mat, VOCAB[:classes], beam_width) == expected
+
+
+def test_converter_uses_batched_beam_search_without_lm():
+    mat = recognizer_probs(np.random.default_rng(0), 4, 20, len(VOCAB), 1.0)
+    converter = CTCLabelConverter(VOCAB)
+    expected = [ctcBeamSearch(m, VOCAB, 0, None, beam_width=5) for m in mat]
+    assert converter.decode_beamsearch(mat, None, 0.01, 5) == expected
+    assert ctc_beam_decode(mat[:0], VOCAB) == []
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_greedy_decode_matches_reference(seed):
+    rng = np.random.default_rng(seed)
+    probs = torch.from_numpy(recognizer_probs(rng, 8, 30, len(VOCAB), 1.5))
+    converter = CTCLabelConverter(VOCAB)
+
+    _, indices = probs.max(2)
+    lengths = torch.IntTensor([probs.size(1)] * probs.size(0))
+    expected_texts = converter.decode_greedy(indices.view(-1), lengths)
+    expected_confidences = [p.max(dim=1)[0].cumprod(dim=0)[-1].item() for p in probs]
+
+    texts, confidences = ctc_greedy_decode(probs, VOCAB)
+    assert texts == expected_texts
+    assert np.allclose(confidences, expected_confidences)
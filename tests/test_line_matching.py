@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from benchmarks.ocr_line_matching import sort_textblock_rectangles_naive, synthetic_page
+from modules.detection.utils.geometry import (
+    grid_containment,
+    pairwise_fits,
+    pairwise_mostly_contained,
+)
+from modules.utils.textblock import sort_textblock_rectangles
+
+
+def random_boxes(rng, count, extent, max_size):
+    x1 = rng.integers(0, extent, count)
+    y1 = rng.integers(0, extent, count)
+    w = rng.integers(0, max_size, count)
+    h = rng.integers(0, max_size, count)
+    return np.stack([x1, y1, x1 + w, y1 + h], axis=1)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_grid_containment_matches_dense_on_pages(seed):
+    bubbles, words = synthetic_page(60, 8, seed=seed)
+    dense = pairwise_fits(bubbles, words) | pairwise_mostly_contained(bubbles, words, 0.5)
+    assert np.array_equal(grid_containment(bubbles, words, 0.5), dense)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_grid_containment_matches_dense_on_random_boxes(seed):
+    rng = np.random.default_rng(seed)
+    outer = random_boxes(rng, int(rng.integers(0, 40)), 500, 200)
+    inner = random_boxes(rng, int(rng.integers(0, 80)), 500, 60)
+    threshold = float(rng.uniform(0.1, 0.9))
+    dense = pairwise_fits(outer, inner) | pairwise_mostly_contained(outer, inner, threshold)
+    cell_size = float(rng.uniform(5, 300))
+    assert np.array_equal(grid_containment(outer, inner, threshold, cell_size), dense)
+
+
+@pytest.mark.parametrize("direction", ["hor_ltr", "hor_rtl", "ver_ltr", "ver_rtl"])
+@pytest.mark.parametrize("seed", range(5))
+def test_sort_textblock_rectangles_matches_naive(direction, seed):
+    rng = np.random.default_rng(seed)
+    boxes = random_boxes(rng, int(rng.integers(0, 60)), 300, 40)
+    entries = [(tuple(int(v) for v in box), f"w{i}") for i, box in enumerate(boxes)]
+    assert sort_textblock_rectangles(entries, direction) == sort_textblock_rectangles_naive(entries, direction)